@@ -4,6 +4,7 @@ Configuration management utilities for Netradyne data processing.
 
 import os
 from dotenv import load_dotenv
+from functools import cached_property
 from typing import Optional
 
 
@@ -31,7 +32,7 @@ class ConfigManager:
                     load_dotenv(path)
                     break
     
-    @property
+    @cached_property
     def database_config(self) -> dict:
         """Get database configuration."""
         return {
@@ -41,7 +42,7 @@ class ConfigManager:
             'database': 'VTOMNITRACS'
         }
     
-    @property
+    @cached_property
     def netradyne_api_config(self) -> dict:
         """Get Netradyne API configuration."""
         return {
@@ -51,17 +52,23 @@ class ConfigManager:
             'score_url_template': 'https://api.netradyne.com/driveri/v1/tenants/VERIHA/fleetscore'
         }
     
-    @property
+    @cached_property
     def netradyne_web_config(self) -> dict:
         """Get Netradyne web scraping configuration."""
         return {
             'username': os.getenv('netrad_user'),
             'password': os.getenv('netrad_pass'),
             'login_url': 'https://idms.netradyne.com/console/#/login?redirectUrl=%2F',
-            'download_dir': r'C:\Users\apalacio\Downloads'
+            'download_dir': r'C:\Users\apalacio\Downloads',
+            # HTTP endpoint behind the console's export button (captured via
+            # devtools); when unset the scraper falls back to driving the
+            # export through the browser
+            'export_url': os.getenv('netrad_export_url'),
+            # Force the browser-driven export even when export_url is set
+            'use_browser_export': os.getenv('netrad_browser_export', '').lower() in ('1', 'true', 'yes')
         }
     
-    @property
+    @cached_property
     def database_tables(self) -> dict:
         """Get database table configuration."""
         return {
@@ -70,7 +77,7 @@ class ConfigManager:
             'script_id': 11
         }
     
-    @property
+    @cached_property
     def file_paths(self) -> dict:
         """Get file path configuration."""
         return {
@@ -4,13 +4,140 @@ Database utilities for Netradyne data processing.
 
 import pyodbc
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 from config_utils import ConfigManager
 
+# Reuse pooled ODBC connections so repeated DatabaseManager constructions
+# skip the TCP/TLS/login handshake
+pyodbc.pooling = True
+
+
+def _select_odbc_driver() -> str:
+    """
+    Pick the best installed SQL Server ODBC driver.
+
+    Prefers the modern Microsoft drivers (faster marshalling, TDS 7.4,
+    required for fast_executemany to perform well) and falls back to the
+    legacy driver if nothing newer is installed.
+
+    Returns:
+        ODBC driver name.
+    """
+    preferred = [
+        'ODBC Driver 18 for SQL Server',
+        'ODBC Driver 17 for SQL Server',
+    ]
+    try:
+        installed = set(pyodbc.drivers())
+    except Exception:
+        installed = set()
+    for driver in preferred:
+        if driver in installed:
+            return driver
+    return 'SQL Server'
+
 
 class DatabaseManager:
     """Manages database connections and operations."""
-    
+
+    # Parameter type hints for fast_executemany inserts. Explicit sizes for
+    # string columns stop pyodbc from re-scanning each column's max width on
+    # every batch; None entries let pyodbc infer (dates, numerics).
+    HOS_VIOLATION_INPUT_SIZES = [
+        (pyodbc.SQL_WVARCHAR, 255, 0),  # ID
+        (pyodbc.SQL_WVARCHAR, 255, 0),  # Start_Time_and_Driver
+        (pyodbc.SQL_WVARCHAR, 50, 0),   # Driver_ID
+        (pyodbc.SQL_WVARCHAR, 255, 0),  # Driver_Name
+        None,                           # Violation_Start_Time
+        None,                           # Violation_End_Time
+        (pyodbc.SQL_WVARCHAR, 50, 0),   # Driver_Status
+        (pyodbc.SQL_WVARCHAR, 100, 0),  # Terminal
+        (pyodbc.SQL_WVARCHAR, 100, 0),  # Ruleset
+        (pyodbc.SQL_WVARCHAR, 100, 0),  # Violation_Type
+        (pyodbc.SQL_WVARCHAR, 50, 0),   # Violation_Duration
+    ]
+
+    MAINTENANCE_RECORD_INPUT_SIZES = [
+        (pyodbc.SQL_WVARCHAR, 50, 0),   # Vehicle_ID
+        (pyodbc.SQL_WVARCHAR, 50, 0),   # Vehicle_Number
+        (pyodbc.SQL_WVARCHAR, 100, 0),  # Maintenance_Type
+        (pyodbc.SQL_WVARCHAR, 50, 0),   # Due_Date
+        (pyodbc.SQL_WVARCHAR, 50, 0),   # Last_Service
+        None,                           # Mileage
+        None,                           # Service_Miles
+        (pyodbc.SQL_WVARCHAR, 50, 0),   # Status
+        (pyodbc.SQL_WVARCHAR, 50, 0),   # Priority
+        (pyodbc.SQL_WVARCHAR, 100, 0),  # Location
+        None,                           # Process_Date
+    ]
+
+    # Loads above this size try the native bcp utility (via bcpandas) before
+    # falling back to fast_executemany staging
+    BCP_LOAD_THRESHOLD = 50_000
+
+    # Worker connections for parallel batch inserts; pyodbc releases the GIL
+    # around ODBC calls so a small thread pool scales near-linearly
+    PARALLEL_INSERT_WORKERS = 4
+
+    # Field order and defaults for maintenance record tuples, matching the
+    # insert column order (Process_Date is appended separately)
+    MAINTENANCE_RECORD_FIELDS = (
+        ('vehicle_id', ''),
+        ('vehicle_number', ''),
+        ('maintenance_type', ''),
+        ('due_date', ''),
+        ('last_service', ''),
+        ('mileage', 0),
+        ('service_miles', 0),
+        ('status', ''),
+        ('priority', ''),
+        ('location', ''),
+    )
+
+    # Insert/DDL SQL for the batch insert paths. Kept at class level so the
+    # identical statement text is reused across calls, letting pyodbc reuse
+    # the prepared statement instead of re-preparing per invocation.
+    # Duplicate handling lives in unique IGNORE_DUP_KEY indexes on the target
+    # tables, so the inserts need no client- or server-side dedup step.
+    HOS_INSERT_SQL = """
+    INSERT INTO VTUtility.dbo.HOS_Violations
+    (ID, Start_Time_and_Driver, Driver_ID, Driver_Name,
+     Violation_Start_Time, Violation_End_Time, Driver_Status,
+     Terminal, Ruleset, Violation_Type, Violation_Duration)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    HOS_DEDUP_INDEX_DDL = """
+    IF NOT EXISTS (
+        SELECT 1 FROM sys.indexes
+        WHERE name = 'UX_HOS_Violations_ID'
+          AND object_id = OBJECT_ID('VTUtility.dbo.HOS_Violations')
+    )
+    CREATE UNIQUE INDEX UX_HOS_Violations_ID
+    ON VTUtility.dbo.HOS_Violations (ID)
+    WITH (IGNORE_DUP_KEY = ON)
+    """
+
+    MAINTENANCE_INSERT_SQL = """
+    INSERT INTO VTUtility.dbo.Maintenance_Records
+    (Vehicle_ID, Vehicle_Number, Maintenance_Type, Due_Date,
+     Last_Service, Mileage, Service_Miles, Status,
+     Priority, Location, Process_Date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    MAINTENANCE_DEDUP_INDEX_DDL = """
+    IF NOT EXISTS (
+        SELECT 1 FROM sys.indexes
+        WHERE name = 'UX_Maintenance_Records_Key'
+          AND object_id = OBJECT_ID('VTUtility.dbo.Maintenance_Records')
+    )
+    CREATE UNIQUE INDEX UX_Maintenance_Records_Key
+    ON VTUtility.dbo.Maintenance_Records (Vehicle_ID, Maintenance_Type, Due_Date)
+    WITH (IGNORE_DUP_KEY = ON)
+    """
+
     def __init__(self, config_manager: ConfigManager):
         """
         Initialize database manager.
@@ -22,7 +149,30 @@ class DatabaseManager:
         self.db_config = config_manager.database_config
         self.table_config = config_manager.database_tables
         self.connection: Optional[pyodbc.Connection] = None
+        self._tables_ready: set = set()
+        self._read_connection = None
+        self._read_connection_failed = False
         
+    def _connection_string(self) -> str:
+        """
+        Build the pyodbc connection string from the configured credentials.
+
+        Returns:
+            ODBC connection string.
+        """
+        driver = _select_odbc_driver()
+        # ODBC 18 encrypts by default and only it understands 'optional';
+        # older drivers keep the previous Encrypt=no behavior
+        encrypt = 'Encrypt=optional;TrustServerCertificate=yes;' if '18' in driver else 'Encrypt=no;'
+        return (
+            f'Driver={{{driver}}};'
+            f'Server={self.db_config["server"]};'
+            f'Database={self.db_config["database"]};'
+            f'UID={self.db_config["user"]};'
+            f'PWD={self.db_config["password"]};'
+            f'{encrypt}'
+        )
+
     def create_connection(self) -> Optional[pyodbc.Connection]:
         """
         Creates and returns a pyodbc database connection.
@@ -31,15 +181,10 @@ class DatabaseManager:
             Database connection or None if failed.
         """
         try:
-            conn_str = (
-                f'Driver={{SQL Server}};'
-                f'Server={self.db_config["server"]};'
-                f'Database={self.db_config["database"]};'
-                f'UID={self.db_config["user"]};'
-                f'PWD={self.db_config["password"]};'
-                'Encrypt=no;'
-            )
-            self.connection = pyodbc.connect(conn_str)
+            self.connection = pyodbc.connect(self._connection_string())
+            # Explicit transactions: the insert paths batch many executemany
+            # calls and commit once at the end, avoiding a log flush per batch
+            self.connection.autocommit = False
             logging.info("Successfully connected to the database.")
             return self.connection
         except pyodbc.Error as ex:
@@ -49,19 +194,148 @@ class DatabaseManager:
     
     def close_connection(self) -> None:
         """Close the database connection."""
+        if self._read_connection:
+            try:
+                self._read_connection.close()
+            except Exception:
+                pass
+            self._read_connection = None
         if self.connection:
             self.connection.close()
             self.connection = None
             logging.info("Database connection closed.")
+
+    def _get_read_connection(self):
+        """
+        Lazily create a turbodbc connection for read-heavy queries.
+
+        turbodbc fetches through ODBC block cursors into columnar buffers,
+        which is several times faster than pyodbc's row-by-row decoding on
+        large result sets. It is an optional dependency: if it is not
+        installed (or the connection fails) the read paths fall back to the
+        regular pyodbc connection.
+
+        Returns:
+            Open turbodbc connection, or None if turbodbc is unavailable.
+        """
+        if self._read_connection is not None:
+            return self._read_connection
+        if self._read_connection_failed:
+            return None
+        try:
+            import turbodbc
+        except ImportError:
+            self._read_connection_failed = True
+            logging.debug("turbodbc not installed; read queries use pyodbc")
+            return None
+        try:
+            options = turbodbc.make_options(use_async_io=True)
+            self._read_connection = turbodbc.connect(
+                driver=_select_odbc_driver(),
+                server=self.db_config['server'],
+                database=self.db_config['database'],
+                uid=self.db_config['user'],
+                pwd=self.db_config['password'],
+                turbodbc_options=options
+            )
+            return self._read_connection
+        except Exception as e:
+            logging.warning(f"turbodbc connection failed, falling back to pyodbc: {e}")
+            self._read_connection_failed = True
+            return None
+
+    def _fetch_all_dicts(self, sql: str, params: tuple = (),
+                         arraysize: int = 10000) -> List[Dict]:
+        """
+        Run a read query and return the rows as dictionaries.
+
+        Uses the turbodbc connection when available, fetching the whole
+        result columnar via fetchallnumpy and converting to dictionaries
+        once at the boundary; otherwise falls back to pyodbc block fetches.
+
+        Args:
+            sql: Query text.
+            params: Query parameters.
+            arraysize: Rows per pyodbc fetchmany block on the fallback path.
+
+        Returns:
+            List of row dictionaries.
+        """
+        read_connection = self._get_read_connection()
+        if read_connection is not None:
+            cursor = read_connection.cursor()
+            try:
+                cursor.execute(sql, params)
+                columnar = cursor.fetchallnumpy()
+                columns = list(columnar)
+                return [dict(zip(columns, row)) for row in zip(*columnar.values())]
+            finally:
+                cursor.close()
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.arraysize = arraysize
+            cursor.execute(sql, params)
+            columns = [column[0] for column in cursor.description]
+            results = []
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                results.extend(dict(zip(columns, row)) for row in rows)
+            return results
+        finally:
+            cursor.close()
+
+    def _batch_cursor(self, input_sizes: Optional[list] = None) -> pyodbc.Cursor:
+        """
+        Create a cursor configured for batch inserts.
+
+        Enables fast_executemany so pyodbc ships each batch as a single
+        ODBC parameter array instead of one round trip per row.
+
+        Args:
+            input_sizes: Optional list of parameter type descriptions for
+                cursor.setinputsizes, preventing per-batch column re-scans.
+
+        Returns:
+            Configured cursor.
+        """
+        cursor = self.connection.cursor()
+        cursor.fast_executemany = True
+        if input_sizes:
+            cursor.setinputsizes(input_sizes)
+        return cursor
+
+    def _ensure_dedup_index(self, cursor: pyodbc.Cursor, key: str, ddl: str) -> None:
+        """
+        Create a unique IGNORE_DUP_KEY index if it does not exist.
+
+        With the index in place duplicate rows are silently discarded by the
+        server during insert, so the load paths need no dedup step at all.
+        Runs at most once per manager lifetime per index.
+
+        Args:
+            cursor: Open cursor to run the idempotent DDL on.
+            key: Cache key identifying the index.
+            ddl: Guarded CREATE UNIQUE INDEX statement.
+        """
+        if key in self._tables_ready:
+            return
+        cursor.execute(ddl)
+        self.connection.commit()
+        self._tables_ready.add(key)
     
-    def update_script_status(self, success: bool = True, error_message: Optional[str] = None) -> bool:
+    def update_script_status(self, success: bool = True, error_message: Optional[str] = None,
+                             script_id: Optional[int] = None) -> bool:
         """
         Updates the script status table with execution results.
-        
+
         Args:
             success: Boolean indicating successful execution.
             error_message: Error message in case of failure.
-        
+            script_id: Script ID to update. Defaults to the configured ID.
+
         Returns:
             Boolean indicating if the status update itself was successful.
         """
@@ -70,21 +344,22 @@ class DatabaseManager:
             if self.connection is None:
                 logging.error("Cannot update status: No database connection")
                 return False
-                
+
             cursor = self.connection.cursor()
-            script_id = self.table_config['script_id']
+            if script_id is None:
+                script_id = self.table_config['script_id']
             status_table = self.table_config['status_table']
-            
+
             if success:
-                query = f"UPDATE {status_table} SET result=1, Last_execution=GETDATE() WHERE ID = {script_id}"
+                query = f"UPDATE {status_table} SET result=1, Last_execution=GETDATE() WHERE ID = ?"
+                params = (script_id,)
             else:
-                error_msg = error_message if error_message else "Unknown error"
-                error_msg = error_msg.replace("'", "''")  # Escape single quotes for SQL
-                query = f"UPDATE {status_table} SET result=0, comments='{error_msg}', Last_execution=GETDATE() WHERE ID = {script_id}"
-            
-            cursor.execute(query)
+                query = f"UPDATE {status_table} SET result=0, comments=?, Last_execution=GETDATE() WHERE ID = ?"
+                params = (error_message if error_message else "Unknown error", script_id)
+
+            cursor.execute(query, params)
             self.connection.commit()
-            logging.info(f"Successfully updated script status to {'SUCCESS' if success else 'FAILED'}")
+            logging.info(f"Successfully updated script status for ID {script_id} to {'SUCCESS' if success else 'FAILED'}")
             return True
         except Exception as e:
             logging.error(f"Failed to update script status: {e}")
@@ -115,35 +390,34 @@ class DatabaseManager:
         
         cursor = None
         try:
-            cursor = self.connection.cursor()
-            values_list = []
-            
+            rows = []
+
             for score_entry in scores:
                 driver_id = score_entry.get('driver_id')
                 minutes_analyzed = score_entry.get('minutes_analyzed', 0)
                 driver_score = score_entry.get('driver_score')
-                
+
                 if driver_id is not None and driver_score is not None:
-                    driver_id_escaped = str(driver_id).replace("'", "''")
-                    values_list.append(f"('{driver_id_escaped}', {minutes_analyzed}, {int(driver_score)}, '{report_month}')")
+                    rows.append((str(driver_id), minutes_analyzed, int(driver_score), report_month))
                 else:
-                    logging.warning(f"Skipping score entry due to missing data: {score_entry}")
-            
-            if not values_list:
+                    logging.warning("Skipping score entry due to missing data: %s", score_entry)
+
+            if not rows:
                 logging.warning("No valid score entries found to insert after processing.")
                 return True
-            
+
             target_table = self.table_config['target_table']
             insert_query = f"""
                 INSERT INTO {target_table}
                 ([driver_id], [minutes_analyzed], [driver_score], [reported_month])
-                VALUES {', '.join(values_list)}
+                VALUES (?, ?, ?, ?)
             """
-            
-            logging.info(f"Executing insert query for {len(values_list)} records...")
-            cursor.execute(insert_query)
+
+            logging.info(f"Executing insert query for {len(rows)} records...")
+            cursor = self._batch_cursor()
+            cursor.executemany(insert_query, rows)
             self.connection.commit()
-            logging.info(f"Successfully inserted {len(values_list)} records for {report_month}.")
+            logging.info(f"Successfully inserted {len(rows)} records for {report_month}.")
             return True
             
         except pyodbc.Error as ex:
@@ -165,15 +439,16 @@ class DatabaseManager:
             if cursor:
                 cursor.close()
     
-    def insert_hos_violations(self, violations, report_month, script_id=12) -> bool:
+    def insert_hos_violations(self, violations, report_month, script_id=12, batch_size=10000) -> bool:
         """
         Insert HOS violations data into the database.
-        
+
         Args:
             violations: List of HOSViolation objects
             report_month: Report month string
             script_id: Script ID for status tracking
-        
+            batch_size: Rows per staged executemany batch
+
         Returns:
             Boolean indicating success
         """
@@ -182,48 +457,42 @@ class DatabaseManager:
                 return False
             
             logging.info(f"Starting database insertion for {len(violations)} HOS violations")
-            
-            inserted_count = 0
-            skipped_count = 0
-            
-            # Process in batches for better performance
-            batch_size = 1000
-            for i in range(0, len(violations), batch_size):
-                batch = violations[i:i+batch_size]
-                violations_to_insert = []
-                
-                # Check for duplicates in current batch
-                for violation in batch:
-                    if not self.check_hos_violation_exists(violation.id):
-                        violations_to_insert.append(violation.as_tuple())
-                    else:
-                        skipped_count += 1
-                
-                if violations_to_insert:
-                    # Insert batch of violations
-                    sql = """
-                    INSERT INTO VTUtility.dbo.HOS_Violations 
-                    (ID, Start_Time_and_Driver, Driver_ID, Driver_Name, 
-                     Violation_Start_Time, Violation_End_Time, Driver_Status, 
-                     Terminal, Ruleset, Violation_Type, Violation_Duration)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """
-                    
-                    cursor = self.connection.cursor()
-                    cursor.executemany(sql, violations_to_insert)
+
+            # Multi-batch loads are split across worker connections; each
+            # worker inserts its own slice concurrently
+            if len(violations) > batch_size:
+                cursor = self.connection.cursor()
+                try:
+                    self._ensure_dedup_index(cursor, 'hos_index', self.HOS_DEDUP_INDEX_DDL)
+                finally:
+                    cursor.close()
+                inserted_count = self._insert_hos_violations_parallel(violations, batch_size)
+            else:
+                # Insert straight into the target; the unique IGNORE_DUP_KEY
+                # index on ID makes the server discard duplicates in-flight,
+                # so no stage table or dedup join is needed
+                cursor = self._batch_cursor(self.HOS_VIOLATION_INPUT_SIZES)
+                try:
+                    self._ensure_dedup_index(cursor, 'hos_index', self.HOS_DEDUP_INDEX_DDL)
+
+                    inserted_count = 0
+                    for i in range(0, len(violations), batch_size):
+                        batch = violations[i:i+batch_size]
+                        cursor.executemany(self.HOS_INSERT_SQL, [v.as_tuple() for v in batch])
+                        if cursor.rowcount >= 0:
+                            inserted_count += cursor.rowcount
+                        # %-style args are only formatted if the record is emitted
+                        logging.info("Inserted batch %d: %d/%d violations",
+                                     i // batch_size + 1,
+                                     min(i + batch_size, len(violations)), len(violations))
+
                     self.connection.commit()
+                finally:
                     cursor.close()
-                    
-                    inserted_count += len(violations_to_insert)
-                    logging.info(f"Batch {i//batch_size + 1}: Inserted {len(violations_to_insert)} new violations. "
-                               f"Processed: {min(i+batch_size, len(violations))}/{len(violations)}. "
-                               f"Skipped: {skipped_count}")
-                
-                else:
-                    logging.info(f"Batch {i//batch_size + 1}: Skipped {len(batch)} duplicate violations. "
-                               f"Processed: {min(i+batch_size, len(violations))}/{len(violations)}. "
-                               f"Total Skipped: {skipped_count}")
-            
+
+            skipped_count = len(violations) - inserted_count
+
+
             # Log final summary
             logging.info(f"\n--- HOS Violations Import Summary ---")
             logging.info(f"Total violations processed: {len(violations)}")
@@ -235,10 +504,10 @@ class DatabaseManager:
             
             # Update script status
             if success:
-                self.update_script_status(script_id, True)
+                self.update_script_status(True, script_id=script_id)
                 logging.info("HOS violations import completed successfully")
             else:
-                self.update_script_status(script_id, False, "No valid data to insert")
+                self.update_script_status(False, "No valid data to insert", script_id=script_id)
                 logging.warning("HOS violations import completed with warnings")
             
             return success
@@ -246,7 +515,7 @@ class DatabaseManager:
         except Exception as e:
             error_msg = f"Error inserting HOS violations: {str(e)}"
             logging.error(error_msg)
-            self.update_script_status(script_id, False, error_msg)
+            self.update_script_status(False, error_msg, script_id=script_id)
             if self.connection:
                 try:
                     self.connection.rollback()
@@ -254,6 +523,65 @@ class DatabaseManager:
                     pass
             return False
     
+    def _insert_hos_violations_parallel(self, violations, batch_size: int) -> int:
+        """
+        Insert HOS violations concurrently across worker connections.
+
+        Each worker opens its own connection and inserts its slice directly
+        into the target table. The unique IGNORE_DUP_KEY index on ID keeps
+        the workers from inserting rows that already exist, with no
+        cross-worker coordination needed.
+
+        Args:
+            violations: List of HOSViolation objects.
+            batch_size: Rows per staged executemany batch.
+
+        Returns:
+            Total number of rows inserted across all workers.
+        """
+        num_batches = (len(violations) + batch_size - 1) // batch_size
+        workers = min(self.PARALLEL_INSERT_WORKERS, num_batches)
+        slice_size = (len(violations) + workers - 1) // workers
+        slices = [violations[i:i+slice_size] for i in range(0, len(violations), slice_size)]
+
+        logging.info(f"Inserting {len(violations)} violations across {len(slices)} worker connections")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            inserted_counts = executor.map(
+                lambda violation_slice: self._insert_hos_slice(violation_slice, batch_size),
+                slices
+            )
+            return sum(inserted_counts)
+
+    def _insert_hos_slice(self, violations, batch_size: int) -> int:
+        """
+        Insert one slice of violations on a dedicated connection.
+
+        Args:
+            violations: Slice of HOSViolation objects.
+            batch_size: Rows per executemany batch.
+
+        Returns:
+            Number of rows inserted by this worker.
+        """
+        connection = pyodbc.connect(self._connection_string())
+        try:
+            cursor = connection.cursor()
+            cursor.fast_executemany = True
+            cursor.setinputsizes(self.HOS_VIOLATION_INPUT_SIZES)
+
+            inserted = 0
+            for i in range(0, len(violations), batch_size):
+                batch = violations[i:i+batch_size]
+                cursor.executemany(self.HOS_INSERT_SQL, [v.as_tuple() for v in batch])
+                if cursor.rowcount >= 0:
+                    inserted += cursor.rowcount
+            connection.commit()
+            cursor.close()
+            return inserted
+        finally:
+            connection.close()
+
     def check_hos_violation_exists(self, violation_id: str) -> bool:
         """
         Check if HOS violation with given ID already exists.
@@ -266,10 +594,13 @@ class DatabaseManager:
         """
         try:
             cursor = self.connection.cursor()
-            cursor.execute("SELECT COUNT(*) FROM VTUtility.dbo.HOS_Violations WHERE ID = ?", (violation_id,))
-            count = cursor.fetchone()[0]
+            # TOP 1 1 short-circuits at the first match instead of counting all rows
+            exists = cursor.execute(
+                "SELECT TOP 1 1 FROM VTUtility.dbo.HOS_Violations WHERE ID = ?",
+                (violation_id,)
+            ).fetchval() is not None
             cursor.close()
-            return count > 0
+            return exists
         except Exception as e:
             logging.warning(f"Error checking HOS violation duplicate: {e}")
             return False
@@ -285,17 +616,15 @@ class DatabaseManager:
             List of violation dictionaries
         """
         try:
-            cursor = self.connection.cursor()
             sql = """
-            SELECT * FROM VTUtility.dbo.HOS_Violations 
-            WHERE Driver_ID = ? 
+            SELECT ID, Start_Time_and_Driver, Driver_ID, Driver_Name,
+                   Violation_Start_Time, Violation_End_Time, Driver_Status,
+                   Terminal, Ruleset, Violation_Type, Violation_Duration
+            FROM VTUtility.dbo.HOS_Violations
+            WHERE Driver_ID = ?
             ORDER BY Violation_Start_Time DESC
             """
-            cursor.execute(sql, (driver_id,))
-            columns = [column[0] for column in cursor.description]
-            violations = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            cursor.close()
-            return violations
+            return self._fetch_all_dicts(sql, (driver_id,), arraysize=10000)
         except Exception as e:
             logging.error(f"Error retrieving HOS violations for driver {driver_id}: {e}")
             return []
@@ -308,9 +637,8 @@ class DatabaseManager:
             List of driver summary dictionaries
         """
         try:
-            cursor = self.connection.cursor()
             sql = """
-            SELECT 
+            SELECT
                 Driver_ID,
                 Driver_Name,
                 COUNT(*) as violation_count,
@@ -319,23 +647,129 @@ class DatabaseManager:
             GROUP BY Driver_ID, Driver_Name
             ORDER BY violation_count DESC
             """
-            cursor.execute(sql)
-            columns = [column[0] for column in cursor.description]
-            summary = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            cursor.close()
-            return summary
+            return self._fetch_all_dicts(sql, arraysize=5000)
         except Exception as e:
             logging.error(f"Error retrieving HOS violations summary: {e}")
             return []
 
-    def store_maintenance_records(self, maintenance_records: List[Dict[str, Any]], process_date: str) -> bool:
+    def _ensure_maintenance_table(self, cursor: pyodbc.Cursor) -> None:
+        """
+        Create the Maintenance_Records table if it does not exist.
+
+        Args:
+            cursor: Open cursor to run the idempotent DDL on.
+        """
+        cursor.execute("""
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='Maintenance_Records' AND xtype='U')
+        BEGIN
+            CREATE TABLE VTUtility.dbo.Maintenance_Records (
+                ID int IDENTITY(1,1) PRIMARY KEY,
+                Vehicle_ID nvarchar(50),
+                Vehicle_Number nvarchar(50),
+                Maintenance_Type nvarchar(100),
+                Due_Date nvarchar(50),
+                Last_Service nvarchar(50),
+                Mileage float,
+                Service_Miles float,
+                Status nvarchar(50),
+                Priority nvarchar(50),
+                Location nvarchar(100),
+                Process_Date date,
+                Created_Date datetime DEFAULT GETDATE()
+            )
+        END
+        """)
+        self.connection.commit()
+
+    def _store_maintenance_via_bcp(self, cursor: pyodbc.Cursor,
+                                   maintenance_records: List[Dict[str, Any]],
+                                   process_date: str) -> Optional[int]:
+        """
+        Bulk-load maintenance records through bcp for very large batches.
+
+        bcp cannot target session temp tables, so this path stages into a
+        persistent Maintenance_Records_Stage table, runs the same NOT EXISTS
+        merge, and drops the stage table afterwards.
+
+        Args:
+            cursor: Open cursor used for the merge and cleanup statements.
+            maintenance_records: List of maintenance dictionaries.
+            process_date: Process date string.
+
+        Returns:
+            Number of rows inserted, or None if bcpandas is not installed or
+            the bulk load failed (caller falls back to executemany staging).
+        """
+        try:
+            import pandas as pd
+            from bcpandas import SqlCreds, to_sql
+        except ImportError:
+            logging.debug("bcpandas not installed; using fast_executemany staging")
+            return None
+
+        try:
+            data = {
+                column: [record.get(key, default) for record in maintenance_records]
+                for (key, default), column in zip(
+                    self.MAINTENANCE_RECORD_FIELDS,
+                    ('Vehicle_ID', 'Vehicle_Number', 'Maintenance_Type', 'Due_Date',
+                     'Last_Service', 'Mileage', 'Service_Miles', 'Status',
+                     'Priority', 'Location')
+                )
+            }
+            df = pd.DataFrame(data)
+            df['Process_Date'] = process_date
+
+            creds = SqlCreds(
+                server=self.db_config['server'],
+                database='VTUtility',
+                username=self.db_config['user'],
+                password=self.db_config['password']
+            )
+            to_sql(df, 'Maintenance_Records_Stage', creds, schema='dbo',
+                   index=False, if_exists='replace')
+
+            cursor.execute("""
+            INSERT INTO VTUtility.dbo.Maintenance_Records
+            (Vehicle_ID, Vehicle_Number, Maintenance_Type, Due_Date,
+             Last_Service, Mileage, Service_Miles, Status,
+             Priority, Location, Process_Date)
+            SELECT s.Vehicle_ID, s.Vehicle_Number, s.Maintenance_Type, s.Due_Date,
+                   s.Last_Service, s.Mileage, s.Service_Miles, s.Status,
+                   s.Priority, s.Location, s.Process_Date
+            FROM VTUtility.dbo.Maintenance_Records_Stage s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM VTUtility.dbo.Maintenance_Records t
+                WHERE t.Vehicle_ID = s.Vehicle_ID
+                  AND t.Maintenance_Type = s.Maintenance_Type
+                  AND t.Due_Date = s.Due_Date
+            )
+            """)
+            inserted_count = cursor.rowcount if cursor.rowcount >= 0 else 0
+            cursor.execute("DROP TABLE VTUtility.dbo.Maintenance_Records_Stage")
+            self.connection.commit()
+
+            logging.info(f"Bulk-loaded {len(maintenance_records)} maintenance records via bcp")
+            return inserted_count
+
+        except Exception as e:
+            logging.warning(f"bcp bulk load failed, falling back to batched insert: {e}")
+            try:
+                self.connection.rollback()
+            except Exception:
+                pass
+            return None
+
+    def store_maintenance_records(self, maintenance_records: List[Dict[str, Any]], process_date: str,
+                                  batch_size: int = 10000) -> bool:
         """
         Store maintenance records in the database.
-        
+
         Args:
             maintenance_records: List of maintenance dictionaries
             process_date: Process date string
-        
+            batch_size: Rows per staged executemany batch
+
         Returns:
             Boolean indicating success
         """
@@ -349,85 +783,51 @@ class DatabaseManager:
                 logging.error("Cannot store maintenance records: No database connection")
                 return False
                 
-            cursor = self.connection.cursor()
-            
-            # Check if table exists, create if it doesn't
-            table_check_sql = """
-            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='Maintenance_Records' AND xtype='U')
-            BEGIN
-                CREATE TABLE VTUtility.dbo.Maintenance_Records (
-                    ID int IDENTITY(1,1) PRIMARY KEY,
-                    Vehicle_ID nvarchar(50),
-                    Vehicle_Number nvarchar(50),
-                    Maintenance_Type nvarchar(100),
-                    Due_Date nvarchar(50),
-                    Last_Service nvarchar(50),
-                    Mileage float,
-                    Service_Miles float,
-                    Status nvarchar(50),
-                    Priority nvarchar(50),
-                    Location nvarchar(100),
-                    Process_Date date,
-                    Created_Date datetime DEFAULT GETDATE()
-                )
-            END
-            """
-            cursor.execute(table_check_sql)
-            self.connection.commit()
-            
-            inserted_count = 0
-            skipped_count = 0
-            
-            # Process in batches for better performance
-            batch_size = 1000
-            for i in range(0, len(maintenance_records), batch_size):
-                batch = maintenance_records[i:i+batch_size]
-                records_to_insert = []
-                
-                # Check for duplicates and prepare data
-                for record in batch:
-                    vehicle_id = record.get('vehicle_id', '')
-                    maintenance_type = record.get('maintenance_type', '')
-                    due_date = record.get('due_date', '')
-                    
-                    # Check for duplicates (vehicle_id + maintenance_type combination)
-                    if not self.check_maintenance_record_exists(vehicle_id, maintenance_type, due_date):
-                        record_tuple = (
-                            vehicle_id,
-                            record.get('vehicle_number', ''),
-                            maintenance_type,
-                            due_date,
-                            record.get('last_service', ''),
-                            record.get('mileage', 0),
-                            record.get('service_miles', 0),
-                            record.get('status', ''),
-                            record.get('priority', ''),
-                            record.get('location', ''),
-                            process_date
-                        )
-                        records_to_insert.append(record_tuple)
-                    else:
-                        skipped_count += 1
-                
-                if records_to_insert:
-                    # Insert batch of records
-                    sql = """
-                    INSERT INTO VTUtility.dbo.Maintenance_Records 
-                    (Vehicle_ID, Vehicle_Number, Maintenance_Type, Due_Date, 
-                     Last_Service, Mileage, Service_Miles, Status, 
-                     Priority, Location, Process_Date)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """
-                    
-                    cursor.executemany(sql, records_to_insert)
-                    self.connection.commit()
-                    
-                    inserted_count += len(records_to_insert)
-                    logging.info(f"Batch {i//batch_size + 1}: Inserted {len(records_to_insert)} new maintenance records")
-                
-                else:
-                    logging.info(f"Batch {i//batch_size + 1}: Skipped {len(batch)} duplicate maintenance records")
-            
+            cursor = self._batch_cursor(self.MAINTENANCE_RECORD_INPUT_SIZES)
+
+            # Idempotent DDL runs at most once per manager lifetime
+            if 'maintenance' not in self._tables_ready:
+                self._ensure_maintenance_table(cursor)
+                self._tables_ready.add('maintenance')
+
+            # Very large loads go through bcp when bcpandas is available;
+            # otherwise (or on failure) fall back to fast_executemany staging
+            inserted_count = None
+            if len(maintenance_records) > self.BCP_LOAD_THRESHOLD:
+                inserted_count = self._store_maintenance_via_bcp(cursor, maintenance_records, process_date)
+
+            if inserted_count is None:
+                # Insert straight into the target; the unique IGNORE_DUP_KEY
+                # index on the composite key makes the server discard
+                # duplicates in-flight, so no stage table is needed
+                self._ensure_dedup_index(cursor, 'maintenance_index',
+                                         self.MAINTENANCE_DEDUP_INDEX_DDL)
+
+                # Build each batch with a single list-comp to keep the
+                # per-row interpreter overhead small
+                fields = self.MAINTENANCE_RECORD_FIELDS
+                inserted_count = 0
+                for i in range(0, len(maintenance_records), batch_size):
+                    batch = maintenance_records[i:i+batch_size]
+                    records_to_insert = [
+                        tuple(record.get(key, default) for key, default in fields) + (process_date,)
+                        for record in batch
+                    ]
+
+                    cursor.executemany(self.MAINTENANCE_INSERT_SQL, records_to_insert)
+                    if cursor.rowcount >= 0:
+                        inserted_count += cursor.rowcount
+                    # %-style args are only formatted if the record is emitted
+                    logging.info("Inserted batch %d: %d/%d records",
+                                 i // batch_size + 1,
+                                 min(i + batch_size, len(maintenance_records)),
+                                 len(maintenance_records))
+
+                self.connection.commit()
+
+            skipped_count = len(maintenance_records) - inserted_count
+
+
             # Log final summary
             logging.info(f"\n--- Maintenance Records Import Summary ---")
             logging.info(f"Total records processed: {len(maintenance_records)}")
@@ -440,10 +840,10 @@ class DatabaseManager:
             # Update script status
             script_id = 13  # Use script_id 13 for maintenance
             if success:
-                self.update_script_status_by_id(script_id, True)
+                self.update_script_status(True, script_id=script_id)
                 logging.info("Maintenance records import completed successfully")
             else:
-                self.update_script_status_by_id(script_id, False, "No valid data to insert")
+                self.update_script_status(False, "No valid data to insert", script_id=script_id)
                 logging.warning("Maintenance records import completed with warnings")
             
             return success
@@ -452,7 +852,7 @@ class DatabaseManager:
             error_msg = f"Error storing maintenance records: {str(e)}"
             logging.error(error_msg)
             script_id = 13
-            self.update_script_status_by_id(script_id, False, error_msg)
+            self.update_script_status(False, error_msg, script_id=script_id)
             if self.connection:
                 try:
                     self.connection.rollback()
@@ -477,61 +877,17 @@ class DatabaseManager:
         """
         try:
             cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT COUNT(*) FROM VTUtility.dbo.Maintenance_Records 
+            # TOP 1 1 short-circuits at the first match instead of counting all rows
+            exists = cursor.execute("""
+                SELECT TOP 1 1 FROM VTUtility.dbo.Maintenance_Records
                 WHERE Vehicle_ID = ? AND Maintenance_Type = ? AND Due_Date = ?
-            """, (vehicle_id, maintenance_type, due_date))
-            count = cursor.fetchone()[0]
+            """, (vehicle_id, maintenance_type, due_date)).fetchval() is not None
             cursor.close()
-            return count > 0
+            return exists
         except Exception as e:
             logging.warning(f"Error checking maintenance record duplicate: {e}")
             return False
     
-    def update_script_status_by_id(self, script_id: int, success: bool = True, error_message: Optional[str] = None) -> bool:
-        """
-        Updates the script status table for a specific script ID.
-        
-        Args:
-            script_id: ID of the script to update
-            success: Boolean indicating successful execution
-            error_message: Error message in case of failure
-        
-        Returns:
-            Boolean indicating if the status update was successful
-        """
-        cursor = None
-        try:
-            if self.connection is None:
-                logging.error("Cannot update status: No database connection")
-                return False
-                
-            cursor = self.connection.cursor()
-            status_table = "[VTUtility].[dbo].[Script_status]"
-            
-            if success:
-                query = f"UPDATE {status_table} SET result=1, Last_execution=GETDATE() WHERE ID = {script_id}"
-            else:
-                error_msg = error_message if error_message else "Unknown error"
-                error_msg = error_msg.replace("'", "''")  # Escape single quotes for SQL
-                query = f"UPDATE {status_table} SET result=0, comments='{error_msg}', Last_execution=GETDATE() WHERE ID = {script_id}"
-            
-            cursor.execute(query)
-            self.connection.commit()
-            logging.info(f"Successfully updated script status for ID {script_id} to {'SUCCESS' if success else 'FAILED'}")
-            return True
-        except Exception as e:
-            logging.error(f"Failed to update script status for ID {script_id}: {e}")
-            if self.connection:
-                try:
-                    self.connection.rollback()
-                except:
-                    pass
-            return False
-        finally:
-            if cursor:
-                cursor.close()
-    
     def test_connection(self) -> bool:
         """
         Test database connectivity.
@@ -0,0 +1,23 @@
+"""
+Shared date helpers for the data processing pipelines.
+"""
+
+import datetime
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def compute_report_month() -> str:
+    """
+    Calculate the report month (first day of the previous month).
+
+    Cached for the process lifetime, so repeated pipeline calls reuse the
+    same string instead of redoing the date arithmetic; pipeline runs are
+    short-lived so the cache cannot go stale across a month boundary.
+
+    Returns:
+        Report month string in YYYY-MM-DD format.
+    """
+    today = datetime.date.today()
+    first_day_last_month = today.replace(day=1) - datetime.timedelta(days=1)
+    return first_day_last_month.replace(day=1).strftime('%Y-%m-%d')
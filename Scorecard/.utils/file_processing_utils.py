@@ -3,16 +3,75 @@ File processing utilities for Netradyne data files.
 """
 
 import os
-import glob
 import datetime
+import hashlib
 import logging
+import pickle
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
 from .config_utils import ConfigManager
+from .date_utils import compute_report_month
+
+# xlrd only matters for legacy .xls files; alias its error when absent so
+# the except clauses below stay valid
+try:
+    from xlrd import XLRDError
+except ImportError:
+    XLRDError = ValueError
+
+# Numba JIT-compiles the NaN-to-zero integer coercion for very large score
+# files; it is optional and the pandas path is used when it is not installed
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _coerce_counts(values):
+        """Cast a float64 array to int64, mapping NaN to 0."""
+        out = np.empty(values.shape[0], dtype=np.int64)
+        for i in range(values.shape[0]):
+            value = values[i]
+            out[i] = 0 if np.isnan(value) else int(value)
+        return out
+
+# Columns that match our expected data, keyed by canonical name
+_SCORE_COLUMN_MAPPING = {
+    'Driver ID': ['Driver ID', 'driver_id', 'DriverID', 'ID'],
+    'Minutes Analyzed': ['Minutes Analyzed', 'minutes_analyzed', 'MinutesAnalyzed', 'Minutes'],
+    'Driver Score': ['Driver Score', 'driver_score', 'DriverScore', 'Score']
+}
+
+# Reverse alias -> canonical map built once at import, so renaming is a
+# single hashed rename instead of nested loops over the mapping
+_SCORE_ALIAS_MAP = {
+    alias: target
+    for target, aliases in _SCORE_COLUMN_MAPPING.items()
+    for alias in aliases
+}
 
 
 class FileProcessor:
     """Processes Netradyne data files (CSV and Excel)."""
+
+    # Explicit dtypes for the score columns so the parser materializes them
+    # directly instead of inferring types from the data
+    CSV_DTYPES = {
+        'Driver ID': 'string',
+        'Minutes Analyzed': 'Int64',
+        'Driver Score': 'Int64',
+    }
+
+    # Frames above this row count route the numeric coercion through the
+    # optional Numba JIT path
+    NUMBA_ROW_THRESHOLD = 1_000_000
+
+    # Parsed results are cached here keyed by source path, so re-runs skip
+    # files whose mtime and size have not changed
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
     
     def __init__(self, config_manager: ConfigManager):
         """
@@ -31,10 +90,7 @@ class FileProcessor:
         Returns:
             Report month string in YYYY-MM-DD format.
         """
-        today = datetime.datetime.now()
-        first_day_last_month = datetime.date(today.year, today.month, 1) - datetime.timedelta(days=1)
-        report_date = datetime.date(first_day_last_month.year, first_day_last_month.month, 1)
-        return report_date.strftime('%Y-%m-%d')
+        return compute_report_month()
     
     def find_data_files(self, directory: str = None) -> List[str]:
         """
@@ -53,17 +109,22 @@ class FileProcessor:
             logging.warning(f"Directory does not exist: {directory}")
             return []
         
-        # Look for both CSV and Excel files
-        csv_files = glob.glob(os.path.join(directory, '*.csv'))
-        excel_files = glob.glob(os.path.join(directory, '*.xlsx'))
-        excel_files.extend(glob.glob(os.path.join(directory, '*.xls')))
-        
-        all_files = csv_files + excel_files
+        # Look for both CSV and Excel files in a single scandir pass instead
+        # of one glob walk per extension
+        with os.scandir(directory) as entries:
+            all_files = [
+                entry.path for entry in entries
+                if not entry.name.startswith('.')
+                and entry.name.lower().endswith(('.csv', '.xlsx', '.xls'))
+                and entry.is_file()
+            ]
         
         logging.info(f"Found {len(all_files)} data files in {directory}")
-        for file_path in all_files:
-            logging.info(f"  - {os.path.basename(file_path)}")
-        
+        # One joined DEBUG line instead of a log record per file; the
+        # basename work only runs when DEBUG is actually enabled
+        if all_files and logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('Files: %s', ', '.join(os.path.basename(p) for p in all_files))
+
         return all_files
     
     def read_csv_file(self, file_path: str) -> Optional[pd.DataFrame]:
@@ -79,31 +140,28 @@ class FileProcessor:
         try:
             logging.info(f"Reading CSV file: {file_path}")
             
-            # Try reading with skiprows first (original format)
+            # Try reading with skiprows first (original format). The pyarrow
+            # engine parses multi-threaded and honors the dtype map without a
+            # separate inference pass; fall back to the C engine when pyarrow
+            # is not installed or rejects the options.
+            read_kwargs = dict(
+                skiprows=10,
+                usecols=['Driver ID', 'Minutes Analyzed', 'Driver Score'],
+                dtype=self.CSV_DTYPES
+            )
             try:
-                df = pd.read_csv(
-                    file_path, 
-                    skiprows=10, 
-                    usecols=['Driver ID', 'Minutes Analyzed', 'Driver Score']
-                )
-            except:
+                try:
+                    df = pd.read_csv(file_path, engine='pyarrow', **read_kwargs)
+                except (ImportError, ValueError):
+                    df = pd.read_csv(file_path, **read_kwargs)
+            except ValueError:
                 # If that fails, try reading without skiprows
                 df = pd.read_csv(file_path)
-                
-                # Look for columns that match our expected data
-                column_mapping = {
-                    'Driver ID': ['Driver ID', 'driver_id', 'DriverID', 'ID'],
-                    'Minutes Analyzed': ['Minutes Analyzed', 'minutes_analyzed', 'MinutesAnalyzed', 'Minutes'],
-                    'Driver Score': ['Driver Score', 'driver_score', 'DriverScore', 'Score']
-                }
-                
-                # Try to find and rename columns
-                for target_col, possible_names in column_mapping.items():
-                    for possible_name in possible_names:
-                        if possible_name in df.columns:
-                            df = df.rename(columns={possible_name: target_col})
-                            break
-                
+
+                # Rename any recognized alias columns in one pass, in place
+                # to avoid copying the full frame
+                df.rename(columns=_SCORE_ALIAS_MAP, inplace=True)
+
                 # Select only the columns we need
                 required_cols = ['Driver ID', 'Minutes Analyzed', 'Driver Score']
                 missing_cols = [col for col in required_cols if col not in df.columns]
@@ -113,12 +171,16 @@ class FileProcessor:
                 
                 df = df[required_cols]
             
-            # Clean column names
-            df.columns = [c.replace(' ', '_') for c in df.columns]
-            
-            # Fill NaN values
-            df = df.fillna(0)
-            
+            # Clean column names with the vectorized string accessor
+            df.columns = df.columns.str.replace(' ', '_', regex=False)
+
+            # Fill NaN values in place to avoid copying the whole frame.
+            # Per-column values: Driver_ID parses as pandas StringDtype,
+            # which raises on a 0 fill — blanks become '' there and 0 only
+            # in the numeric columns
+            df.fillna({'Driver_ID': '', 'Minutes_Analyzed': 0, 'Driver_Score': 0},
+                      inplace=True)
+
             logging.info(f"Successfully processed CSV file. Shape: {df.shape}")
             return df
             
@@ -139,28 +201,23 @@ class FileProcessor:
         try:
             logging.info(f"Reading Excel file: {file_path}")
             
-            # Try reading different sheets and formats
+            # Try reading different sheets and formats. calamine (optional)
+            # parses xlsx several times faster than openpyxl.
             try:
-                # First try default sheet
-                df = pd.read_excel(file_path)
-            except:
-                # If that fails, try the first sheet explicitly
-                df = pd.read_excel(file_path, sheet_name=0)
-            
-            # Look for columns that match our expected data
-            column_mapping = {
-                'Driver ID': ['Driver ID', 'driver_id', 'DriverID', 'ID'],
-                'Minutes Analyzed': ['Minutes Analyzed', 'minutes_analyzed', 'MinutesAnalyzed', 'Minutes'],
-                'Driver Score': ['Driver Score', 'driver_score', 'DriverScore', 'Score']
-            }
-            
-            # Try to find and rename columns
-            for target_col, possible_names in column_mapping.items():
-                for possible_name in possible_names:
-                    if possible_name in df.columns:
-                        df = df.rename(columns={possible_name: target_col})
-                        break
+                df = pd.read_excel(file_path, engine='calamine')
+            except (ImportError, ValueError):
+                try:
+                    # Fall back to the default engine and sheet
+                    df = pd.read_excel(file_path)
+                except (ValueError, KeyError, XLRDError) as e:
+                    # If that fails, try the first sheet explicitly
+                    logging.warning(f"Default sheet read failed ({e}); retrying first sheet")
+                    df = pd.read_excel(file_path, sheet_name=0)
             
+            # Rename any recognized alias columns in one pass, in place
+            # to avoid copying the full frame
+            df.rename(columns=_SCORE_ALIAS_MAP, inplace=True)
+
             # Select only the columns we need
             required_cols = ['Driver ID', 'Minutes Analyzed', 'Driver Score']
             missing_cols = [col for col in required_cols if col not in df.columns]
@@ -170,11 +227,11 @@ class FileProcessor:
             
             df = df[required_cols]
             
-            # Clean column names
-            df.columns = [c.replace(' ', '_') for c in df.columns]
-            
-            # Fill NaN values
-            df = df.fillna(0)
+            # Clean column names with the vectorized string accessor
+            df.columns = df.columns.str.replace(' ', '_', regex=False)
+
+            # Fill NaN values in place to avoid copying the whole frame
+            df.fillna(0, inplace=True)
             
             logging.info(f"Successfully processed Excel file. Shape: {df.shape}")
             return df
@@ -193,42 +250,115 @@ class FileProcessor:
         Returns:
             List of score dictionaries.
         """
-        scores = []
-        
-        for index, row in df.iterrows():
-            try:
-                driver_id = str(row['Driver_ID']).strip()
-                minutes_analyzed = int(float(row['Minutes_Analyzed']))
-                driver_score = int(float(row['Driver_Score']))
-                
-                if driver_id and driver_id != 'nan':
-                    scores.append({
-                        'driver_id': driver_id,
-                        'minutes_analyzed': minutes_analyzed,
-                        'driver_score': driver_score
-                    })
-                else:
-                    logging.warning(f"Skipping row {index} due to missing driver ID")
-                    
-            except (ValueError, KeyError) as e:
-                logging.warning(f"Skipping row {index} due to data error: {e}")
-                continue
-        
+        try:
+            # Vectorized casts: one C-level pass per column instead of a
+            # Series allocation and Python-level coercion per row
+            ids = df['Driver_ID'].astype(str).str.strip()
+            minutes_raw = pd.to_numeric(df['Minutes_Analyzed'], errors='coerce')
+            scores_raw = pd.to_numeric(df['Driver_Score'], errors='coerce')
+        except KeyError as e:
+            logging.error(f"Missing required column in DataFrame: {e}")
+            return []
+
+        # Very large frames run the NaN-to-int coercion through the Numba
+        # JIT loop when available; compile time is not worth it below the
+        # threshold, so smaller frames use the pandas casts
+        if numba is not None and len(df) > self.NUMBA_ROW_THRESHOLD:
+            minutes = _coerce_counts(minutes_raw.to_numpy(dtype=np.float64, na_value=np.nan))
+            score_values = _coerce_counts(scores_raw.to_numpy(dtype=np.float64, na_value=np.nan))
+        else:
+            minutes = minutes_raw.fillna(0).astype('int64').to_numpy()
+            score_values = scores_raw.fillna(0).astype('int64').to_numpy()
+
+        valid = (ids.ne('') & ids.ne('nan')).to_numpy()
+        skipped = int((~valid).sum())
+        if skipped:
+            logging.warning(f"Skipping {skipped} rows due to missing driver ID")
+
+        scores = [
+            {'driver_id': driver_id, 'minutes_analyzed': minutes_analyzed, 'driver_score': driver_score}
+            for driver_id, minutes_analyzed, driver_score in zip(
+                ids.to_numpy()[valid],
+                minutes[valid].tolist(),
+                score_values[valid].tolist()
+            )
+        ]
+
         logging.info(f"Converted {len(scores)} valid records from DataFrame")
         return scores
     
+    def _cache_path(self, file_path: str) -> str:
+        """
+        Build the cache file path for a source data file.
+
+        Args:
+            file_path: Path to the source file.
+
+        Returns:
+            Path of the pickle holding the cached results.
+        """
+        digest = hashlib.md5(os.path.abspath(file_path).encode()).hexdigest()
+        return os.path.join(self.CACHE_DIR, f"{digest}.pkl")
+
+    def _load_cached_scores(self, file_path: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return cached scores for an unchanged file, or None.
+
+        Args:
+            file_path: Path to the source file.
+
+        Returns:
+            Cached score list if the file's mtime and size still match the
+            cache entry, otherwise None.
+        """
+        try:
+            st = os.stat(file_path)
+            with open(self._cache_path(file_path), 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('mtime_ns') == st.st_mtime_ns and cached.get('size') == st.st_size:
+                return cached['scores']
+        except (OSError, pickle.PickleError, EOFError, KeyError):
+            pass
+        return None
+
+    def _store_cached_scores(self, file_path: str, scores: List[Dict[str, Any]]) -> None:
+        """
+        Cache parsed scores alongside the file's mtime and size.
+
+        Args:
+            file_path: Path to the source file.
+            scores: Parsed score dictionaries to cache.
+        """
+        try:
+            st = os.stat(file_path)
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            with open(self._cache_path(file_path), 'wb') as f:
+                pickle.dump(
+                    {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'scores': scores},
+                    f, protocol=pickle.HIGHEST_PROTOCOL
+                )
+        except OSError as e:
+            logging.debug(f"Could not cache results for {file_path}: {e}")
+
     def process_file(self, file_path: str) -> Optional[List[Dict[str, Any]]]:
         """
         Process a single file and return standardized score data.
-        
+
         Args:
             file_path: Path to the file to process.
-        
+
         Returns:
             List of score dictionaries or None if failed.
         """
+        # Unchanged files are served from the on-disk cache, skipping the
+        # parse entirely on idempotent re-runs
+        cached = self._load_cached_scores(file_path)
+        if cached is not None:
+            logging.info(f"Using cached results for unchanged file: {os.path.basename(file_path)}")
+            return cached
+
         file_ext = os.path.splitext(file_path)[1].lower()
-        
+
         if file_ext == '.csv':
             df = self.read_csv_file(file_path)
         elif file_ext in ['.xlsx', '.xls']:
@@ -236,11 +366,13 @@ class FileProcessor:
         else:
             logging.error(f"Unsupported file format: {file_ext}")
             return None
-        
+
         if df is None:
             return None
-        
+
         scores = self.process_dataframe_to_scores(df)
+        if scores:
+            self._store_cached_scores(file_path, scores)
         return scores
     
     def process_all_files(self, directory: str = None) -> Optional[Tuple[List[Dict[str, Any]], str]]:
@@ -261,22 +393,36 @@ class FileProcessor:
         
         all_scores = []
         report_month = self.get_report_month()
-        
-        for file_path in files:
-            try:
-                file_name = os.path.basename(file_path)
-                logging.info(f"Processing file: {file_name}")
-                
-                scores = self.process_file(file_path)
-                if scores:
-                    all_scores.extend(scores)
-                    logging.info(f"Added {len(scores)} records from {file_name}")
-                else:
-                    logging.warning(f"No valid data found in {file_name}")
-                    
-            except Exception as e:
-                logging.error(f"Error processing file {file_path}: {e}")
-                continue
+
+        # Files are independent, so parse them across worker processes when
+        # there is more than one; parsing happens in pandas C code and the
+        # score dicts pickle cheaply back to the parent
+        max_workers = min(len(files), os.cpu_count() or 1)
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [(file_path, executor.submit(self.process_file, file_path))
+                           for file_path in files]
+                results = []
+                for file_path, future in futures:
+                    try:
+                        results.append((file_path, future.result()))
+                    except Exception as e:
+                        logging.error(f"Error processing file {file_path}: {e}")
+        else:
+            results = []
+            for file_path in files:
+                try:
+                    results.append((file_path, self.process_file(file_path)))
+                except Exception as e:
+                    logging.error(f"Error processing file {file_path}: {e}")
+
+        for file_path, scores in results:
+            file_name = os.path.basename(file_path)
+            if scores:
+                all_scores.extend(scores)
+                logging.info(f"Added {len(scores)} records from {file_name}")
+            else:
+                logging.warning(f"No valid data found in {file_name}")
         
         if all_scores:
             logging.info(f"Total processed records: {len(all_scores)}")
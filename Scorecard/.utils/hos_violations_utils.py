@@ -2,17 +2,56 @@
 HOS Violations processing utilities for Excel report and JSON data.
 """
 
+import os
 import json
 import logging
 import pandas as pd
 import datetime
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 from config_utils import ConfigManager
+from date_utils import compute_report_month
 
+# xlrd only matters for legacy .xls files; alias its error when absent so
+# the except clauses below stay valid
+try:
+    from xlrd import XLRDError
+except ImportError:
+    XLRDError = ValueError
 
-@dataclass
+# orjson parses JSON several times faster than the stdlib; it is optional
+# and the stdlib parser is used when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# HOS violations typically have these columns (adjust as needed), keyed by
+# canonical name
+_HOS_COLUMN_MAPPING = {
+    'Driver ID': ['Driver ID', 'driver_id', 'DriverID', 'ID', 'Employee_ID'],
+    'Driver Name': ['Driver Name', 'driver_name', 'DriverName', 'Name', 'Employee_Name'],
+    'Violation Date': ['Violation Date', 'violation_date', 'ViolationDate', 'Date', 'Violation Start Time'],
+    'Violation Type': ['Violation Type', 'violation_type', 'ViolationType', 'Type'],
+    'Description': ['Description', 'description', 'Desc', 'Details', 'Violation Duration (HH:MM:SS)'],
+    'Severity': ['Severity', 'severity', 'Level', 'Priority'],
+    'Terminal': ['Terminal', 'terminal', 'Location', 'Base'],
+    'Ruleset': ['Ruleset', 'ruleset', 'Rules', 'Rule_Set'],
+    'Driver Status': ['Driver Status', 'driver_status', 'Status']
+}
+
+# Reverse alias -> canonical map built once at import, so renaming is a
+# single hashed rename instead of nested loops over the mapping
+_HOS_ALIAS_MAP = {
+    alias: target
+    for target, aliases in _HOS_COLUMN_MAPPING.items()
+    for alias in aliases
+}
+
+
+@dataclass(slots=True)
 class HOSViolation:
     """Data model representing a single HOS violation record."""
     
@@ -45,21 +84,80 @@ class HOSViolation:
             start_time_and_driver=json_data["Start Time and Driver"]
         )
     
+    # Keys every JSON record must carry; records missing any are skipped
+    REQUIRED_JSON_KEYS = (
+        "ID", "Driver ID", "Driver Name", "Violation Start Time",
+        "Driver Status", "Terminal", "Ruleset", "Violation Type",
+        "Violation Duration (HH:MM:SS)", "Start Time and Driver"
+    )
+
+    @classmethod
+    def from_json_list(cls, items: List[Dict[str, Any]]) -> List['HOSViolation']:
+        """
+        Create HOSViolation objects from a list of JSON records.
+
+        Validates the required keys once up-front and parses both datetime
+        columns with a single vectorized pd.to_datetime call each, instead
+        of per-record fromisoformat calls inside a try/except loop.
+
+        Args:
+            items: List of JSON record dictionaries.
+
+        Returns:
+            List of HOSViolation objects for the valid records.
+        """
+        if not items:
+            return []
+
+        required = cls.REQUIRED_JSON_KEYS
+        valid_items = [item for item in items if all(key in item for key in required)]
+        if len(valid_items) < len(items):
+            logging.warning(f"Skipping {len(items) - len(valid_items)} records with missing keys")
+        if not valid_items:
+            return []
+
+        # Coerce both columns: one malformed date becomes NaT and drops
+        # that record alone instead of raising and losing the whole file
+        starts = pd.to_datetime(
+            [item["Violation Start Time"] for item in valid_items],
+            errors='coerce'
+        )
+        ends = pd.to_datetime(
+            [item.get("Violation End Time") or None for item in valid_items],
+            errors='coerce'
+        )
+
+        bad_starts = int(pd.isna(starts).sum())
+        if bad_starts:
+            logging.warning(f"Skipping {bad_starts} records with unparseable start times")
+
+        return [
+            cls(
+                id=item["ID"],
+                driver_id=item["Driver ID"],
+                driver_name=item["Driver Name"],
+                violation_start_time=start.to_pydatetime(),
+                violation_end_time=None if pd.isna(end) else end.to_pydatetime(),
+                driver_status=item["Driver Status"],
+                terminal=item["Terminal"],
+                ruleset=item["Ruleset"],
+                violation_type=item["Violation Type"],
+                violation_duration=item["Violation Duration (HH:MM:SS)"],
+                start_time_and_driver=item["Start Time and Driver"]
+            )
+            for item, start, end in zip(valid_items, starts, ends)
+            if not pd.isna(start)
+        ]
+
     @classmethod
     def from_excel_row(cls, row_data: Dict[str, Any]) -> 'HOSViolation':
         """Create a HOSViolation object from Excel row data."""
         # Generate an ID if not present
         violation_id = row_data.get('id', f"{row_data.get('driver_id', '')}_{row_data.get('violation_date', '')}")
-        
-        # Parse date if it's a string
-        violation_date = row_data.get('violation_date', '')
-        if isinstance(violation_date, str):
-            try:
-                violation_start_time = datetime.datetime.strptime(violation_date, '%Y-%m-%d')
-            except:
-                violation_start_time = datetime.datetime.now()
-        else:
-            violation_start_time = violation_date or datetime.datetime.now()
+
+        # Callers pre-parse the violation_date column with pd.to_datetime,
+        # so this is already a datetime rather than a string needing strptime
+        violation_start_time = row_data.get('violation_date') or datetime.datetime.now()
         
         return cls(
             id=violation_id,
@@ -136,13 +234,19 @@ class HOSViolationsProcessor:
             logging.warning(f"Directory does not exist: {directory}")
             return {"excel": [], "json": []}
         
-        # Look for Excel and JSON files
-        excel_files = list(directory_path.glob('*.xlsx'))
-        excel_files.extend(list(directory_path.glob('*.xls')))
-        json_files = list(directory_path.glob('*.json'))
-        
-        excel_paths = [str(file_path) for file_path in excel_files]
-        json_paths = [str(file_path) for file_path in json_files]
+        # Look for Excel and JSON files in a single scandir pass instead of
+        # one glob walk per extension
+        excel_paths = []
+        json_paths = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or not entry.is_file():
+                    continue
+                name = entry.name.lower()
+                if name.endswith(('.xlsx', '.xls')):
+                    excel_paths.append(entry.path)
+                elif name.endswith('.json'):
+                    json_paths.append(entry.path)
         
         logging.info(f"Found {len(excel_paths)} Excel files and {len(json_paths)} JSON files in {directory}")
         
@@ -165,18 +269,16 @@ class HOSViolationsProcessor:
                 logging.error(f"JSON file not found: {file_path}")
                 return []
             
-            with open(file_path, 'r') as f:
-                json_data = json.load(f)
-            
-            violations = []
-            for item in json_data:
-                try:
-                    violation = HOSViolation.from_json(item)
-                    violations.append(violation)
-                except (KeyError, ValueError) as e:
-                    logging.warning(f"Error parsing violation: {e}")
-                    continue
+            # Read the raw bytes once and hand them to the fastest available
+            # parser instead of decoding through a text-mode file object
+            raw = Path(file_path).read_bytes()
+            if orjson is not None:
+                json_data = orjson.loads(raw)
+            else:
+                json_data = json.loads(raw)
             
+            violations = HOSViolation.from_json_list(json_data)
+
             logging.info(f"Successfully parsed {len(violations)} violations from JSON")
             return violations
             
@@ -200,29 +302,14 @@ class HOSViolationsProcessor:
             # Try reading different sheets and formats
             try:
                 df = pd.read_excel(file_path)
-            except:
+            except (ValueError, KeyError, XLRDError) as e:
+                logging.warning(f"Default sheet read failed ({e}); retrying first sheet")
                 df = pd.read_excel(file_path, sheet_name=0)
             
-            # HOS violations typically have these columns (adjust as needed)
-            column_mapping = {
-                'Driver ID': ['Driver ID', 'driver_id', 'DriverID', 'ID', 'Employee_ID'],
-                'Driver Name': ['Driver Name', 'driver_name', 'DriverName', 'Name', 'Employee_Name'],
-                'Violation Date': ['Violation Date', 'violation_date', 'ViolationDate', 'Date', 'Violation Start Time'],
-                'Violation Type': ['Violation Type', 'violation_type', 'ViolationType', 'Type'],
-                'Description': ['Description', 'description', 'Desc', 'Details', 'Violation Duration (HH:MM:SS)'],
-                'Severity': ['Severity', 'severity', 'Level', 'Priority'],
-                'Terminal': ['Terminal', 'terminal', 'Location', 'Base'],
-                'Ruleset': ['Ruleset', 'ruleset', 'Rules', 'Rule_Set'],
-                'Driver Status': ['Driver Status', 'driver_status', 'Status']
-            }
-            
-            # Try to find and rename columns
-            for target_col, possible_names in column_mapping.items():
-                for possible_name in possible_names:
-                    if possible_name in df.columns:
-                        df = df.rename(columns={possible_name: target_col})
-                        break
-            
+            # Rename any recognized alias columns in one pass, in place
+            # to avoid copying the full frame
+            df.rename(columns=_HOS_ALIAS_MAP, inplace=True)
+
             # Check for required columns
             required_cols = ['Driver ID', 'Violation Date', 'Violation Type']
             missing_cols = [col for col in required_cols if col not in df.columns]
@@ -231,11 +318,11 @@ class HOSViolationsProcessor:
                 logging.info(f"Available columns: {list(df.columns)}")
                 return None
             
-            # Clean column names
-            df.columns = [c.replace(' ', '_').lower() for c in df.columns]
-            
-            # Fill NaN values
-            df = df.fillna('')
+            # Clean column names with the vectorized string accessor
+            df.columns = df.columns.str.replace(' ', '_', regex=False).str.lower()
+
+            # Fill NaN values in place to avoid copying the whole frame
+            df.fillna('', inplace=True)
             
             logging.info(f"Successfully processed HOS Excel file. Shape: {df.shape}")
             return df
@@ -255,50 +342,86 @@ class HOSViolationsProcessor:
             List of HOSViolation objects.
         """
         violations = []
-        
-        for index, row in df.iterrows():
-            try:
-                # Map Excel row to violation data
-                violation_data = {
-                    'id': f"{row.get('driver_id', '')}_{row.get('violation_date', '')}_{index}",
-                    'driver_id': str(row.get('driver_id', '')).strip(),
-                    'driver_name': str(row.get('driver_name', '')).strip(),
-                    'violation_date': row.get('violation_date', ''),
-                    'violation_type': str(row.get('violation_type', '')).strip(),
-                    'description': str(row.get('description', '')).strip(),
-                    'severity': str(row.get('severity', '')).strip(),
-                    'terminal': str(row.get('terminal', '')).strip(),
-                    'ruleset': str(row.get('ruleset', '')).strip(),
-                    'driver_status': str(row.get('driver_status', '')).strip(),
-                    'violation_duration': str(row.get('description', '')).strip()  # Use description as duration for Excel
-                }
-                
-                # Validate required fields
-                if violation_data['driver_id'] and violation_data['violation_date'] and violation_data['violation_type']:
-                    violation = HOSViolation.from_excel_row(violation_data)
-                    violations.append(violation)
-                else:
-                    logging.warning(f"Skipping row {index} due to missing required data")
-                    
-            except Exception as e:
-                logging.warning(f"Skipping row {index} due to processing error: {e}")
-                continue
-        
+
+        # Normalize the string columns once up-front so the loop body only
+        # assembles dicts from already-clean values
+        text_columns = ('driver_id', 'driver_name', 'violation_type', 'description',
+                        'severity', 'terminal', 'ruleset', 'driver_status')
+        for column in text_columns:
+            if column in df.columns:
+                df[column] = df[column].astype(str).str.strip()
+
+        # Parse the whole date column in one vectorized pass instead of a
+        # strptime (plus exception dispatch) per row inside the loop.
+        # Capture which rows had a date at all before the fill below
+        # papers over blanks with the current timestamp — a fabricated
+        # date would also mint a fresh violation ID on every run
+        if 'violation_date' in df.columns:
+            has_date = (df['violation_date'].notna()
+                        & df['violation_date'].astype(str).str.strip().ne(''))
+            df['violation_date'] = pd.to_datetime(df['violation_date'], errors='coerce').fillna(pd.Timestamp.now())
+        else:
+            has_date = pd.Series(False, index=df.index)
+
+        # Validate required fields for the whole frame at once instead of a
+        # per-row check plus try/except frame setup inside the loop
+        valid_mask = (
+            df['driver_id'].ne('') & df['driver_id'].ne('nan')
+            & df['violation_type'].ne('') & df['violation_type'].ne('nan')
+            & has_date
+        )
+        skipped = int((~valid_mask).sum())
+        if skipped:
+            logging.warning(f"Skipping {skipped} rows due to missing required data")
+
+        # itertuples returns namedtuples backed by the underlying arrays,
+        # avoiding the per-row Series allocation iterrows incurs
+        for row in df[valid_mask].itertuples(index=True, name='Row'):
+            # Map Excel row to violation data
+            violation_data = {
+                'id': f"{getattr(row, 'driver_id', '')}_{getattr(row, 'violation_date', '')}_{row.Index}",
+                'driver_id': getattr(row, 'driver_id', ''),
+                'driver_name': getattr(row, 'driver_name', ''),
+                'violation_date': getattr(row, 'violation_date', ''),
+                'violation_type': getattr(row, 'violation_type', ''),
+                'description': getattr(row, 'description', ''),
+                'severity': getattr(row, 'severity', ''),
+                'terminal': getattr(row, 'terminal', ''),
+                'ruleset': getattr(row, 'ruleset', ''),
+                'driver_status': getattr(row, 'driver_status', ''),
+                'violation_duration': getattr(row, 'description', '')  # Use description as duration for Excel
+            }
+            violations.append(HOSViolation.from_excel_row(violation_data))
+
         logging.info(f"Processed {len(violations)} valid HOS violations from Excel")
         return violations
     
     def get_report_month(self) -> str:
         """
         Calculate the report month for the previous month.
-        
+
         Returns:
             Report month string in YYYY-MM-DD format.
         """
-        today = datetime.datetime.now()
-        first_day_last_month = datetime.date(today.year, today.month, 1) - datetime.timedelta(days=1)
-        report_date = datetime.date(first_day_last_month.year, first_day_last_month.month, 1)
-        return report_date.strftime('%Y-%m-%d')
-    
+        return compute_report_month()
+
+    def _process_hos_file(self, file_path: str) -> List[HOSViolation]:
+        """
+        Process a single HOS file (JSON or Excel) into violation objects.
+
+        Args:
+            file_path: Path to the file to process.
+
+        Returns:
+            List of HOSViolation objects (empty if the file could not be read).
+        """
+        if file_path.lower().endswith('.json'):
+            return self.parse_json_file(file_path)
+        df = self.read_hos_excel_file(file_path)
+        if df is None:
+            return []
+        return self.process_excel_dataframe(df)
+
     def process_all_hos_files(self, directory: str = None) -> Optional[Tuple[List[HOSViolation], str]]:
         """
         Process all HOS violation files in directory (both Excel and JSON).
@@ -320,38 +443,37 @@ class HOSViolationsProcessor:
         
         all_violations = []
         report_month = self.get_report_month()
-        
-        # Process JSON files
-        for file_path in files["json"]:
-            try:
-                file_name = Path(file_path).name
-                logging.info(f"Processing HOS JSON file: {file_name}")
-                
-                violations = self.parse_json_file(file_path)
+        all_files = files["json"] + files["excel"]
+
+        # Files are independent, so parse them across worker processes when
+        # there is more than one; HOSViolation dataclasses pickle cheaply
+        # back to the parent
+        max_workers = min(len(all_files), os.cpu_count() or 1)
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [(file_path, executor.submit(self._process_hos_file, file_path))
+                           for file_path in all_files]
+                results = []
+                for file_path, future in futures:
+                    try:
+                        results.append((file_path, future.result()))
+                    except Exception as e:
+                        logging.error(f"Error processing HOS file {file_path}: {e}")
+        else:
+            results = []
+            for file_path in all_files:
+                try:
+                    results.append((file_path, self._process_hos_file(file_path)))
+                except Exception as e:
+                    logging.error(f"Error processing HOS file {file_path}: {e}")
+
+        for file_path, violations in results:
+            file_name = Path(file_path).name
+            if violations:
                 all_violations.extend(violations)
-                logging.info(f"Added {len(violations)} violations from JSON file {file_name}")
-                
-            except Exception as e:
-                logging.error(f"Error processing JSON file {file_path}: {e}")
-                continue
-        
-        # Process Excel files
-        for file_path in files["excel"]:
-            try:
-                file_name = Path(file_path).name
-                logging.info(f"Processing HOS Excel file: {file_name}")
-                
-                df = self.read_hos_excel_file(file_path)
-                if df is not None:
-                    violations = self.process_excel_dataframe(df)
-                    all_violations.extend(violations)
-                    logging.info(f"Added {len(violations)} violations from Excel file {file_name}")
-                else:
-                    logging.warning(f"No valid data found in Excel file {file_name}")
-                    
-            except Exception as e:
-                logging.error(f"Error processing Excel file {file_path}: {e}")
-                continue
+                logging.info(f"Added {len(violations)} violations from file {file_name}")
+            else:
+                logging.warning(f"No valid data found in file {file_name}")
         
         if all_violations:
             logging.info(f"Total HOS violations processed: {len(all_violations)}")
@@ -372,28 +494,25 @@ class HOSViolationsProcessor:
         """
         if not violations:
             return {}
-        
-        # Group by driver
-        driver_counts = {}
-        violation_type_counts = {}
-        terminal_counts = {}
-        
-        for violation in violations:
-            # Count by driver
-            driver_key = f"{violation.driver_name} ({violation.driver_id})"
-            driver_counts[driver_key] = driver_counts.get(driver_key, 0) + 1
-            
-            # Count by violation type
-            violation_type_counts[violation.violation_type] = violation_type_counts.get(violation.violation_type, 0) + 1
-            
-            # Count by terminal
-            terminal_counts[violation.terminal] = terminal_counts.get(violation.terminal, 0) + 1
-        
-        # Get top violators
-        top_drivers = sorted(driver_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        top_violation_types = sorted(violation_type_counts.items(), key=lambda x: x[1], reverse=True)
-        top_terminals = sorted(terminal_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        
+
+        # Count with vectorized value_counts (which also returns the counts
+        # sorted descending) instead of three Python dict passes plus sorts
+        df = pd.DataFrame([v.to_dict() for v in violations])
+
+        # Count (name, id) pairs on factorized codes rather than building a
+        # per-row display string; the key string is only formatted for the
+        # handful of unique drivers that get reported
+        driver_counts = df[['driver_name', 'driver_id']].value_counts()
+        violation_type_counts = df['violation_type'].value_counts()
+        terminal_counts = df['terminal'].value_counts()
+
+        top_drivers = [(f"{name} ({driver_id})", int(count))
+                       for (name, driver_id), count in driver_counts.nlargest(10).items()]
+        top_violation_types = [(key, int(count)) for key, count in violation_type_counts.items()]
+        top_terminals = [(key, int(count)) for key, count in terminal_counts.nlargest(10).items()]
+
+        start_times = df['violation_start_time']
+
         analysis = {
             'total_violations': len(violations),
             'unique_drivers': len(driver_counts),
@@ -403,8 +522,8 @@ class HOSViolationsProcessor:
             'violation_type_distribution': top_violation_types,
             'top_terminals': top_terminals,
             'date_range': {
-                'earliest': min(v.violation_start_time for v in violations).isoformat(),
-                'latest': max(v.violation_start_time for v in violations).isoformat()
+                'earliest': start_times.min().isoformat(),
+                'latest': start_times.max().isoformat()
             }
         }
         
@@ -2,27 +2,90 @@
 Netradyne API utilities for data retrieval.
 """
 
+import asyncio
+import calendar
 import requests
 import datetime
+import threading
 import time
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, List, Dict, Any, Tuple
 from .config_utils import ConfigManager
 
+logger = logging.getLogger(__name__)
+
+# aiohttp is optional; the async client below is only usable when it is
+# installed, the blocking client works either way
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 
 class NetradyneAPIClient:
     """Client for interacting with the Netradyne API."""
-    
+
     def __init__(self, config_manager: ConfigManager):
         """
         Initialize Netradyne API client.
-        
+
         Args:
             config_manager: Configuration manager instance.
         """
         self.config_manager = config_manager
         self.api_config = config_manager.netradyne_api_config
-        
+
+        # One session for the auth + score sequence so urllib3 keeps the TLS
+        # connection alive instead of handshaking per request; retries cover
+        # transient server/rate-limit responses
+        self.session = requests.Session()
+        self.session.headers.update({'Accept-Language': 'en-US'})
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
+
+        # In-process token cache; _token_refresh_ms marks when the cached
+        # token should be refreshed (90% of its remaining lifetime, so a
+        # long score download never straddles the exact expiry)
+        self._token: Optional[str] = None
+        self._token_refresh_ms: int = 0
+        # Single-flight guard so concurrent callers cannot mint duplicate
+        # tokens; losers of the race pick up the cached result
+        self._token_lock = threading.Lock()
+
+    def _cache_token(self, access_token: str, expires_on_ms: int) -> None:
+        """
+        Cache a token and schedule its refresh point.
+
+        Args:
+            access_token: Token to cache.
+            expires_on_ms: Token expiry in epoch milliseconds.
+        """
+        now_ms = time.time() * 1000
+        self._token = access_token
+        self._token_refresh_ms = int(now_ms + 0.9 * max(expires_on_ms - now_ms, 0))
+
+    def close(self) -> None:
+        """Close the HTTP session and its connection pool."""
+        self.session.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
     def get_existing_tokens(self) -> Optional[str]:
         """
         Retrieves existing auth tokens from the Netradyne API.
@@ -30,14 +93,11 @@ class NetradyneAPIClient:
         Returns:
             Access token string or None if no valid tokens found.
         """
-        headers = {
-            'Accept-Language': 'en-US',
-            'Authorization': f'Basic {self.api_config["basic_auth"]}'
-        }
+        headers = {'Authorization': f'Basic {self.api_config["basic_auth"]}'}
         try:
-            response = requests.get(
-                self.api_config["auth_url"] + 's', 
-                headers=headers, 
+            response = self.session.get(
+                self.api_config["auth_url"] + 's',
+                headers=headers,
                 timeout=30
             )
             response.raise_for_status()
@@ -45,23 +105,26 @@ class NetradyneAPIClient:
             tokens = token_data.get('data', [])
             
             if tokens:
-                logging.info(f"Found {len(tokens)} existing token(s).")
+                logger.info("Found %s existing token(s).", len(tokens))
                 # Return the token with the longest remaining lifetime
-                valid_tokens = [t for t in tokens if t.get('expiresOn', 0) > (time.time() * 1000)]
+                cutoff = time.time() * 1000
+                valid_tokens = [t for t in tokens if t.get('expiresOn', 0) > cutoff]
                 if valid_tokens:
-                    # Sort by expiration time, descending (latest expiry first)
-                    valid_tokens.sort(key=lambda x: x.get('expiresOn', 0), reverse=True)
-                    selected_token = valid_tokens[0]
+                    # max() picks the latest expiry in one pass, no sort
+                    selected_token = max(valid_tokens, key=lambda t: t.get('expiresOn', 0))
                     expiry_time = datetime.datetime.fromtimestamp(
                         selected_token.get('expiresOn', 0)/1000
                     ).strftime('%Y-%m-%d %H:%M:%S')
-                    logging.info(f"Using existing token that expires at {expiry_time}")
-                    return selected_token.get('accessToken')
+                    logger.info("Using existing token that expires at %s", expiry_time)
+                    access_token = selected_token.get('accessToken')
+                    if access_token:
+                        self._cache_token(access_token, selected_token.get('expiresOn', 0))
+                    return access_token
             
-            logging.info("No valid existing tokens found.")
+            logger.info("No valid existing tokens found.")
             return None
         except requests.exceptions.RequestException as e:
-            logging.error(f"Error retrieving existing tokens: {e}")
+            logger.error("Error retrieving existing tokens: %s", e)
             return None
     
     def create_new_token(self) -> Optional[str]:
@@ -71,29 +134,28 @@ class NetradyneAPIClient:
         Returns:
             Access token string or None if creation failed.
         """
-        logging.info("Requesting new auth token...")
-        headers = {
-            'Accept-Language': 'en-US',
-            'Authorization': f'Basic {self.api_config["basic_auth"]}'
-        }
+        logger.info("Requesting new auth token...")
+        headers = {'Authorization': f'Basic {self.api_config["basic_auth"]}'}
         try:
-            response = requests.post(
-                self.api_config["auth_url"], 
-                headers=headers, 
+            response = self.session.post(
+                self.api_config["auth_url"],
+                headers=headers,
                 timeout=30
             )
             response.raise_for_status()
             token_data = response.json()
-            access_token = token_data.get('data', {}).get('accessToken')
-            
+            data = token_data.get('data', {})
+            access_token = data.get('accessToken')
+
             if access_token:
-                logging.info("Successfully created new Netradyne access token.")
+                logger.info("Successfully created new Netradyne access token.")
+                self._cache_token(access_token, data.get('expiresOn', 0))
                 return access_token
             else:
-                logging.error(f"Could not extract access token from response: {token_data}")
+                logger.error("Could not extract access token from response: %s", token_data)
                 return None
         except requests.exceptions.RequestException as e:
-            logging.error(f"Error creating new auth token: {e}")
+            logger.error("Error creating new auth token: %s", e)
             return None
     
     def get_auth_token(self) -> Optional[str]:
@@ -103,13 +165,24 @@ class NetradyneAPIClient:
         Returns:
             Access token string or None if authentication failed.
         """
-        # First, try to get an existing token
-        existing_token = self.get_existing_tokens()
-        if existing_token:
-            return existing_token
-        
-        # If no existing token is available, create a new one
-        return self.create_new_token()
+        # A freshly cached token short-circuits the /auths round trip until
+        # 90% of its lifetime has elapsed (fast path, checked lock-free)
+        if self._token and self._token_refresh_ms > time.time() * 1000:
+            return self._token
+
+        # Double-checked locking: only one caller refreshes, the rest wait
+        # and return whatever it cached
+        with self._token_lock:
+            if self._token and self._token_refresh_ms > time.time() * 1000:
+                return self._token
+
+            # Next, try to get an existing token from the API
+            existing_token = self.get_existing_tokens()
+            if existing_token:
+                return existing_token
+
+            # If no existing token is available, create a new one
+            return self.create_new_token()
     
     def get_previous_month_details(self) -> Tuple[int, str]:
         """
@@ -119,16 +192,14 @@ class NetradyneAPIClient:
             Tuple of (timestamp_ms, report_month_str)
         """
         today = datetime.date.today()
-        first_day_current_month = today.replace(day=1)
-        last_day_previous_month = first_day_current_month - datetime.timedelta(days=1)
-        first_day_previous_month = last_day_previous_month.replace(day=1)
+        year, month = (today.year, today.month - 1) if today.month > 1 else (today.year - 1, 12)
 
-        # Timestamp in milliseconds since epoch for the start of the previous month
-        start_datetime = datetime.datetime.combine(first_day_previous_month, datetime.time.min)
-        # Convert to UTC epoch time in milliseconds as required by the API
-        timestamp_ms = int(start_datetime.replace(tzinfo=datetime.timezone.utc).timestamp() * 1000)
+        # UTC epoch milliseconds for the start of the previous month, as
+        # required by the API; timegm works on a plain struct_time tuple so
+        # no intermediate datetimes or tz-aware conversions are needed
+        timestamp_ms = calendar.timegm((year, month, 1, 0, 0, 0, 0, 0, 0)) * 1000
 
-        report_month_str = first_day_previous_month.strftime('%Y-%m-%d')
+        report_month_str = f"{year:04d}-{month:02d}-01"
         return timestamp_ms, report_month_str
     
     def get_fleet_scores(self, access_token: str, timestamp_ms: int) -> Optional[List[Dict[str, Any]]]:
@@ -142,10 +213,7 @@ class NetradyneAPIClient:
         Returns:
             List of score dictionaries or None if retrieval failed.
         """
-        headers = {
-            'Accept-Language': 'en-US',
-            'Authorization': f'Bearer {access_token}'
-        }
+        headers = {'Authorization': f'Bearer {access_token}'}
         params = {
             'time': timestamp_ms,
             'interval': 'monthly',
@@ -153,10 +221,10 @@ class NetradyneAPIClient:
         }
         
         try:
-            response = requests.get(
-                self.api_config["score_url_template"], 
-                headers=headers, 
-                params=params, 
+            response = self.session.get(
+                self.api_config["score_url_template"],
+                headers=headers,
+                params=params,
                 timeout=60
             )
             response.raise_for_status()
@@ -164,16 +232,16 @@ class NetradyneAPIClient:
             scores = score_data.get('data', {}).get('scores')
             
             if scores is not None:  # Check for None explicitly, as empty list is valid
-                logging.info(f"Successfully retrieved {len(scores)} driver scores.")
+                logger.info("Successfully retrieved %s driver scores.", len(scores))
                 return scores
             else:
-                logging.error(f"Could not extract scores from response: {score_data}")
+                logger.error("Could not extract scores from response: %s", score_data)
                 return None
         except requests.exceptions.RequestException as e:
-            logging.error(f"Error getting fleet scores: {e}")
+            logger.error("Error getting fleet scores: %s", e)
             return None
         except Exception as e:
-            logging.error(f"An unexpected error occurred while processing score data: {e}")
+            logger.error("An unexpected error occurred while processing score data: %s", e)
             return None
     
     def fetch_driver_scores(self) -> Optional[Tuple[List[Dict[str, Any]], str]]:
@@ -186,18 +254,18 @@ class NetradyneAPIClient:
         try:
             # Get previous month details
             timestamp_ms, report_month = self.get_previous_month_details()
-            logging.info(f"Targeting report month: {report_month} (Timestamp: {timestamp_ms})")
+            logger.info("Targeting report month: %s (Timestamp: %s)", report_month, timestamp_ms)
             
             # Get authentication token
             access_token = self.get_auth_token()
             if not access_token:
-                logging.error("Failed to obtain authentication token")
+                logger.error("Failed to obtain authentication token")
                 return None
             
             # Fetch scores
             raw_scores = self.get_fleet_scores(access_token, timestamp_ms)
             if raw_scores is None:
-                logging.error("Failed to retrieve scores from API")
+                logger.error("Failed to retrieve scores from API")
                 return None
             
             # Process scores into standardized format
@@ -215,11 +283,159 @@ class NetradyneAPIClient:
                         'driver_score': driver_score
                     })
                 else:
-                    logging.warning(f"Skipping score entry due to missing data: {score_entry}")
+                    logger.warning("Skipping score entry due to missing data: %s", score_entry)
             
-            logging.info(f"Processed {len(processed_scores)} valid driver scores.")
+            logger.info("Processed %s valid driver scores.", len(processed_scores))
             return processed_scores, report_month
             
         except Exception as e:
-            logging.error(f"Error in fetch_driver_scores workflow: {e}")
-            return None 
\ No newline at end of file
+            logger.error("Error in fetch_driver_scores workflow: %s", e)
+            return None
+
+
+class AsyncNetradyneAPIClient:
+    """
+    Asyncio variant of NetradyneAPIClient for batch workloads.
+
+    Useful when fetching scores for several months or fleets: requests
+    overlap on one keep-alive connection pool, so wall-clock collapses
+    from the sum of round trips to roughly the slowest one. Requires the
+    optional aiohttp dependency; single-month runs can stay on the
+    blocking client.
+    """
+
+    # Upper bound on in-flight requests so a large month list cannot
+    # overwhelm the API or local sockets
+    MAX_CONCURRENT_REQUESTS = 64
+
+    def __init__(self, config_manager: ConfigManager):
+        """
+        Initialize the async Netradyne API client.
+
+        Args:
+            config_manager: Configuration manager instance.
+
+        Raises:
+            ImportError: If aiohttp is not installed.
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for AsyncNetradyneAPIClient")
+        self.config_manager = config_manager
+        self.api_config = config_manager.netradyne_api_config
+        self._session: Optional['aiohttp.ClientSession'] = None
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+    async def __aenter__(self):
+        """Open the HTTP session on context entry."""
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=self.MAX_CONCURRENT_REQUESTS,
+                keepalive_timeout=30
+            ),
+            headers={'Accept-Language': 'en-US'}
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the HTTP session on context exit."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_json(self, method: str, url: str, **kwargs) -> Optional[Dict[str, Any]]:
+        """
+        Issue one request under the concurrency gate and decode JSON.
+
+        Args:
+            method: HTTP method name ('get' or 'post').
+            url: Request URL.
+            **kwargs: Extra arguments for the aiohttp request.
+
+        Returns:
+            Decoded response payload or None if the request failed.
+        """
+        async with self._semaphore:
+            try:
+                async with self._session.request(method, url, **kwargs) as response:
+                    response.raise_for_status()
+                    return await response.json()
+            except aiohttp.ClientError as e:
+                logger.error("Error requesting %s: %s", url, e)
+                return None
+
+    async def get_auth_token(self) -> Optional[str]:
+        """
+        Gets an auth token, reusing an existing one or creating a new one.
+
+        Returns:
+            Access token string or None if authentication failed.
+        """
+        headers = {'Authorization': f'Basic {self.api_config["basic_auth"]}'}
+
+        token_data = await self._get_json(
+            'get', self.api_config["auth_url"] + 's', headers=headers, timeout=30
+        )
+        if token_data:
+            cutoff = time.time() * 1000
+            valid_tokens = [
+                t for t in token_data.get('data', [])
+                if t.get('expiresOn', 0) > cutoff
+            ]
+            if valid_tokens:
+                selected_token = max(valid_tokens, key=lambda t: t.get('expiresOn', 0))
+                access_token = selected_token.get('accessToken')
+                if access_token:
+                    return access_token
+
+        logger.info("No valid existing tokens found, requesting new auth token...")
+        token_data = await self._get_json(
+            'post', self.api_config["auth_url"], headers=headers, timeout=30
+        )
+        if token_data:
+            return token_data.get('data', {}).get('accessToken')
+        return None
+
+    async def get_fleet_scores(self, access_token: str, timestamp_ms: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetches fleet scores for the month starting at timestamp_ms.
+
+        Args:
+            access_token: Valid authentication token.
+            timestamp_ms: Timestamp in milliseconds for the target month.
+
+        Returns:
+            List of score dictionaries or None if retrieval failed.
+        """
+        score_data = await self._get_json(
+            'get',
+            self.api_config["score_url_template"],
+            headers={'Authorization': f'Bearer {access_token}'},
+            params={'time': timestamp_ms, 'interval': 'monthly', 'limit': 1000},
+            timeout=60
+        )
+        if score_data is None:
+            return None
+
+        scores = score_data.get('data', {}).get('scores')
+        if scores is None:
+            logger.error("Could not extract scores from response: %s", score_data)
+        return scores
+
+    async def fetch_months(self, timestamps_ms: List[int]) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Fetch fleet scores for several months concurrently.
+
+        Args:
+            timestamps_ms: Month-start timestamps in milliseconds.
+
+        Returns:
+            Per-month score lists in input order (None where a fetch failed).
+        """
+        access_token = await self.get_auth_token()
+        if not access_token:
+            logger.error("Failed to obtain authentication token")
+            return [None] * len(timestamps_ms)
+
+        return await asyncio.gather(*[
+            self.get_fleet_scores(access_token, ts) for ts in timestamps_ms
+        ])
\ No newline at end of file
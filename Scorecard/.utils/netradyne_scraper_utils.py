@@ -6,6 +6,7 @@ import os
 import time
 import datetime
 import logging
+import requests
 from typing import Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -17,25 +18,73 @@ from .config_utils import ConfigManager
 
 class NetradyneScraper:
     """Web scraper for downloading Netradyne data files."""
-    
-    def __init__(self, config_manager: ConfigManager):
+
+    # Injected once per page: counts in-flight fetch/XHR requests so waits
+    # can key off actual network activity instead of fixed sleeps
+    NETWORK_TRACKER_JS = """
+        if (window._netPending === undefined) {
+            window._netPending = 0;
+            const origFetch = window.fetch;
+            window.fetch = function() {
+                window._netPending++;
+                return origFetch.apply(this, arguments)
+                    .finally(() => window._netPending--);
+            };
+            const origOpen = XMLHttpRequest.prototype.open;
+            XMLHttpRequest.prototype.open = function() {
+                this.addEventListener('loadend', () => window._netPending--);
+                window._netPending++;
+                return origOpen.apply(this, arguments);
+            };
+        }
+    """
+
+
+    # chromedriver Service shared across instances, so repeated downloads
+    # in one process reuse the already-resolved driver binary instead of
+    # paying the lookup/startup cost each time
+    _service: Optional[Service] = None
+
+    def __init__(self, config_manager: ConfigManager, keep_alive: bool = False):
         """
         Initialize Netradyne scraper.
-        
+
         Args:
             config_manager: Configuration manager instance.
+            keep_alive: Keep the browser open between downloads (for
+                multi-account/multi-month runs); cookies are cleared
+                between iterations and shutdown() closes it for real.
         """
         self.config_manager = config_manager
         self.web_config = config_manager.netradyne_web_config
         self.driver: Optional[webdriver.Chrome] = None
-    
-    def setup_driver(self) -> webdriver.Chrome:
+        self.keep_alive = keep_alive
+
+    def setup_driver(self, download_dir: Optional[str] = None) -> webdriver.Chrome:
         """
         Setup and configure Chrome WebDriver.
-        
+
+        Args:
+            download_dir: Directory Chrome should download into. When set,
+                files land directly in the target directory, so no
+                post-download move (which becomes a full copy across
+                filesystems) is needed.
+
         Returns:
             Configured Chrome WebDriver instance.
         """
+        if self.driver is not None:
+            # Kept-alive browser: reset auth state and repoint downloads
+            # instead of respawning Chrome (~1-2 s per launch)
+            self.driver.delete_all_cookies()
+            if download_dir:
+                os.makedirs(download_dir, exist_ok=True)
+                self.driver.execute_cdp_cmd('Page.setDownloadBehavior', {
+                    'behavior': 'allow',
+                    'downloadPath': os.path.abspath(download_dir)
+                })
+            return self.driver
+
         options = webdriver.ChromeOptions()
         prefs = {
             "profile.default_content_setting_values.notifications": 2,
@@ -43,10 +92,41 @@ class NetradyneScraper:
             "download.directory_upgrade": True,
             "safebrowsing.enabled": True
         }
+        if download_dir:
+            os.makedirs(download_dir, exist_ok=True)
+            prefs["download.default_directory"] = os.path.abspath(download_dir)
         options.add_experimental_option("prefs", prefs)
-        
-        self.driver = webdriver.Chrome(options=options)
+
+        if NetradyneScraper._service is None:
+            NetradyneScraper._service = Service()
+        self.driver = webdriver.Chrome(service=NetradyneScraper._service, options=options)
+        # Turn on the DevTools network domain so request activity is
+        # observable while the console loads data
+        self.driver.execute_cdp_cmd('Network.enable', {})
         return self.driver
+
+    def _install_network_tracker(self) -> None:
+        """Install the fetch/XHR counter on the current page."""
+        self.driver.execute_script(self.NETWORK_TRACKER_JS)
+
+    def _wait_for_network_idle(self, timeout: float = 10.0) -> None:
+        """
+        Wait until the page has no in-flight fetch/XHR requests.
+
+        Polls the counter installed by _install_network_tracker every
+        100 ms, so the wait ends as soon as the data actually arrives
+        rather than after a fixed worst-case sleep.
+
+        Args:
+            timeout: Maximum seconds to wait before giving up.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            pending = self.driver.execute_script("return window._netPending || 0")
+            if not pending:
+                return
+            time.sleep(0.1)
+        logging.warning("Timed out waiting for network idle; continuing.")
     
     def login_to_netradyne(self) -> bool:
         """
@@ -59,25 +139,25 @@ class NetradyneScraper:
             self.driver.get(self.web_config['login_url'])
             
             # Enter username
-            username_field = WebDriverWait(self.driver, 10).until(
+            username_field = WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "input[id='loginUserName']"))
             )
             username_field.send_keys(self.web_config['username'])
             
             # Click continue
-            continue_button = WebDriverWait(self.driver, 10).until(
+            continue_button = WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
                 EC.element_to_be_clickable((By.XPATH, '//button[@id="login-submit-button"]'))
             )
             continue_button.click()
             
             # Enter password
-            password_field = WebDriverWait(self.driver, 10).until(
+            password_field = WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
                 EC.element_to_be_clickable((By.XPATH, '//input[@type="password"]'))
             )
             password_field.send_keys(self.web_config['password'])
             
             # Click continue again
-            continue_button = WebDriverWait(self.driver, 10).until(
+            continue_button = WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
                 EC.element_to_be_clickable((By.XPATH, '//button[@id="login-submit-button"]'))
             )
             continue_button.click()
@@ -91,10 +171,9 @@ class NetradyneScraper:
     
     def handle_popups(self) -> None:
         """Handle any popups that might appear after login."""
-        time.sleep(4)
         try:
             # Handle "I'll do this later" popup
-            later_button = WebDriverWait(self.driver, 10).until(
+            later_button = WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
                 EC.element_to_be_clickable((By.XPATH, '//button[text()="I\'ll do this later"]'))
             )
             later_button.click()
@@ -111,39 +190,42 @@ class NetradyneScraper:
         """
         try:
             # Navigate to drivers section
-            drivers_icon = WebDriverWait(self.driver, 10).until(
+            drivers_icon = WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
                 EC.element_to_be_clickable((By.XPATH, '//li[@id="navbar-drivers-icon"]'))
             )
             drivers_icon.click()
             
             # Click duration filter
-            duration_filter = WebDriverWait(self.driver, 10).until(
+            duration_filter = WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
                 EC.element_to_be_clickable((By.XPATH, '//div[@id="tour-alert-panel-duration-filter"]'))
             )
             duration_filter.click()
             
-            # Select "Last Month"
-            last_month_option = WebDriverWait(self.driver, 10).until(
+            # Select "Last Month"; install the request counter first so the
+            # reload it triggers is tracked from the start
+            last_month_option = WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
                 EC.element_to_be_clickable((By.XPATH, '//span[text()="Last Month"]'))
             )
+            self._install_network_tracker()
             last_month_option.click()
-            
-            time.sleep(5)  # Wait for data to load
-            
+
+            # Wait for the data requests to finish instead of a fixed sleep
+            self._wait_for_network_idle()
+
             # Click export button twice (seems to be needed based on original code)
-            export_button = WebDriverWait(self.driver, 15).until(
+            export_button = WebDriverWait(self.driver, 15, poll_frequency=0.1).until(
                 EC.element_to_be_clickable((By.XPATH, '//button[@id="tour-export-driver-data"]'))
             )
             export_button.click()
             
             # Second click
-            export_button = WebDriverWait(self.driver, 15).until(
+            export_button = WebDriverWait(self.driver, 15, poll_frequency=0.1).until(
                 EC.element_to_be_clickable((By.XPATH, '//button[@id="tour-export-driver-data"]'))
             )
             export_button.click()
-            
-            time.sleep(4)  # Wait for download to initiate
-            
+
+            # No fixed post-click sleep: wait_for_download polls for the
+            # file (and the absence of .crdownload) in the target directory
             logging.info("Successfully initiated download from Netradyne portal.")
             return True
             
@@ -152,89 +234,193 @@ class NetradyneScraper:
             return False
     
     def cleanup(self) -> None:
-        """Close the WebDriver."""
+        """
+        Release the WebDriver between downloads.
+
+        With keep_alive set, the browser stays open for the next
+        account/month and only its cookies are cleared; otherwise the
+        driver is shut down.
+        """
+        if self.driver is None:
+            return
+        if self.keep_alive:
+            try:
+                self.driver.delete_all_cookies()
+            except Exception as e:
+                logging.warning(f"Failed to clear cookies on kept-alive driver: {e}")
+            return
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Close the WebDriver unconditionally."""
         if self.driver:
             self.driver.quit()
             self.driver = None
             logging.info("WebDriver closed.")
     
-    def get_expected_filename(self) -> str:
+    def get_expected_filename(self, now: Optional[datetime.datetime] = None) -> str:
         """
         Generate the expected filename for the downloaded CSV.
-        
+
+        Args:
+            now: Reference time; defaults to the current time. Callers that
+                also derive other names from the clock should pass one
+                shared value so the names cannot straddle midnight.
+
         Returns:
             Expected filename string.
         """
-        today = datetime.datetime.now()
-        formatted_date = today.strftime('%b-%d-%Y')
+        if now is None:
+            now = datetime.datetime.now()
+        formatted_date = now.strftime('%b-%d-%Y')
         return f'Drivers-Report({formatted_date}).csv'
     
-    def move_downloaded_file(self, target_dir: str = 'netradyne_score_data') -> Optional[str]:
+    def wait_for_download(self, target_dir: str = 'netradyne_score_data',
+                          timeout: float = 60.0) -> Optional[str]:
         """
-        Move the downloaded file to the target directory.
-        
+        Wait for the export to finish landing in the target directory.
+
+        Chrome downloads straight into target_dir (see setup_driver), so
+        instead of moving the file from a default download folder this
+        polls until the expected report appears and Chrome's .crdownload
+        temp file is gone, then renames it in place.
+
         Args:
-            target_dir: Target directory for the file.
-        
+            target_dir: Directory Chrome was told to download into.
+            timeout: Seconds to wait before giving up.
+
         Returns:
-            Path to the moved file or None if failed.
+            Path to the renamed file or None if failed.
         """
+        # One clock read feeds both the expected source name and the
+        # timestamped target name, so a run straddling midnight cannot
+        # derive them from different days
+        now = datetime.datetime.now()
+        expected_filename = self.get_expected_filename(now)
+        source_path = os.path.join(target_dir, expected_filename)
+
         try:
-            expected_filename = self.get_expected_filename()
-            source_path = os.path.join(self.web_config['download_dir'], expected_filename)
-            
-            # Create target directory if it doesn't exist
-            os.makedirs(target_dir, exist_ok=True)
-            
-            # Generate target filename with timestamp
-            yesterday = (datetime.datetime.now() - datetime.timedelta(days=1)).strftime('%Y%m%d')
-            target_filename = f'netradyne_{yesterday}.csv'
-            target_path = os.path.join(target_dir, target_filename)
-            
-            # Move the file
-            if os.path.exists(source_path):
-                os.rename(source_path, target_path)
-                logging.info(f"Successfully moved file to: {target_path}")
-                return target_path
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                in_progress = any(
+                    name.endswith('.crdownload') for name in os.listdir(target_dir)
+                )
+                if os.path.exists(source_path) and not in_progress:
+                    break
+                time.sleep(0.5)
             else:
                 logging.error(f"Downloaded file not found: {source_path}")
                 return None
-                
+
+            # Rename in place to the timestamped name; source and target
+            # share a filesystem so this is a metadata-only operation
+            yesterday = (now - datetime.timedelta(days=1)).strftime('%Y%m%d')
+            target_path = os.path.join(target_dir, f'netradyne_{yesterday}.csv')
+            os.replace(source_path, target_path)
+            logging.info(f"Download complete: {target_path}")
+            return target_path
+
         except Exception as e:
-            logging.error(f"Failed to move downloaded file: {e}")
+            logging.error(f"Failed to finalize downloaded file: {e}")
             return None
     
+    def export_via_http(self, target_dir: str = 'netradyne_score_data') -> Optional[str]:
+        """
+        Download the drivers report over HTTP using the session cookies.
+
+        Logs in once through the browser, copies its cookies into a
+        requests.Session, and hits the export endpoint directly — no DOM
+        waits, no export clicks, no download-directory polling. The
+        browser is only kept alive long enough to authenticate.
+
+        Args:
+            target_dir: Directory to save the downloaded file.
+
+        Returns:
+            Path to the downloaded file or None if failed.
+        """
+        export_url = self.web_config.get('export_url')
+        if not export_url:
+            return None
+
+        try:
+            self.setup_driver()
+            if not self.login_to_netradyne():
+                return None
+            self.handle_popups()
+
+            session = requests.Session()
+            for cookie in self.driver.get_cookies():
+                session.cookies.set(cookie['name'], cookie['value'],
+                                    domain=cookie.get('domain'))
+            self.cleanup()
+
+            os.makedirs(target_dir, exist_ok=True)
+            yesterday = (datetime.datetime.now() - datetime.timedelta(days=1)).strftime('%Y%m%d')
+            target_path = os.path.join(target_dir, f'netradyne_{yesterday}.csv')
+
+            response = session.get(
+                export_url,
+                params={'interval': 'monthly'},
+                stream=True,
+                timeout=60
+            )
+            response.raise_for_status()
+            with open(target_path, 'wb') as f:
+                for chunk in response.iter_content(1 << 20):
+                    f.write(chunk)
+
+            logging.info(f"Exported drivers report via HTTP to: {target_path}")
+            return target_path
+
+        except Exception as e:
+            logging.error(f"HTTP export failed: {e}")
+            return None
+        finally:
+            self.cleanup()
+
     def download_netradyne_file(self, target_dir: str = 'netradyne_score_data') -> Optional[str]:
         """
         Complete workflow to download Netradyne file.
-        
+
+        Prefers the direct HTTP export when an export URL is configured;
+        falls back to driving the browser export when it is not, when
+        use_browser_export is set, or when the HTTP path fails.
+
         Args:
             target_dir: Directory to save the downloaded file.
-        
+
         Returns:
             Path to the downloaded file or None if failed.
         """
+        if self.web_config.get('export_url') and not self.web_config.get('use_browser_export'):
+            exported_path = self.export_via_http(target_dir)
+            if exported_path:
+                return exported_path
+            logging.warning("HTTP export unavailable, falling back to browser export.")
+
         try:
-            # Setup driver
-            self.setup_driver()
-            
+            # Setup driver, downloading straight into the target directory
+            self.setup_driver(download_dir=target_dir)
+
             # Login
             if not self.login_to_netradyne():
                 return None
-            
+
             # Handle popups
             self.handle_popups()
-            
+
             # Navigate and download
             if not self.navigate_and_download():
                 return None
-            
+
+            # Wait for the export to land, then rename it in place
+            downloaded_file_path = self.wait_for_download(target_dir)
+
             # Close browser
             self.cleanup()
-            
-            # Move file to target location
-            moved_file_path = self.move_downloaded_file(target_dir)
-            return moved_file_path
+
+            return downloaded_file_path
             
         except Exception as e:
             logging.error(f"Error in download workflow: {e}")
@@ -248,4 +434,4 @@ class NetradyneScraper:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.cleanup() 
\ No newline at end of file
+        self.shutdown() 
\ No newline at end of file
@@ -2,16 +2,66 @@
 Score Card processing utilities for driver performance evaluation.
 """
 
+import os
 import logging
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from .config_utils import ConfigManager
 
+logger = logging.getLogger(__name__)
+
+# pyarrow is optional; when present, callers can keep scorecard data in
+# Arrow tables end-to-end instead of exploding rows into Python dicts
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+# Scorecard typically has these columns (adjust as needed)
+COLUMN_MAPPING = {
+    'Driver ID': ['Driver ID', 'driver_id', 'DriverID', 'ID', 'Employee_ID'],
+    'Driver Name': ['Driver Name', 'driver_name', 'DriverName', 'Name', 'Employee_Name'],
+    'Period': ['Period', 'period', 'Report_Period', 'Month', 'Date'],
+    'Safety Score': ['Safety Score', 'safety_score', 'SafetyScore', 'Safety'],
+    'HOS Score': ['HOS Score', 'hos_score', 'HOSScore', 'HOS'],
+    'Vehicle Score': ['Vehicle Score', 'vehicle_score', 'VehicleScore', 'Vehicle'],
+    'Overall Score': ['Overall Score', 'overall_score', 'OverallScore', 'Total', 'Final_Score'],
+    'Miles Driven': ['Miles Driven', 'miles_driven', 'MilesDriven', 'Miles', 'Total_Miles'],
+    'Incidents': ['Incidents', 'incidents', 'Incident_Count', 'Total_Incidents'],
+    'Violations': ['Violations', 'violations', 'Violation_Count', 'Total_Violations']
+}
+
 
 class ScorecardProcessor:
     """Processes driver performance scorecard data."""
-    
+
+    # Standardized output columns, grouped by how they are cast
+    STR_COLS = ['driver_id', 'driver_name', 'period']
+    FLOAT_COLS = ['safety_score', 'hos_score', 'vehicle_score', 'overall_score', 'miles_driven']
+    INT_COLS = ['incidents', 'violations']
+
+    # Known dtypes for the numeric columns (canonical names), applied after
+    # the alias rename so the frame is typed once at the reader boundary
+    NUMERIC_DTYPES = {
+        'Safety Score': 'float64',
+        'HOS Score': 'float64',
+        'Vehicle Score': 'float64',
+        'Overall Score': 'float64',
+        'Miles Driven': 'float64',
+        'Incidents': 'Int64',
+        'Violations': 'Int64',
+    }
+
+    # CSVs above this size are streamed in row chunks instead of being
+    # loaded whole, so peak memory stays bounded on big monthly rollups
+    CHUNKED_CSV_BYTES = 100 * 1024 * 1024
+    CSV_CHUNK_ROWS = 50_000
+
+
     def __init__(self, config_manager: ConfigManager):
         """
         Initialize scorecard processor.
@@ -20,7 +70,15 @@ class ScorecardProcessor:
             config_manager: Configuration manager instance.
         """
         self.config_manager = config_manager
-        
+        # Reverse alias lookup built once: lowercased alias -> canonical
+        # name, so each file's columns resolve in a single O(columns) pass
+        # and matching is case-insensitive
+        self._alias_to_target = {
+            alias.lower(): target
+            for target, aliases in COLUMN_MAPPING.items()
+            for alias in aliases
+        }
+
     def find_scorecard_files(self, directory: str = "scorecard_data") -> List[str]:
         """
         Find scorecard files in the specified directory.
@@ -31,131 +89,238 @@ class ScorecardProcessor:
         Returns:
             List of file paths found.
         """
-        directory_path = Path(directory)
-        
-        if not directory_path.exists():
-            logging.warning(f"Directory does not exist: {directory}")
+        if not os.path.isdir(directory):
+            logger.warning("Directory does not exist: %s", directory)
             return []
-        
-        # Look for Excel and CSV files
-        files = list(directory_path.glob('*.xlsx'))
-        files.extend(list(directory_path.glob('*.xls')))
-        files.extend(list(directory_path.glob('*.csv')))
-        
-        file_paths = [str(file_path) for file_path in files]
-        
-        logging.info(f"Found {len(file_paths)} scorecard files in {directory}")
-        for file_path in file_paths:
-            logging.debug(f"  - {Path(file_path).name}")
-        
+
+        # One scandir pass filtering on suffix instead of three glob walks
+        # (each glob re-traverses the directory and fnmatches every entry)
+        exts = {'.xlsx', '.xls', '.csv'}
+        with os.scandir(directory) as entries:
+            file_paths = sorted(
+                entry.path for entry in entries
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in exts
+            )
+
+        logger.info("Found %s scorecard files in %s", len(file_paths), directory)
+        if logger.isEnabledFor(logging.DEBUG):
+            for file_path in file_paths:
+                logger.debug("  - %s", os.path.basename(file_path))
+
         return file_paths
     
+    def _normalize_scorecard_frame(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Resolve aliases, type and clean a raw scorecard frame.
+
+        Args:
+            df: Raw DataFrame as read from disk.
+
+        Returns:
+            Normalized DataFrame or None if required columns are missing.
+        """
+        # Resolve aliases to canonical names in one case-insensitive
+        # pass over the header instead of a targets x aliases scan
+        df.columns = [
+            self._alias_to_target.get(c.strip().lower(), c) for c in df.columns
+        ]
+
+        # Check for required columns
+        required_cols = ['Driver ID', 'Period', 'Overall Score']
+        missing_cols = [col for col in required_cols if col not in df.columns]
+        if missing_cols:
+            logger.error("Missing required columns: %s", missing_cols)
+            logger.info("Available columns: %s", list(df.columns))
+            return None
+
+        # Type the known numeric columns once at the boundary, coercing
+        # bad cells to NaN rather than leaving object columns behind
+        for column, dtype in self.NUMERIC_DTYPES.items():
+            if column in df.columns:
+                df[column] = pd.to_numeric(df[column], errors='coerce').astype(dtype)
+
+        # Clean column names
+        df.columns = [c.replace(' ', '_').lower() for c in df.columns]
+
+        # Fill NaN values per column type: 0 for numerics, '' for strings,
+        # so string columns do not end up holding integer zeros
+        fill_values = {
+            column: (0 if pd.api.types.is_numeric_dtype(df[column]) else '')
+            for column in df.columns
+        }
+        df.fillna(fill_values, inplace=True)
+        return df
+
     def read_scorecard_file(self, file_path: str) -> Optional[pd.DataFrame]:
         """
         Read and process scorecard file (Excel or CSV).
-        
+
         Args:
             file_path: Path to file.
-        
+
         Returns:
             Processed DataFrame or None if failed.
         """
         try:
-            logging.info(f"Reading scorecard file: {file_path}")
-            
+            logger.info("Reading scorecard file: %s", file_path)
+
             file_ext = Path(file_path).suffix.lower()
-            
+
             if file_ext == '.csv':
-                df = pd.read_csv(file_path)
+                # The pyarrow engine parses multi-threaded; fall back to the
+                # C engine when pyarrow is not installed
+                try:
+                    df = pd.read_csv(file_path, engine='pyarrow')
+                except (ImportError, ValueError):
+                    df = pd.read_csv(file_path)
             elif file_ext in ['.xlsx', '.xls']:
                 df = pd.read_excel(file_path)
             else:
-                logging.error(f"Unsupported file format: {file_ext}")
-                return None
-            
-            # Scorecard typically has these columns (adjust as needed)
-            column_mapping = {
-                'Driver ID': ['Driver ID', 'driver_id', 'DriverID', 'ID', 'Employee_ID'],
-                'Driver Name': ['Driver Name', 'driver_name', 'DriverName', 'Name', 'Employee_Name'],
-                'Period': ['Period', 'period', 'Report_Period', 'Month', 'Date'],
-                'Safety Score': ['Safety Score', 'safety_score', 'SafetyScore', 'Safety'],
-                'HOS Score': ['HOS Score', 'hos_score', 'HOSScore', 'HOS'],
-                'Vehicle Score': ['Vehicle Score', 'vehicle_score', 'VehicleScore', 'Vehicle'],
-                'Overall Score': ['Overall Score', 'overall_score', 'OverallScore', 'Total', 'Final_Score'],
-                'Miles Driven': ['Miles Driven', 'miles_driven', 'MilesDriven', 'Miles', 'Total_Miles'],
-                'Incidents': ['Incidents', 'incidents', 'Incident_Count', 'Total_Incidents'],
-                'Violations': ['Violations', 'violations', 'Violation_Count', 'Total_Violations']
-            }
-            
-            # Try to find and rename columns
-            for target_col, possible_names in column_mapping.items():
-                for possible_name in possible_names:
-                    if possible_name in df.columns:
-                        df = df.rename(columns={possible_name: target_col})
-                        break
-            
-            # Check for required columns
-            required_cols = ['Driver ID', 'Period', 'Overall Score']
-            missing_cols = [col for col in required_cols if col not in df.columns]
-            if missing_cols:
-                logging.error(f"Missing required columns: {missing_cols}")
-                logging.info(f"Available columns: {list(df.columns)}")
+                logger.error("Unsupported file format: %s", file_ext)
                 return None
-            
-            # Clean column names
-            df.columns = [c.replace(' ', '_').lower() for c in df.columns]
-            
-            # Fill NaN values
-            df = df.fillna(0)
-            
-            logging.info(f"Successfully processed scorecard file. Shape: {df.shape}")
+
+            df = self._normalize_scorecard_frame(df)
+            if df is not None:
+                logger.info("Successfully processed scorecard file. Shape: %s", df.shape)
             return df
-            
+
         except Exception as e:
-            logging.error(f"Error reading scorecard file {file_path}: {e}")
+            logger.error("Error reading scorecard file %s: %s", file_path, e)
+            return None
+
+    def read_scorecard_table(self, file_path: str) -> Optional['pa.Table']:
+        """
+        Read a scorecard file as a pyarrow Table.
+
+        For columnar consumers (Arrow-native DB drivers, DuckDB, parquet
+        dumps) this avoids materializing per-row dicts entirely — the
+        Arrow buffers are consumable zero-copy. Requires the optional
+        pyarrow dependency.
+
+        Args:
+            file_path: Path to file.
+
+        Returns:
+            Arrow Table or None if pyarrow is missing or the read failed.
+        """
+        if pa is None:
+            logger.error("pyarrow is not installed; cannot build an Arrow table")
             return None
+        df = self.read_scorecard_file(file_path)
+        if df is None:
+            return None
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+    @staticmethod
+    def to_records(table: 'pa.Table') -> List[Dict[str, Any]]:
+        """
+        Convert an Arrow table to the legacy list-of-dicts format.
+
+        Args:
+            table: Arrow Table of scorecard rows.
+
+        Returns:
+            List of scorecard dictionaries.
+        """
+        return table.to_pylist()
+
+    def iter_scorecard_frames(self, file_path: str):
+        """
+        Yield normalized frames for a file, chunked when the CSV is large.
+
+        CSVs above CHUNKED_CSV_BYTES are streamed in CSV_CHUNK_ROWS pieces
+        so peak memory stays O(chunk) instead of O(file); smaller files and
+        Excel workbooks come through as a single frame via
+        read_scorecard_file.
+
+        Args:
+            file_path: Path to file.
+
+        Yields:
+            Normalized DataFrames (nothing if the file could not be read).
+        """
+        is_large_csv = (
+            Path(file_path).suffix.lower() == '.csv'
+            and os.path.getsize(file_path) > self.CHUNKED_CSV_BYTES
+        )
+        if not is_large_csv:
+            df = self.read_scorecard_file(file_path)
+            if df is not None:
+                yield df
+            return
+
+        logger.info("Reading scorecard file in chunks: %s", file_path)
+        try:
+            # chunksize forces the C engine; pyarrow does not stream
+            for chunk in pd.read_csv(file_path, chunksize=self.CSV_CHUNK_ROWS):
+                chunk = self._normalize_scorecard_frame(chunk)
+                if chunk is None:
+                    # Required columns missing — every chunk shares the
+                    # header, so there is no point reading further
+                    return
+                yield chunk
+        except Exception as e:
+            logger.error("Error reading scorecard file %s: %s", file_path, e)
     
+    def to_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Clean and validate scorecard data, keeping it as a DataFrame.
+
+        Preferred input for bulk loaders: the typed frame can go straight
+        to df.to_sql(..., method='multi', chunksize=1000) or an
+        executemany over df.itertuples without a detour through per-row
+        dicts.
+
+        Args:
+            df: DataFrame containing scorecard data.
+
+        Returns:
+            Cleaned DataFrame with the standardized columns, invalid rows
+            dropped.
+        """
+        # Ensure every target column exists so the casts below never
+        # KeyError; string columns backfill with '' (a 0 would survive
+        # the astype(str) below as a literal '0'), numeric ones with 0
+        all_columns = self.STR_COLS + self.FLOAT_COLS + self.INT_COLS
+        str_cols = set(self.STR_COLS)
+        for column in all_columns:
+            if column not in df.columns:
+                df[column] = '' if column in str_cols else 0
+
+        # Vectorized casts: one C-level pass per column instead of a Series
+        # allocation and nine boxed conversions per row
+        for column in self.STR_COLS:
+            df[column] = df[column].astype(str).str.strip()
+        df[self.FLOAT_COLS] = df[self.FLOAT_COLS].apply(pd.to_numeric, errors='coerce').fillna(0).astype('float64')
+        df[self.INT_COLS] = df[self.INT_COLS].apply(pd.to_numeric, errors='coerce').fillna(0).astype('int64')
+
+        # Validate required fields for the whole frame at once
+        mask = (
+            df['driver_id'].ne('') & df['driver_id'].ne('nan')
+            & df['period'].ne('') & df['period'].ne('nan')
+        )
+        skipped = int((~mask).sum())
+        if skipped:
+            logger.warning("Skipping %s rows due to missing required data", skipped)
+
+        return df.loc[mask, all_columns]
+
     def process_scorecard_dataframe(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
         """
         Convert DataFrame to standardized scorecard format.
-        
+
+        Legacy dict-per-row path; callers that bulk-load into a database
+        should use to_dataframe instead and keep the data columnar.
+
         Args:
             df: DataFrame containing scorecard data.
-        
+
         Returns:
             List of scorecard dictionaries.
         """
-        scorecards = []
-        
-        for index, row in df.iterrows():
-            try:
-                scorecard_data = {
-                    'driver_id': str(row.get('driver_id', '')).strip(),
-                    'driver_name': str(row.get('driver_name', '')).strip(),
-                    'period': str(row.get('period', '')).strip(),
-                    'safety_score': float(row.get('safety_score', 0)),
-                    'hos_score': float(row.get('hos_score', 0)),
-                    'vehicle_score': float(row.get('vehicle_score', 0)),
-                    'overall_score': float(row.get('overall_score', 0)),
-                    'miles_driven': float(row.get('miles_driven', 0)),
-                    'incidents': int(row.get('incidents', 0)),
-                    'violations': int(row.get('violations', 0))
-                }
-                
-                # Validate required fields
-                if scorecard_data['driver_id'] and scorecard_data['period']:
-                    scorecards.append(scorecard_data)
-                else:
-                    logging.warning(f"Skipping row {index} due to missing required data")
-                    
-            except (ValueError, TypeError) as e:
-                logging.warning(f"Skipping row {index} due to data conversion error: {e}")
-                continue
-            except Exception as e:
-                logging.warning(f"Skipping row {index} due to processing error: {e}")
-                continue
-        
-        logging.info(f"Processed {len(scorecards)} valid scorecard records")
+        scorecards = self.to_dataframe(df).to_dict(orient='records')
+
+        logger.info("Processed %s valid scorecard records", len(scorecards))
         return scorecards
     
     def calculate_performance_metrics(self, scorecards: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -170,20 +335,28 @@ class ScorecardProcessor:
         """
         if not scorecards:
             return {}
-        
-        import statistics
-        
-        # Extract numeric scores
-        overall_scores = [s['overall_score'] for s in scorecards if s['overall_score'] > 0]
-        safety_scores = [s['safety_score'] for s in scorecards if s['safety_score'] > 0]
-        total_miles = sum(s['miles_driven'] for s in scorecards)
-        total_incidents = sum(s['incidents'] for s in scorecards)
-        total_violations = sum(s['violations'] for s in scorecards)
-        
+
+        # One pass into a structured array, then all reductions run as
+        # C-level ndarray sums/means instead of repeated Python generator
+        # passes over the dict list
+        arr = np.fromiter(
+            ((s['overall_score'], s['safety_score'], s['miles_driven'],
+              s['incidents'], s['violations']) for s in scorecards),
+            dtype=np.dtype([('overall', 'f8'), ('safety', 'f8'), ('miles', 'f8'),
+                            ('incidents', 'i8'), ('violations', 'i8')]),
+            count=len(scorecards)
+        )
+
+        overall_scores = arr['overall'][arr['overall'] > 0]
+        safety_scores = arr['safety'][arr['safety'] > 0]
+        total_miles = float(arr['miles'].sum())
+        total_incidents = int(arr['incidents'].sum())
+        total_violations = int(arr['violations'].sum())
+
         metrics = {
             'total_drivers': len(scorecards),
-            'average_overall_score': statistics.mean(overall_scores) if overall_scores else 0,
-            'average_safety_score': statistics.mean(safety_scores) if safety_scores else 0,
+            'average_overall_score': float(overall_scores.mean()) if overall_scores.size else 0,
+            'average_safety_score': float(safety_scores.mean()) if safety_scores.size else 0,
             'total_miles_driven': total_miles,
             'total_incidents': total_incidents,
             'total_violations': total_violations,
@@ -191,7 +364,7 @@ class ScorecardProcessor:
             'violations_per_driver': total_violations / len(scorecards) if scorecards else 0
         }
         
-        logging.info(f"Calculated performance metrics: {metrics}")
+        logger.info("Calculated performance metrics: %s", metrics)
         return metrics
     
     def get_report_period(self) -> str:
@@ -205,6 +378,21 @@ class ScorecardProcessor:
         today = datetime.datetime.now()
         return today.strftime('%Y-%m')
     
+    def _process_scorecard_file(self, file_path: str) -> List[Dict[str, Any]]:
+        """
+        Read and convert a single scorecard file.
+
+        Args:
+            file_path: Path to the file to process.
+
+        Returns:
+            List of scorecard dictionaries (empty if the file could not be read).
+        """
+        records: List[Dict[str, Any]] = []
+        for frame in self.iter_scorecard_frames(file_path):
+            records.extend(self.process_scorecard_dataframe(frame))
+        return records
+
     def process_all_scorecard_files(self, directory: str = None) -> Optional[Tuple[List[Dict[str, Any]], str, Dict[str, Any]]]:
         """
         Process all scorecard files in directory.
@@ -221,33 +409,46 @@ class ScorecardProcessor:
         files = self.find_scorecard_files(directory)
         
         if not files:
-            logging.warning("No scorecard files found to process")
+            logger.warning("No scorecard files found to process")
             return None
         
         all_scorecards = []
         report_period = self.get_report_period()
-        
-        for file_path in files:
-            try:
-                file_name = Path(file_path).name
-                logging.info(f"Processing scorecard file: {file_name}")
-                
-                df = self.read_scorecard_file(file_path)
-                if df is not None:
-                    scorecards = self.process_scorecard_dataframe(df)
-                    all_scorecards.extend(scorecards)
-                    logging.info(f"Added {len(scorecards)} scorecard records from {file_name}")
-                else:
-                    logging.warning(f"No valid data found in {file_name}")
-                    
-            except Exception as e:
-                logging.error(f"Error processing scorecard file {file_path}: {e}")
-                continue
+
+        # Files are independent parse + vectorize work, so fan them out
+        # across worker processes when there is more than one; the record
+        # dicts pickle cheaply back to the parent
+        max_workers = min(len(files), os.cpu_count() or 1)
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [(file_path, executor.submit(self._process_scorecard_file, file_path))
+                           for file_path in files]
+                results = []
+                for file_path, future in futures:
+                    try:
+                        results.append((file_path, future.result()))
+                    except Exception as e:
+                        logger.error("Error processing scorecard file %s: %s", file_path, e)
+        else:
+            results = []
+            for file_path in files:
+                try:
+                    results.append((file_path, self._process_scorecard_file(file_path)))
+                except Exception as e:
+                    logger.error("Error processing scorecard file %s: %s", file_path, e)
+
+        for file_path, scorecards in results:
+            file_name = Path(file_path).name
+            if scorecards:
+                all_scorecards.extend(scorecards)
+                logger.info("Added %s scorecard records from %s", len(scorecards), file_name)
+            else:
+                logger.warning("No valid data found in %s", file_name)
         
         if all_scorecards:
             metrics = self.calculate_performance_metrics(all_scorecards)
-            logging.info(f"Total scorecard records processed: {len(all_scorecards)}")
+            logger.info("Total scorecard records processed: %s", len(all_scorecards))
             return all_scorecards, report_period, metrics
         else:
-            logging.error("No valid scorecard data found in any files")
+            logger.error("No valid scorecard data found in any files")
             return None 
\ No newline at end of file
@@ -3,7 +3,8 @@ Configuration management utilities for DOT inspections ETL.
 """
 
 import os
-from dotenv import load_dotenv
+from dotenv import load_dotenv, find_dotenv
+from functools import cached_property
 from typing import Optional
 
 
@@ -17,21 +18,11 @@ class DOTConfigManager:
         Args:
             config_path: Path to .env file. If None, uses default paths.
         """
-        if config_path:
-            load_dotenv(config_path)
-        else:
-            # Try common paths
-            common_paths = [
-                r'C:\Users\APalacio\PycharmProjects\AMQP_Dev\config.env',
-                '.env',
-                'config.env'
-            ]
-            for path in common_paths:
-                if os.path.exists(path):
-                    load_dotenv(path)
-                    break
+        # find_dotenv walks upward from the working directory in one pass,
+        # replacing the old hardcoded candidate-path probing
+        load_dotenv(config_path or find_dotenv(usecwd=True))
     
-    @property
+    @cached_property
     def database_config(self) -> dict:
         """Get database configuration."""
         return {
@@ -41,7 +32,7 @@ class DOTConfigManager:
             'database': os.getenv('datab', 'VTUtility')  # Default to VTUtility if not specified
         }
     
-    @property
+    @cached_property
     def database_tables(self) -> dict:
         """Get database table configuration."""
         return {
@@ -51,7 +42,7 @@ class DOTConfigManager:
             'script_id': 12  # Assuming a unique ID for DOT inspections script
         }
     
-    @property
+    @cached_property
     def file_paths(self) -> dict:
         """Get file path configuration."""
         return {
@@ -61,7 +52,7 @@ class DOTConfigManager:
             'logs_dir': 'dot_inspections_etl/logs'
         }
     
-    @property
+    @cached_property
     def processing_config(self) -> dict:
         """Get processing configuration."""
         return {
@@ -4,13 +4,57 @@ Database utilities for DOT inspections ETL.
 
 import pyodbc
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Sequence, Set
 from .config_utils import DOTConfigManager
 
+logger = logging.getLogger(__name__)
+
+# Keep ODBC connection pooling on at the driver-manager level: close()
+# parks the underlying connection for reuse, so back-to-back ETL passes
+# skip the TCP/TLS/auth handshake instead of paying it per run
+pyodbc.pooling = True
+
+
+def _select_odbc_driver() -> str:
+    """
+    Pick the best installed SQL Server ODBC driver.
+
+    The modern Microsoft drivers speak current TDS and are what makes
+    fast_executemany send parameter arrays in one RPC; the legacy
+    'SQL Server' driver is only used when nothing newer is installed.
+
+    Returns:
+        ODBC driver name.
+    """
+    preferred = [
+        'ODBC Driver 18 for SQL Server',
+        'ODBC Driver 17 for SQL Server',
+    ]
+    try:
+        installed = set(pyodbc.drivers())
+    except Exception:
+        installed = set()
+    for driver in preferred:
+        if driver in installed:
+            return driver
+    return 'SQL Server'
+
 
 class DOTDatabaseManager:
     """Manages database connections and operations for DOT inspections ETL."""
-    
+
+    # Column order shared by the batch insert SQL and the row tuples
+    INSPECTION_COLUMNS = (
+        'inspection_id', 'post_date', 'driver_name', 'tractor_id',
+        'tractor_license', 'trailer_id', 'trailer_license', 'violations',
+        'driver_id'
+    )
+
+    # Upper bound on IN-list parameters per query; SQL Server caps a
+    # statement at ~2100 markers
+    IN_CLAUSE_CHUNK = 2000
+
+
     def __init__(self, config_manager: DOTConfigManager):
         """
         Initialize database manager.
@@ -23,6 +67,26 @@ class DOTDatabaseManager:
         self.table_config = config_manager.database_tables
         self.processing_config = config_manager.processing_config
         self.connection: Optional[pyodbc.Connection] = None
+        # Cursors reused for the manager's lifetime: each cursor() call
+        # allocates a fresh ODBC statement handle, so queries share one
+        # plain cursor and bulk inserts share one fast_executemany cursor
+        self._cursor: Optional[pyodbc.Cursor] = None
+        self._bulk_cursor: Optional[pyodbc.Cursor] = None
+        # Memoized (company_id, license) -> driver id lookups; inspection
+        # files repeat the same drivers, so repeats skip the round trip
+        self._driver_cache: Dict[tuple, Optional[str]] = {}
+        # Statement text built once per manager: table names never change
+        # after construction, so the hot paths reuse these strings instead
+        # of re-interpolating them per call (identical text also keeps the
+        # server hitting the same cached plan)
+        table_name = self.table_config['dot_inspections_table']
+        self._insert_sql = (
+            f"INSERT INTO {table_name} "
+            "([inspection_id], [post_date], [driver_name], [tractor_id], "
+            "[tractor_license], [trailer_id], [trailer_license], [violations], [driver_id]) "
+            "VALUES (?, CAST(? AS DATE), ?, ?, ?, ?, ?, ?, ?)"
+        )
+        self._select_existing_sql = f"SELECT inspection_id FROM {table_name}"
         
     def create_connection(self) -> Optional[pyodbc.Connection]:
         """
@@ -32,54 +96,125 @@ class DOTDatabaseManager:
             Database connection or None if failed.
         """
         try:
+            driver = _select_odbc_driver()
+            # ODBC 18 (msodbcsql18) encrypts by default; keep the previous
+            # plaintext behavior against the internal server
+            encrypt = 'Encrypt=no;TrustServerCertificate=yes;' if '18' in driver else 'Encrypt=no;'
             conn_str = (
-                f'Driver={{SQL Server}};'
+                f'Driver={{{driver}}};'
                 f'Server={self.db_config["server"]};'
                 f'Database={self.db_config["database"]};'
                 f'UID={self.db_config["user"]};'
                 f'PWD={self.db_config["password"]};'
-                'Encrypt=no;'
+                f'{encrypt}'
             )
             self.connection = pyodbc.connect(conn_str)
-            logging.info("Successfully connected to the database.")
+            # Explicit manual-commit mode: inserts accumulate in one
+            # transaction until the batch-level commit
+            self.connection.autocommit = False
+            self._cursor = self.connection.cursor()
+            # Session-wide NOCOUNT: skips the rowcount message SQL Server
+            # sends after every statement. The insert path infers success
+            # from exceptions, not cursor.rowcount, so nothing needs them
+            self._cursor.execute("SET NOCOUNT ON")
+            logger.info("Successfully connected to the database.")
             return self.connection
         except pyodbc.Error as ex:
             sqlstate = ex.args[0]
-            logging.error(f"Database connection failed. SQLSTATE: {sqlstate}. Error: {ex}")
+            logger.error("Database connection failed. SQLSTATE: %s. Error: %s", sqlstate, ex)
             return None
     
+    def _default_cursor(self) -> pyodbc.Cursor:
+        """
+        Return a cursor preconfigured for parameter-array inserts.
+
+        Returns:
+            Cursor with fast_executemany enabled.
+        """
+        if self._bulk_cursor is None:
+            self._bulk_cursor = self.connection.cursor()
+            self._bulk_cursor.fast_executemany = True
+        return self._bulk_cursor
+
     def close_connection(self) -> None:
-        """Close the database connection."""
+        """Close the cached cursors and the database connection."""
+        self._driver_cache.clear()
+        for cursor in (self._cursor, self._bulk_cursor):
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except pyodbc.Error:
+                    pass
+        self._cursor = None
+        self._bulk_cursor = None
         if self.connection:
             self.connection.close()
             self.connection = None
-            logging.info("Database connection closed.")
+            logger.info("Database connection closed.")
     
-    def get_existing_inspections(self) -> List[int]:
+    def get_existing_inspections(self) -> Set[int]:
         """
-        Get list of inspection IDs already in the database.
-        
+        Get the set of inspection IDs already in the database.
+
         Returns:
-            List of existing inspection IDs.
+            Set of existing inspection IDs (O(1) membership tests for the
+            dedupe loop).
         """
         if not self.connection:
-            logging.error("No database connection available")
-            return []
-        
+            logger.error("No database connection available")
+            return set()
+
         try:
-            cursor = self.connection.cursor()
-            query = f"SELECT inspection_id FROM {self.table_config['dot_inspections_table']}"
-            cursor.execute(query)
-            results = cursor.fetchall()
-            inspection_ids = [row[0] for row in results]
-            logging.info(f"Found {len(inspection_ids)} existing inspections in database")
+            cursor = self._cursor
+            # Large fetch batches while streaming rows straight into the
+            # set, so no intermediate list of Row objects is materialized
+            cursor.arraysize = 10000
+            inspection_ids = {row[0] for row in cursor.execute(self._select_existing_sql)}
+            logger.info("Found %s existing inspections in database", len(inspection_ids))
             return inspection_ids
         except Exception as e:
-            logging.error(f"Error retrieving existing inspections: {e}")
-            return []
-        finally:
-            cursor.close()
+            logger.error("Error retrieving existing inspections: %s", e)
+            return set()
     
+    def existing_inspection_ids(self, candidate_ids: Sequence[int]) -> Set[int]:
+        """
+        Return which of the candidate inspection IDs already exist.
+
+        Only the batch's IDs are checked, so the query ships |batch| rows
+        instead of the whole table. Candidates go into chunked IN lists to
+        stay under SQL Server's parameter limit.
+
+        Args:
+            candidate_ids: Inspection IDs from the current batch.
+
+        Returns:
+            Set of candidate IDs already present in the table.
+        """
+        if not candidate_ids:
+            return set()
+
+        if not self.connection:
+            logger.error("No database connection available")
+            return set()
+
+        distinct_ids = list(dict.fromkeys(candidate_ids))
+        existing: Set[int] = set()
+        try:
+            cursor = self._cursor
+            for start in range(0, len(distinct_ids), self.IN_CLAUSE_CHUNK):
+                chunk = distinct_ids[start:start + self.IN_CLAUSE_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                query = (
+                    f"{self._select_existing_sql} "
+                    f"WHERE inspection_id IN ({placeholders})"
+                )
+                existing.update(row[0] for row in cursor.execute(query, chunk))
+            logger.info("%s/%s candidate inspections already exist", len(existing), len(distinct_ids))
+            return existing
+        except Exception as e:
+            logger.error("Error checking existing inspections: %s", e)
+            return existing
+
     def get_driver_id(self, license_number: str) -> Optional[str]:
         """
         Get driver ID from the database based on license number.
@@ -91,129 +226,167 @@ class DOTDatabaseManager:
             Driver ID or None if not found.
         """
         if not self.connection:
-            logging.error("No database connection available")
+            logger.error("No database connection available")
             return None
-        
+
+        company_id = self.processing_config['company_id']
+        cache_key = (company_id, license_number)
+        if cache_key in self._driver_cache:
+            return self._driver_cache[cache_key]
+
         try:
-            cursor = self.connection.cursor()
-            company_id = self.processing_config['company_id']
-            # Escape single quotes in license number for SQL safety
-            license_escaped = license_number.replace("'", "''")
-            
+            cursor = self._cursor
+
+            # Parameter markers let SQL Server reuse one prepared plan for
+            # every lookup instead of compiling a new one per literal
             query = f"""
-                SELECT id FROM {self.table_config['driver_table']} 
-                WHERE license_no = '{license_escaped}' AND company_id = '{company_id}'
+                SELECT id FROM {self.table_config['driver_table']}
+                WHERE license_no = ? AND company_id = ?
             """
-            
-            cursor.execute(query)
+
+            cursor.execute(query, (license_number, company_id))
             result = cursor.fetchone()
-            
+
             if result:
                 driver_id = result[0].strip() if isinstance(result[0], str) else str(result[0])
-                logging.debug(f"Found driver ID {driver_id} for license {license_number}")
+                logger.debug("Found driver ID %s for license %s", driver_id, license_number)
+                self._driver_cache[cache_key] = driver_id
                 return driver_id
             else:
-                logging.debug(f"No driver found for license {license_number}")
+                logger.debug("No driver found for license %s", license_number)
+                self._driver_cache[cache_key] = None
                 return None
-                
+
         except Exception as e:
-            logging.error(f"Error retrieving driver ID for license {license_number}: {e}")
+            logger.error("Error retrieving driver ID for license %s: %s", license_number, e)
             return None
-        finally:
-            cursor.close()
     
+    def load_driver_map(self, licenses: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        Fetch license -> driver ID pairs for the company in one query.
+
+        Resolving a whole batch through this dict turns N per-inspection
+        lookups into a single round trip.
+
+        Args:
+            licenses: Optional license numbers to restrict the fetch to;
+                when None, every driver for the configured company is
+                loaded.
+
+        Returns:
+            Dictionary mapping license numbers to driver IDs.
+        """
+        if not self.connection:
+            logger.error("No database connection available")
+            return {}
+
+        base_query = f"""
+            SELECT license_no, id FROM {self.table_config['driver_table']}
+            WHERE company_id = ?
+        """
+        company_id = self.processing_config['company_id']
+        distinct_licenses = list(dict.fromkeys(licenses)) if licenses else []
+
+        # Licenses go into chunked IN lists, same as existing_inspection_ids:
+        # SQL Server caps a statement at ~2100 parameter markers, so one
+        # big list would fail outright on large files
+        statements = []
+        if distinct_licenses:
+            for start in range(0, len(distinct_licenses), self.IN_CLAUSE_CHUNK):
+                chunk = distinct_licenses[start:start + self.IN_CLAUSE_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                statements.append((
+                    f"{base_query} AND license_no IN ({placeholders})",
+                    [company_id] + chunk
+                ))
+        else:
+            statements.append((base_query, [company_id]))
+
+        driver_map: Dict[str, str] = {}
+        try:
+            cursor = self._cursor
+            for query, params in statements:
+                cursor.execute(query, params)
+                for license_no, driver_id in cursor.fetchall():
+                    if license_no is None or driver_id is None:
+                        continue
+                    key = license_no.strip() if isinstance(license_no, str) else str(license_no)
+                    driver_map[key] = driver_id.strip() if isinstance(driver_id, str) else str(driver_id)
+
+            logger.info("Loaded %s driver mappings", len(driver_map))
+            return driver_map
+        except Exception as e:
+            logger.error("Error loading driver map: %s", e)
+            return driver_map
+
     def insert_inspection(self, inspection_data: Dict[str, Any]) -> bool:
         """
         Insert a single inspection record into the database.
-        
+
         Args:
             inspection_data: Dictionary containing inspection data.
-        
+
         Returns:
             Boolean indicating success.
         """
+        return self.insert_inspections_batch([inspection_data]) == 1
+
+    def insert_inspections_batch(self, inspections: List[Dict[str, Any]]) -> int:
+        """
+        Insert multiple inspection records in a batch.
+
+        All rows go through one parameterized statement with
+        fast_executemany, so each page is a single round trip and a single
+        commit instead of one execute + commit per record. Pages are capped
+        at processing_config['batch_size'] rows to bound the parameter
+        array size.
+
+        Args:
+            inspections: List of inspection data dictionaries.
+
+        Returns:
+            Number of successfully inserted records.
+        """
+        if not inspections:
+            return 0
+
         if not self.connection:
-            logging.error("No database connection available")
-            return False
-        
-        cursor = None
+            logger.error("No database connection available")
+            return 0
+
+        rows = [
+            tuple(inspection[column] for column in self.INSPECTION_COLUMNS)
+            for inspection in inspections
+        ]
+        batch_size = self.processing_config['batch_size']
+
+        success_count = 0
         try:
-            cursor = self.connection.cursor()
-            
-            # Escape single quotes in text fields for SQL safety
-            def escape_sql_string(value):
-                if value is None:
-                    return 'NULL'
-                return f"'{str(value).replace(chr(39), chr(39) + chr(39))}'"
-            
-            table_name = self.table_config['dot_inspections_table']
-            inspection_id = inspection_data['inspection_id']
-            post_date = escape_sql_string(inspection_data['post_date'])
-            driver_name = escape_sql_string(inspection_data['driver_name'])
-            tractor_id = escape_sql_string(inspection_data['tractor_id'])
-            tractor_license = escape_sql_string(inspection_data['tractor_license'])
-            trailer_id = escape_sql_string(inspection_data['trailer_id'])
-            trailer_license = escape_sql_string(inspection_data['trailer_license'])
-            violations = escape_sql_string(inspection_data['violations'])
-            driver_id = escape_sql_string(inspection_data['driver_id'])
-            
-            query = f"""
-                INSERT INTO {table_name}
-                ([inspection_id], [post_date], [driver_name], [tractor_id], 
-                [tractor_license], [trailer_id], [trailer_license], [violations], [driver_id])
-                VALUES 
-                ({inspection_id}, 
-                CAST({post_date} AS DATE), 
-                {driver_name}, 
-                {tractor_id},
-                {tractor_license}, 
-                {trailer_id}, 
-                {trailer_license}, 
-                {violations}, 
-                {driver_id})
-            """
-            
-            logging.debug(f"Executing query: {query}")
-            cursor.execute(query)
+            cursor = self._default_cursor()
+            for start in range(0, len(rows), batch_size):
+                page = rows[start:start + batch_size]
+                cursor.executemany(self._insert_sql, page)
+                success_count += len(page)
+            # One commit for the whole batch: a single log flush instead of
+            # one per page, and the batch is all-or-nothing on failure
             self.connection.commit()
-            logging.info(f"Successfully inserted inspection {inspection_data['inspection_id']}")
-            return True
-            
         except pyodbc.Error as ex:
             sqlstate = ex.args[0]
-            logging.error(f"Database insert failed. SQLSTATE: {sqlstate}. Error: {ex}")
+            logger.error("Database insert failed. SQLSTATE: %s. Error: %s", sqlstate, ex)
+            success_count = 0
             try:
                 self.connection.rollback()
             except:
                 pass
-            return False
         except Exception as e:
-            logging.error(f"Unexpected error during inspection insert: {e}")
+            logger.error("Unexpected error during inspection insert: %s", e)
+            success_count = 0
             try:
                 self.connection.rollback()
             except:
                 pass
-            return False
-        finally:
-            if cursor:
-                cursor.close()
-    
-    def insert_inspections_batch(self, inspections: List[Dict[str, Any]]) -> int:
-        """
-        Insert multiple inspection records in a batch.
-        
-        Args:
-            inspections: List of inspection data dictionaries.
-        
-        Returns:
-            Number of successfully inserted records.
-        """
-        success_count = 0
-        for inspection in inspections:
-            if self.insert_inspection(inspection):
-                success_count += 1
-        
-        logging.info(f"Batch insert completed: {success_count}/{len(inspections)} records inserted")
+
+        logger.info("Batch insert completed: %s/%s records inserted", success_count, len(inspections))
         return success_count
     
     def update_script_status(self, success: bool = True, error_message: Optional[str] = None) -> bool:
@@ -227,39 +400,36 @@ class DOTDatabaseManager:
         Returns:
             Boolean indicating if the status update itself was successful.
         """
-        cursor = None
         try:
             if self.connection is None:
-                logging.error("Cannot update status: No database connection")
+                logger.error("Cannot update status: No database connection")
                 return False
-                
-            cursor = self.connection.cursor()
+
+            cursor = self._cursor
             script_id = self.table_config['script_id']
             status_table = self.table_config['script_status_table']
             
             if success:
-                query = f"UPDATE {status_table} SET result=1, Last_execution=GETDATE() WHERE ID = {script_id}"
+                query = f"UPDATE {status_table} SET result=1, Last_execution=GETDATE() WHERE ID = ?"
+                params = (script_id,)
             else:
                 error_msg = error_message if error_message else "Unknown error"
-                error_msg = error_msg.replace("'", "''")  # Escape single quotes for SQL
-                query = f"UPDATE {status_table} SET result=0, comments='{error_msg}', Last_execution=GETDATE() WHERE ID = {script_id}"
-            
-            cursor.execute(query)
+                query = f"UPDATE {status_table} SET result=0, comments=?, Last_execution=GETDATE() WHERE ID = ?"
+                params = (error_msg, script_id)
+
+            cursor.execute(query, params)
             self.connection.commit()
-            logging.info(f"Successfully updated script status to {'SUCCESS' if success else 'FAILED'}")
+            logger.info("Successfully updated script status to %s", 'SUCCESS' if success else 'FAILED')
             return True
         except Exception as e:
-            logging.error(f"Failed to update script status: {e}")
+            logger.error("Failed to update script status: %s", e)
             if self.connection:
                 try:
                     self.connection.rollback()
                 except:
                     pass
             return False
-        finally:
-            if cursor:
-                cursor.close()
-    
+
     def __enter__(self):
         """Context manager entry."""
         self.create_connection()
@@ -3,12 +3,16 @@ File management utilities for DOT inspections ETL.
 """
 
 import os
+import datetime
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from .config_utils import DOTConfigManager
 
+logger = logging.getLogger(__name__)
+
 
 class FileManager:
     """Handles file operations and directory management for DOT inspections ETL."""
@@ -38,7 +42,7 @@ class FileManager:
         
         for directory in directories:
             Path(directory).mkdir(parents=True, exist_ok=True)
-            logging.debug(f"Ensured directory exists: {directory}")
+            logger.debug("Ensured directory exists: %s", directory)
     
     def find_xml_files(self, directory: str = None) -> List[str]:
         """
@@ -53,26 +57,64 @@ class FileManager:
         if directory is None:
             directory = self.file_paths['xml_data_dir']
         
-        directory_path = Path(directory)
-        
-        if not directory_path.exists():
-            logging.warning(f"Directory does not exist: {directory}")
-            return []
-        
-        if not directory_path.is_dir():
-            logging.warning(f"Path is not a directory: {directory}")
+        if not os.path.isdir(directory):
+            if os.path.exists(directory):
+                logger.warning("Path is not a directory: %s", directory)
+            else:
+                logger.warning("Directory does not exist: %s", directory)
             return []
-        
-        # Find all XML files
-        xml_files = list(directory_path.glob('*.xml'))
-        xml_file_paths = [str(file_path) for file_path in xml_files]
-        
-        logging.info(f"Found {len(xml_file_paths)} XML files in {directory}")
-        for file_path in xml_file_paths:
-            logging.debug(f"  - {Path(file_path).name}")
+
+        # One scandir pass; DirEntry answers is_file from cached stat info
+        # instead of glob's extra per-entry syscalls
+        with os.scandir(directory) as entries:
+            xml_file_paths = sorted(
+                entry.path for entry in entries
+                if entry.is_file() and entry.name.lower().endswith('.xml')
+            )
+
+        logger.info("Found %s XML files in %s", len(xml_file_paths), directory)
+        # Guarded so the per-file Path construction is skipped entirely
+        # when DEBUG output is off
+        if logger.isEnabledFor(logging.DEBUG):
+            for file_path in xml_file_paths:
+                logger.debug("  - %s", Path(file_path).name)
         
         return xml_file_paths
-    
+
+    def iter_xml_files_with_info(self, directory: str = None) -> Iterator[Tuple[str, os.stat_result]]:
+        """
+        Yield (path, stat_result) pairs for XML files in one directory pass.
+
+        Callers that want both the file list and its metadata (size, mtime)
+        get everything from a single os.scandir: the stat info scandir
+        already gathered per entry is reused, so there is no second
+        traversal and no extra stat call per file. Pair each yielded stat
+        with get_file_info's stat_result argument to keep it that way.
+
+        Args:
+            directory: Directory to scan. If None, uses default from config.
+
+        Yields:
+            Tuples of (file path, os.stat_result), sorted by path.
+        """
+        if directory is None:
+            directory = self.file_paths['xml_data_dir']
+
+        if not os.path.isdir(directory):
+            if os.path.exists(directory):
+                logger.warning("Path is not a directory: %s", directory)
+            else:
+                logger.warning("Directory does not exist: %s", directory)
+            return
+
+        with os.scandir(directory) as entries:
+            matches = sorted(
+                ((entry.path, entry.stat()) for entry in entries
+                 if entry.is_file() and entry.name.lower().endswith('.xml')),
+                key=lambda item: item[0]
+            )
+        yield from matches
+
     def validate_file_path(self, file_path: str) -> bool:
         """
         Validate that a file path exists and is an XML file.
@@ -86,15 +128,15 @@ class FileManager:
         file_path_obj = Path(file_path)
         
         if not file_path_obj.exists():
-            logging.error(f"File does not exist: {file_path}")
+            logger.error("File does not exist: %s", file_path)
             return False
         
         if not file_path_obj.is_file():
-            logging.error(f"Path is not a file: {file_path}")
+            logger.error("Path is not a file: %s", file_path)
             return False
         
         if file_path_obj.suffix.lower() != '.xml':
-            logging.error(f"File is not an XML file: {file_path}")
+            logger.error("File is not an XML file: %s", file_path)
             return False
         
         return True
@@ -113,96 +155,114 @@ class FileManager:
         directory = file_path_obj.parent
         filename_stem = file_path_obj.stem
         
-        # Try common variations
+        # Try common variations; lowercased so one substring test covers
+        # the case variants too
         variations = [
             filename_stem.replace('inspections', 'inspection'),
             filename_stem.replace('inspection', 'inspections'),
             filename_stem.lower(),
             filename_stem.upper()
         ]
-        
-        similar_files = []
-        
-        for variation in variations:
-            if variation != filename_stem:  # Don't include the original
-                pattern = f"*{variation}*"
-                matches = list(directory.glob(pattern))
-                for match in matches:
-                    if match.suffix.lower() == '.xml':
-                        similar_files.append(str(match))
-        
-        # Remove duplicates and sort
-        similar_files = sorted(list(set(similar_files)))
+        needles = {v.lower() for v in variations if v != filename_stem}
+
+        # One directory scan with in-memory substring tests instead of a
+        # glob walk per variation
+        similar_files = set()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name_low = entry.name.lower()
+                    if not name_low.endswith('.xml'):
+                        continue
+                    if any(needle in name_low for needle in needles):
+                        similar_files.add(entry.path)
+        except OSError as e:
+            logger.error("Error scanning directory %s: %s", directory, e)
+
+        similar_files = sorted(similar_files)
         
         if similar_files:
-            logging.info(f"Found {len(similar_files)} similar files:")
+            logger.info("Found %s similar files:", len(similar_files))
             for similar_file in similar_files:
-                logging.info(f"  - {Path(similar_file).name}")
+                logger.info("  - %s", Path(similar_file).name)
         
         return similar_files
     
-    def move_processed_file(self, file_path: str) -> Optional[str]:
+    def move_processed_file(self, file_path: str,
+                            timestamp: Optional[str] = None) -> Optional[str]:
         """
         Move a processed file to the processed directory.
-        
+
         Args:
             file_path: Path to file to move.
-        
+            timestamp: Optional shared timestamp string; pass one per ETL
+                run so every moved file carries the same suffix and the
+                formatting happens once.
+
         Returns:
             New file path or None if move failed.
         """
         if not self.processing_config.get('backup_processed_files', True):
-            logging.debug("File backup is disabled, skipping move")
+            logger.debug("File backup is disabled, skipping move")
             return None
-        
+
         try:
             source_path = Path(file_path)
             if not source_path.exists():
-                logging.warning(f"Source file does not exist: {file_path}")
+                logger.warning("Source file does not exist: %s", file_path)
                 return None
-            
+
             # Create destination path with timestamp
-            import datetime
-            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+            if timestamp is None:
+                timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"{source_path.stem}_{timestamp}{source_path.suffix}"
             destination_path = Path(self.file_paths['processed_dir']) / filename
             
-            # Move the file
-            shutil.move(str(source_path), str(destination_path))
-            logging.info(f"Moved processed file: {source_path.name} -> {destination_path}")
+            # Same-filesystem moves are a single rename; only fall back to
+            # shutil.move's copy+delete when the rename crosses devices
+            try:
+                os.replace(str(source_path), str(destination_path))
+            except OSError:
+                shutil.move(str(source_path), str(destination_path))
+            logger.info("Moved processed file: %s -> %s", source_path.name, destination_path)
             
             return str(destination_path)
             
         except Exception as e:
-            logging.error(f"Failed to move processed file {file_path}: {e}")
+            logger.error("Failed to move processed file %s: %s", file_path, e)
             return None
     
-    def move_error_file(self, file_path: str, error_message: str = None) -> Optional[str]:
+    def move_error_file(self, file_path: str, error_message: str = None,
+                        timestamp: Optional[str] = None) -> Optional[str]:
         """
         Move a file that caused errors to the error directory.
-        
+
         Args:
             file_path: Path to file to move.
             error_message: Optional error message to include in filename.
-        
+            timestamp: Optional shared timestamp string (one per ETL run).
+
         Returns:
             New file path or None if move failed.
         """
         try:
             source_path = Path(file_path)
             if not source_path.exists():
-                logging.warning(f"Source file does not exist: {file_path}")
+                logger.warning("Source file does not exist: %s", file_path)
                 return None
-            
+
             # Create destination path with timestamp and error indicator
-            import datetime
-            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+            if timestamp is None:
+                timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"{source_path.stem}_ERROR_{timestamp}{source_path.suffix}"
             destination_path = Path(self.file_paths['error_dir']) / filename
             
-            # Move the file
-            shutil.move(str(source_path), str(destination_path))
-            logging.warning(f"Moved error file: {source_path.name} -> {destination_path}")
+            # Rename in place when possible, copy+delete only cross-device
+            try:
+                os.replace(str(source_path), str(destination_path))
+            except OSError:
+                shutil.move(str(source_path), str(destination_path))
+            logger.warning("Moved error file: %s -> %s", source_path.name, destination_path)
             
             # Create error log file if error message provided
             if error_message:
@@ -212,28 +272,32 @@ class FileManager:
                         f.write(f"Error processing file: {source_path.name}\n")
                         f.write(f"Timestamp: {timestamp}\n")
                         f.write(f"Error message: {error_message}\n")
-                    logging.info(f"Created error log: {error_log_path}")
+                    logger.info("Created error log: %s", error_log_path)
                 except Exception as log_error:
-                    logging.error(f"Failed to create error log: {log_error}")
+                    logger.error("Failed to create error log: %s", log_error)
             
             return str(destination_path)
             
         except Exception as e:
-            logging.error(f"Failed to move error file {file_path}: {e}")
+            logger.error("Failed to move error file %s: %s", file_path, e)
             return None
     
-    def get_file_info(self, file_path: str) -> Dict[str, Any]:
+    def get_file_info(self, file_path: str,
+                      stat_result: Optional[os.stat_result] = None) -> Dict[str, Any]:
         """
         Get information about a file.
-        
+
         Args:
             file_path: Path to file.
-        
+            stat_result: Optional stat result for the file; pass one when
+                the caller already has it (e.g. from os.scandir) to avoid
+                re-statting.
+
         Returns:
             Dictionary with file information.
         """
         file_path_obj = Path(file_path)
-        
+
         info = {
             'filename': file_path_obj.name,
             'directory': str(file_path_obj.parent),
@@ -242,27 +306,30 @@ class FileManager:
             'exists': False,
             'is_xml': False
         }
-        
+
         try:
-            if file_path_obj.exists():
-                info['exists'] = True
-                info['size_bytes'] = file_path_obj.stat().st_size
-                info['modified_time'] = file_path_obj.stat().st_mtime
-                info['is_xml'] = file_path_obj.suffix.lower() == '.xml'
-                
-                # Convert size to human readable format
-                size_mb = info['size_bytes'] / (1024 * 1024)
-                info['size_mb'] = round(size_mb, 2)
-                
-                # Convert timestamp to readable format
-                import datetime
-                info['modified_time_str'] = datetime.datetime.fromtimestamp(
-                    info['modified_time']
-                ).strftime('%Y-%m-%d %H:%M:%S')
-                
+            # One stat covers existence, size and mtime; a raised
+            # FileNotFoundError is the same signal an exists() guard gave
+            st = stat_result if stat_result is not None else file_path_obj.stat()
+            info['exists'] = True
+            info['size_bytes'] = st.st_size
+            info['modified_time'] = st.st_mtime
+            info['is_xml'] = file_path_obj.suffix.lower() == '.xml'
+
+            # Convert size to human readable format
+            size_mb = info['size_bytes'] / (1024 * 1024)
+            info['size_mb'] = round(size_mb, 2)
+
+            # Convert timestamp to readable format
+            info['modified_time_str'] = datetime.datetime.fromtimestamp(
+                info['modified_time']
+            ).strftime('%Y-%m-%d %H:%M:%S')
+
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            logging.error(f"Error getting file info for {file_path}: {e}")
-        
+            logger.error("Error getting file info for %s: %s", file_path, e)
+
         return info
     
     def cleanup_old_files(self, directory: str = None, days_old: int = 30) -> int:
@@ -281,32 +348,47 @@ class FileManager:
         
         directory_path = Path(directory)
         if not directory_path.exists():
-            logging.warning(f"Cleanup directory does not exist: {directory}")
+            logger.warning("Cleanup directory does not exist: %s", directory)
             return 0
         
-        import datetime
         cutoff_time = datetime.datetime.now() - datetime.timedelta(days=days_old)
         cutoff_timestamp = cutoff_time.timestamp()
         
         deleted_count = 0
         
+        def _safe_unlink(path: str) -> bool:
+            try:
+                os.unlink(path)
+                logger.debug("Deleted old file: %s", os.path.basename(path))
+                return True
+            except Exception as e:
+                logger.error("Failed to delete file %s: %s", path, e)
+                return False
+
         try:
-            for file_path in directory_path.iterdir():
-                if file_path.is_file():
-                    file_modified_time = file_path.stat().st_mtime
-                    
-                    if file_modified_time < cutoff_timestamp:
-                        try:
-                            file_path.unlink()
-                            logging.debug(f"Deleted old file: {file_path.name}")
-                            deleted_count += 1
-                        except Exception as e:
-                            logging.error(f"Failed to delete file {file_path}: {e}")
-            
+            # DirEntry.stat() reuses the stat info gathered by scandir, so
+            # each entry costs one syscall instead of two or three
+            with os.scandir(directory) as entries:
+                doomed = [
+                    entry.path for entry in entries
+                    if entry.is_file() and entry.stat().st_mtime < cutoff_timestamp
+                ]
+
+            if doomed:
+                # Unlink latency dominates on network shares, so overlap
+                # the syscalls across a small thread pool; a single file
+                # is deleted inline
+                max_workers = min(16, len(doomed))
+                if max_workers > 1:
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        deleted_count = sum(executor.map(_safe_unlink, doomed))
+                else:
+                    deleted_count = sum(_safe_unlink(path) for path in doomed)
+
             if deleted_count > 0:
-                logging.info(f"Cleaned up {deleted_count} old files from {directory}")
+                logger.info("Cleaned up %s old files from %s", deleted_count, directory)
             
         except Exception as e:
-            logging.error(f"Error during cleanup of {directory}: {e}")
+            logger.error("Error during cleanup of %s: %s", directory, e)
         
         return deleted_count 
\ No newline at end of file
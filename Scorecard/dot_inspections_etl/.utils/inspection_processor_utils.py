@@ -2,258 +2,476 @@
 Inspection processing utilities for DOT inspections ETL.
 """
 
+import json
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Optional, List, Tuple, Iterable
+
+# C-implemented JSON serializer; optional, stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Shared empty-dict sentinel: `x.get('K') or _EMPTY` keeps the extraction
+# path branch-free without allocating a fresh dict on every miss
+_EMPTY: Dict[str, Any] = {}
+
+# Canonical copies of bounded-vocabulary strings (violation codes, unit
+# types, driver fields): parsing yields a fresh str per occurrence, so
+# big batches would otherwise hold thousands of duplicates of the same
+# few values. Lives for the process — vocabularies are small
+_INTERN: Dict[str, str] = {}
+
+
+def _i(s: Optional[str]) -> Optional[str]:
+    """Return the canonical shared copy of s; falsy values pass through."""
+    return _INTERN.setdefault(s, s) if s else s
+
+# Raw-field schema: output name, key path through the inspection dict,
+# and default for leaf misses (None keeps the plain .get miss value).
+# The specialized extractor below is generated from this at import time.
+_RAW_FIELDS = (
+    ('inspection_id', ('InspMain', 'inspectionId'), None),
+    ('post_date', ('InspMain', 'InspectionPostDate'), None),
+    ('driver_name', ('Drivers', 'Driver', 'DriverLastName'), ''),
+    ('license_number', ('Drivers', 'Driver', 'DriverLicenseID'), ''),
+    ('vehicle_data', ('Vehicles', 'Vehicle'), None),
+    ('violations_data', ('Violations', 'Violation'), None),
+)
+
+
+def _build_raw_extractor():
+    """
+    Generate the specialized raw-field extractor from _RAW_FIELDS.
+
+    The schema is a constant, so the repeated key walks are partially
+    evaluated into straight-line source at import time: each section
+    dict binds to a local exactly once and every field read is a single
+    .get on a local name, with no per-record branching. Returns a
+    function mapping an inspection dict to the tuple of raw field
+    values in schema order.
+    """
+    lines = ['def _extract_raw(insp):']
+    section_names = {(): 'insp'}
+    for _, path, _ in _RAW_FIELDS:
+        for depth in range(1, len(path)):
+            prefix = path[:depth]
+            if prefix not in section_names:
+                parent = section_names[prefix[:-1]]
+                local = 's%d' % len(section_names)
+                section_names[prefix] = local
+                lines.append("    %s = %s.get(%r) or _EMPTY" % (local, parent, prefix[-1]))
+
+    values = []
+    for _, path, default in _RAW_FIELDS:
+        parent = section_names[path[:-1]]
+        if default is None:
+            values.append('%s.get(%r)' % (parent, path[-1]))
+        else:
+            values.append('%s.get(%r, %r)' % (parent, path[-1], default))
+    lines.append('    return (' + ', '.join(values) + ')')
+
+    namespace = {'_EMPTY': _EMPTY}
+    exec('\n'.join(lines), namespace)
+    return namespace['_extract_raw']
+
+
+_extract_raw = _build_raw_extractor()
+
+
+def process_violations(violations_data: Any) -> str:
+    """
+    Process violations data from inspection record.
+
+    The XML boundary normalizes Violations.Violation to a list, so the
+    loop here runs straight through with no shape branches.
+
+    Args:
+        violations_data: List of violation dictionaries from XML.
+
+    Returns:
+        Formatted violations string.
+    """
+    if not violations_data:
+        return ''
+
+    try:
+        violations = []
+        append = violations.append
+        for violation in violations_data:
+            get = violation.get
+            # filter(None) drops empty/missing fields before the join, so
+            # no strip pass is needed and empty elements (None text) can
+            # no longer leak a literal 'None' into the string
+            # Codes and categories are a bounded vocabulary — intern them;
+            # SectionDesc is free text and stays as parsed
+            violation_str = ' '.join(filter(None, (
+                _i(get('FedVioCode', '')),
+                _i(get('ViolationCategory', '')),
+                get('SectionDesc', '')
+            )))
+            if violation_str:
+                # Clean quotes per field at append time instead of
+                # rescanning the whole joined string at the end
+                append(violation_str.replace("'", ""))
+
+        return ' | '.join(violations)
+
+    except Exception as e:
+        logger.error("Error processing violations: %s", e)
+        return ''
+
+
+def process_vehicle_data(vehicle_data: Any) -> Tuple[str, str, str, str]:
+    """
+    Process vehicle data from inspection record.
+
+    The XML boundary normalizes Vehicles.Vehicle to a list, so the loop
+    here runs straight through with no shape branches.
+
+    Args:
+        vehicle_data: List of vehicle dictionaries from XML.
+
+    Returns:
+        Tuple of (tractor_id, tractor_license, trailer_id, trailer_license).
+    """
+    tractor_id = ''
+    tractor_license = ''
+    trailer_id = ''
+    trailer_license = ''
+
+    try:
+        for vehicle in vehicle_data:
+            get = vehicle.get
+            # .upper() always allocates; interning collapses the copies
+            # of the handful of real unit-type codes
+            unit_type = _i(get('VehicleUnitTypeCode', '').upper())
+
+            if 'TRACTOR' in unit_type:
+                tractor_id = _i(get('VehicleCompanyID', ''))
+                tractor_license = _i(get('VehicleLicenseID', ''))
+            elif 'TRAILER' in unit_type:
+                trailer_id = _i(get('VehicleCompanyID', ''))
+                trailer_license = _i(get('VehicleLicenseID', ''))
+
+    except Exception as e:
+        logger.error("Error processing vehicle data: %s", e)
+
+    return tractor_id, tractor_license, trailer_id, trailer_license
+
+
+def extract_inspection_data(inspection: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Extract and process data from a single inspection record.
+
+    Runs without a defensive try/except of its own: batch callers catch
+    malformed records once in their loop, so the per-record path stays a
+    straight line of local dict lookups.
+
+    Args:
+        inspection: Single inspection data from XML.
+
+    Returns:
+        Processed inspection data dictionary or None if invalid.
+    """
+    # One generated call plucks every raw field in schema order
+    (inspection_id, post_date, driver_name, license_number,
+     vehicle_data, violations_data) = _extract_raw(inspection)
+
+    if not inspection_id or not post_date:
+        logger.warning("Missing inspection ID or post date")
+        return None
+
+    # Convert inspection_id to integer
+    try:
+        inspection_id = int(inspection_id)
+    except (ValueError, TypeError):
+        logger.warning("Invalid inspection ID: %s", inspection_id)
+        return None
+
+    if not driver_name or not license_number:
+        logger.warning("Missing driver information for inspection %s", inspection_id)
+        return None
+
+    # Process vehicle data
+    tractor_id, tractor_license, trailer_id, trailer_license = \
+        process_vehicle_data(vehicle_data or ())
+
+    # Process violations
+    violations = process_violations(violations_data) if violations_data else ''
+
+    return {
+        'inspection_id': inspection_id,
+        # Post dates and driver fields repeat across a file's records;
+        # store the shared copies
+        'post_date': _i(post_date),
+        'driver_name': _i(driver_name),
+        'license_number': _i(license_number),
+        'tractor_id': tractor_id,
+        'tractor_license': tractor_license,
+        'trailer_id': trailer_id,
+        'trailer_license': trailer_license,
+        'violations': violations,
+        'driver_id': None  # To be filled in later
+    }
+
+
+def serialize_batch(batch: List[Dict[str, Any]]) -> bytes:
+    """
+    Serialize a batch of processed inspections to JSON bytes.
+
+    Goes through orjson when it is installed — serialization happens in
+    C at roughly an order of magnitude over the stdlib — and falls back
+    to json otherwise.
+
+    Args:
+        batch: List of processed inspection data dictionaries.
+
+    Returns:
+        UTF-8 encoded JSON bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(batch)
+    return json.dumps(batch).encode('utf-8')
+
+
+def validate_ids(ids: np.ndarray, date_lens: np.ndarray) -> np.ndarray:
+    """
+    Vectorized validity mask for a batch of inspection rows.
+
+    One C-level pass replaces the per-record isinstance/len checks of
+    validate_processed_inspection: an inspection is insertable when its
+    ID is a positive integer and its post date is at least 8 characters.
+
+    Args:
+        ids: Integer array of inspection IDs.
+        date_lens: Integer array of post-date string lengths.
+
+    Returns:
+        Boolean array marking the rows valid for insertion.
+    """
+    return (ids > 0) & (date_lens >= 8)
 
 
 class InspectionProcessor:
-    """Handles business logic for processing DOT inspection data."""
-    
+    """
+    Handles business logic for processing DOT inspection data.
+
+    The per-record helpers live at module level so the hot path runs as
+    plain function calls on function-local names instead of bound-method
+    dispatch; this class remains as the facade the ETL instantiates.
+    """
+
     def __init__(self):
         """Initialize inspection processor."""
         pass
-    
+
     def process_violations(self, violations_data: Any) -> str:
-        """
-        Process violations data from inspection record.
-        
-        Args:
-            violations_data: Violations data from XML (can be dict or list).
-        
-        Returns:
-            Formatted violations string.
-        """
-        if not violations_data:
-            return ''
-        
-        try:
-            if isinstance(violations_data, dict):
-                # Single violation
-                fed_code = violations_data.get('FedVioCode', '')
-                viol_cat = violations_data.get('ViolationCategory', '')
-                viol_desc = violations_data.get('SectionDesc', '')
-                return f"{fed_code} {viol_cat} {viol_desc}".strip()
-            else:
-                # Multiple violations
-                violations = []
-                for violation in violations_data:
-                    if isinstance(violation, dict):
-                        fed_code = violation.get('FedVioCode', '')
-                        viol_cat = violation.get('ViolationCategory', '')
-                        viol_desc = violation.get('SectionDesc', '')
-                        violation_str = f"{fed_code} {viol_cat} {viol_desc}".strip()
-                        if violation_str:
-                            violations.append(violation_str)
-                
-                # Join with separator and clean up quotes
-                violations_str = ' | '.join(violations)
-                return violations_str.replace("'", "")
-                
-        except Exception as e:
-            logging.error(f"Error processing violations: {e}")
-            return ''
-    
+        """Delegate to the module-level process_violations."""
+        return process_violations(violations_data)
+
     def process_vehicle_data(self, vehicle_data: Any) -> Tuple[str, str, str, str]:
-        """
-        Process vehicle data from inspection record.
-        
-        Args:
-            vehicle_data: Vehicle data from XML (can be dict or list).
-        
-        Returns:
-            Tuple of (tractor_id, tractor_license, trailer_id, trailer_license).
-        """
-        tractor_id = ''
-        tractor_license = ''
-        trailer_id = ''
-        trailer_license = ''
-        
-        try:
-            if isinstance(vehicle_data, dict):
-                # Single vehicle
-                unit_type = vehicle_data.get('VehicleUnitTypeCode', '').upper()
-                vehicle_id = vehicle_data.get('VehicleCompanyID', '')
-                vehicle_license = vehicle_data.get('VehicleLicenseID', '')
-                
-                if 'TRACTOR' in unit_type:
-                    tractor_id = vehicle_id
-                    tractor_license = vehicle_license
-                elif 'TRAILER' in unit_type:
-                    trailer_id = vehicle_id
-                    trailer_license = vehicle_license
-            else:
-                # Multiple vehicles
-                for vehicle in vehicle_data:
-                    if isinstance(vehicle, dict):
-                        unit_type = vehicle.get('VehicleUnitTypeCode', '').upper()
-                        vehicle_id = vehicle.get('VehicleCompanyID', '')
-                        vehicle_license = vehicle.get('VehicleLicenseID', '')
-                        
-                        if 'TRACTOR' in unit_type:
-                            tractor_id = vehicle_id
-                            tractor_license = vehicle_license
-                        elif 'TRAILER' in unit_type:
-                            trailer_id = vehicle_id
-                            trailer_license = vehicle_license
-                            
-        except Exception as e:
-            logging.error(f"Error processing vehicle data: {e}")
-        
-        return tractor_id, tractor_license, trailer_id, trailer_license
-    
+        """Delegate to the module-level process_vehicle_data."""
+        return process_vehicle_data(vehicle_data)
+
     def extract_inspection_data(self, inspection: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Delegate to the module-level extract_inspection_data."""
+        return extract_inspection_data(inspection)
+
+    def to_dataframe(self, inspections: Iterable[Dict[str, Any]]) -> pd.DataFrame:
         """
-        Extract and process data from a single inspection record.
-        
+        Build a processed-inspection DataFrame from an iterable of records.
+
+        One Python walk collects the raw columns (the list-valued vehicle
+        and violation fields still go through the per-record helpers);
+        everything scalar — inspection-id conversion and the required-field
+        validation that dropped invalid records one at a time — then runs
+        as vectorized column operations instead of per-record try/except.
+
         Args:
-            inspection: Single inspection data from XML.
-        
+            inspections: Iterable of inspection data from XML.
+
         Returns:
-            Processed inspection data dictionary or None if invalid.
+            DataFrame of processed inspections, one row per valid record,
+            with the same columns as extract_inspection_data's dicts.
         """
-        try:
-            # Extract basic inspection information
-            insp_main = inspection.get('InspMain', {})
-            inspection_id = insp_main.get('inspectionId')
-            post_date = insp_main.get('InspectionPostDate')
-            
-            if not inspection_id or not post_date:
-                logging.warning("Missing inspection ID or post date")
-                return None
-            
-            # Convert inspection_id to integer
+        columns: Dict[str, List[Any]] = {
+            'inspection_id': [], 'post_date': [], 'driver_name': [],
+            'license_number': [], 'tractor_id': [], 'tractor_license': [],
+            'trailer_id': [], 'trailer_license': [], 'violations': []
+        }
+
+        total = 0
+        for inspection in inspections:
+            total += 1
+            # Single defensive catch for the whole record; the generated
+            # extractor and helpers below run try-free per field
             try:
-                inspection_id = int(inspection_id)
-            except (ValueError, TypeError):
-                logging.warning(f"Invalid inspection ID: {inspection_id}")
-                return None
-            
-            # Extract driver information
-            drivers_data = inspection.get('Drivers', {})
-            driver_data = drivers_data.get('Driver', {})
-            driver_name = driver_data.get('DriverLastName', '')
-            license_number = driver_data.get('DriverLicenseID', '')
-            
-            if not driver_name or not license_number:
-                logging.warning(f"Missing driver information for inspection {inspection_id}")
-                return None
-            
-            # Process vehicle data
-            vehicles_data = inspection.get('Vehicles', {})
-            vehicle_data = vehicles_data.get('Vehicle', {})
-            tractor_id, tractor_license, trailer_id, trailer_license = self.process_vehicle_data(vehicle_data)
-            
-            # Process violations
-            violations = ''
-            if 'Violations' in inspection and inspection['Violations']:
-                violations_data = inspection['Violations'].get('Violation', {})
-                violations = self.process_violations(violations_data)
-            
-            # Create processed inspection data
-            processed_data = {
-                'inspection_id': inspection_id,
-                'post_date': post_date,
-                'driver_name': driver_name,
-                'license_number': license_number,
-                'tractor_id': tractor_id,
-                'tractor_license': tractor_license,
-                'trailer_id': trailer_id,
-                'trailer_license': trailer_license,
-                'violations': violations,
-                'driver_id': None  # To be filled in later
-            }
-            
-            logging.debug(f"Successfully processed inspection {inspection_id}")
-            return processed_data
-            
-        except Exception as e:
-            logging.error(f"Error extracting inspection data: {e}")
-            return None
-    
-    def process_inspections_batch(self, inspections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                (inspection_id, post_date, driver_name, license_number,
+                 vehicle_data, violations_data) = _extract_raw(inspection)
+
+                tractor_id, tractor_license, trailer_id, trailer_license = \
+                    process_vehicle_data(vehicle_data or ())
+                violations = process_violations(violations_data) if violations_data else ''
+            except Exception as e:
+                logger.warning("Skipping malformed inspection at index %s: %s", total - 1, e)
+                continue
+
+            columns['inspection_id'].append(inspection_id)
+            # Repeating fields go in as shared interned copies
+            columns['post_date'].append(_i(post_date))
+            columns['driver_name'].append(_i(driver_name))
+            columns['license_number'].append(_i(license_number))
+            columns['tractor_id'].append(tractor_id)
+            columns['tractor_license'].append(tractor_license)
+            columns['trailer_id'].append(trailer_id)
+            columns['trailer_license'].append(trailer_license)
+            columns['violations'].append(violations)
+
+        df = pd.DataFrame(columns)
+        if df.empty:
+            df['driver_id'] = None
+            return df
+
+        # Bulk conversion and validation in C: coerce bad IDs to NaN,
+        # then drop every row missing a required field in one pass
+        df['inspection_id'] = pd.to_numeric(df['inspection_id'], errors='coerce')
+        df = df.dropna(subset=['inspection_id', 'post_date'])
+        # Empty XML leaves (<DriverLastName/>) come through as None, not
+        # '', so both checks are needed to reject absent driver fields
+        df = df[df['driver_name'].notna() & df['driver_name'].ne('')
+                & df['license_number'].notna() & df['license_number'].ne('')]
+        df['inspection_id'] = df['inspection_id'].astype('int64')
+        # Same check validate_processed_inspection applies per record,
+        # done once for the whole batch as an array mask
+        df = df[validate_ids(
+            df['inspection_id'].to_numpy(),
+            df['post_date'].astype(str).str.len().to_numpy()
+        )]
+        # to_dict(orient='records') on an int64 column hands back
+        # numpy.int64 scalars (on pandas before 2.1), which pyodbc
+        # rejects as parameters — box to plain Python ints here so the
+        # records cross the DB boundary clean
+        df['inspection_id'] = df['inspection_id'].astype(object)
+        df['driver_id'] = None
+
+        dropped = total - len(df)
+        if dropped:
+            logger.warning("Dropped %s invalid inspections during batch processing", dropped)
+        logger.info("Successfully processed %s out of %s inspections", len(df), total)
+        return df
+
+    def process_inspections_batch(self, inspections: Iterable[Dict[str, Any]],
+                                  collect_summary: bool = False):
         """
-        Process a batch of inspections.
-        
+        Process an iterable of inspections.
+
+        Accepts any iterable — in particular the streaming generator from
+        XMLProcessor.iter_inspections — so records flow straight from the
+        parser without a materialized list of raw dicts in between. The
+        heavy lifting happens column-wise in to_dataframe; this converts
+        back to dicts only at the boundary for the insert loop.
+
         Args:
-            inspections: List of inspection data from XML.
-        
+            inspections: Iterable of inspection data from XML.
+            collect_summary: When True, also return the processing
+                summary, computed from the batch DataFrame already in
+                hand — one pass over the data instead of re-framing and
+                re-walking the records through get_processing_summary
+                afterwards.
+
         Returns:
-            List of processed inspection data dictionaries.
+            List of processed inspection data dictionaries, or a
+            (records, summary) tuple when collect_summary is True.
         """
-        processed_inspections = []
-        
-        for i, inspection in enumerate(inspections):
-            logging.debug(f"Processing inspection {i + 1} of {len(inspections)}")
-            
-            processed_data = self.extract_inspection_data(inspection)
-            if processed_data:
-                processed_inspections.append(processed_data)
-            else:
-                logging.warning(f"Skipped invalid inspection at index {i}")
-        
-        logging.info(f"Successfully processed {len(processed_inspections)} out of {len(inspections)} inspections")
-        return processed_inspections
-    
+        df = self.to_dataframe(inspections)
+        records = df.to_dict(orient='records')
+        if collect_summary:
+            return records, self.summarize_dataframe(df)
+        return records
+
     def validate_processed_inspection(self, inspection_data: Dict[str, Any]) -> bool:
         """
         Validate processed inspection data before database insertion.
-        
+
         Args:
             inspection_data: Processed inspection data dictionary.
-        
+
         Returns:
             Boolean indicating if data is valid for insertion.
         """
-        required_fields = ['inspection_id', 'post_date', 'driver_name', 'license_number']
-        
-        for field in required_fields:
-            if field not in inspection_data or not inspection_data[field]:
-                logging.warning(f"Missing required field '{field}' in inspection data")
+        # One .get per required field; the old `in` + subscript pattern
+        # hashed each key twice, and presence-but-falsy failed anyway
+        for field in ('inspection_id', 'post_date', 'driver_name', 'license_number'):
+            if not inspection_data.get(field):
+                logger.warning("Missing required field '%s' in inspection data", field)
                 return False
-        
+
         # Validate inspection_id is integer
-        if not isinstance(inspection_data['inspection_id'], int):
-            logging.warning(f"Invalid inspection_id type: {type(inspection_data['inspection_id'])}")
+        inspection_id = inspection_data['inspection_id']
+        if not isinstance(inspection_id, int):
+            logger.warning("Invalid inspection_id type: %s", type(inspection_id))
             return False
-        
+
         # Validate post_date format (basic check)
         post_date = inspection_data['post_date']
         if not isinstance(post_date, str) or len(post_date) < 8:
-            logging.warning(f"Invalid post_date format: {post_date}")
+            logger.warning("Invalid post_date format: %s", post_date)
             return False
-        
+
         return True
-    
+
+    def summarize_dataframe(self, df: pd.DataFrame) -> Dict[str, int]:
+        """
+        Get summary statistics for a processed-inspection DataFrame.
+
+        Each field is one vectorized boolean reduction over a column
+        instead of a Python truthiness check per record.
+
+        Args:
+            df: DataFrame of processed inspections (to_dataframe output).
+
+        Returns:
+            Dictionary with processing summary.
+        """
+        if df.empty:
+            return {
+                'total_processed': 0,
+                'with_violations': 0,
+                'with_tractor': 0,
+                'with_trailer': 0,
+                'valid_for_insertion': 0
+            }
+
+        summary = {
+            'total_processed': len(df),
+            'with_violations': int(df['violations'].astype(bool).sum()),
+            'with_tractor': int(df['tractor_id'].astype(bool).sum()),
+            'with_trailer': int(df['trailer_id'].astype(bool).sum()),
+            # to_dataframe already applied the validate_ids mask, so by
+            # construction every surviving row is insertable — no need
+            # to recompute the same check here
+            'valid_for_insertion': len(df)
+        }
+
+        logger.info("Processing Summary: %s", summary)
+        return summary
+
     def get_processing_summary(self, processed_inspections: List[Dict[str, Any]]) -> Dict[str, int]:
         """
         Get summary statistics for processed inspections.
-        
+
+        Thin compatibility wrapper over summarize_dataframe for callers
+        holding a list of record dicts.
+
         Args:
             processed_inspections: List of processed inspection data.
-        
+
         Returns:
             Dictionary with processing summary.
         """
-        summary = {
-            'total_processed': len(processed_inspections),
-            'with_violations': 0,
-            'with_tractor': 0,
-            'with_trailer': 0,
-            'valid_for_insertion': 0
-        }
-        
-        for inspection in processed_inspections:
-            if inspection.get('violations'):
-                summary['with_violations'] += 1
-            
-            if inspection.get('tractor_id'):
-                summary['with_tractor'] += 1
-            
-            if inspection.get('trailer_id'):
-                summary['with_trailer'] += 1
-            
-            if self.validate_processed_inspection(inspection):
-                summary['valid_for_insertion'] += 1
-        
-        logging.info(f"Processing Summary: {summary}")
-        return summary 
\ No newline at end of file
+        return self.summarize_dataframe(pd.DataFrame(processed_inspections))
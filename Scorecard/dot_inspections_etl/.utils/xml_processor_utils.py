@@ -3,10 +3,75 @@ XML processing utilities for DOT inspections ETL.
 """
 
 import logging
-import xmltodict
-from typing import Dict, Any, Optional, List
+import mmap
+import os
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional, List, Iterable, Iterator
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Sentinel distinguishing "tag absent" from a stored None (empty leaf)
+# when grouping repeated child tags
+_ABSENT = object()
+
+
+def _elem_to_dict(elem: ET.Element) -> Any:
+    """
+    Convert an Element subtree to the nested dict shape xmltodict produced.
+
+    Leaves collapse to their text, branches to a dict of child tag ->
+    value, and repeated tags collect into a list — the xmltodict
+    semantics the downstream extraction code relies on (attributes are
+    not mirrored; this feed carries everything in elements).
+
+    Args:
+        elem: Parsed XML element.
+
+    Returns:
+        Element text for leaves, nested dictionary for branches.
+    """
+    children = list(elem)
+    if not children:
+        return elem.text
+
+    result: Dict[str, Any] = {}
+    for child in children:
+        value = _elem_to_dict(child)
+        existing = result.get(child.tag, _ABSENT)
+        if existing is _ABSENT:
+            result[child.tag] = value
+        elif isinstance(existing, list):
+            existing.append(value)
+        else:
+            result[child.tag] = [existing, value]
+    return result
+
+
+def _normalize_lists(inspection: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Force the repeated-tag sections of an inspection to always be lists.
+
+    _elem_to_dict collapses a lone <Vehicle> or <Violation> to a bare
+    dict; normalizing that to a one-element list here means the per-item
+    processing loops downstream never branch on the container shape.
+
+    Args:
+        inspection: Single inspection dictionary.
+
+    Returns:
+        The same dictionary, with Vehicles.Vehicle and
+        Violations.Violation wrapped in lists where present.
+    """
+    for section, tag in (('Vehicles', 'Vehicle'), ('Violations', 'Violation')):
+        container = inspection.get(section)
+        if isinstance(container, dict):
+            value = container.get(tag)
+            if value is not None and not isinstance(value, list):
+                container[tag] = [value]
+    return inspection
+
 
 class XMLProcessor:
     """Handles XML file parsing and data extraction for DOT inspections."""
@@ -29,24 +94,134 @@ class XMLProcessor:
             file_path_obj = Path(file_path)
             
             if not file_path_obj.exists():
-                logging.error(f"XML file not found: {file_path}")
+                logger.error("XML file not found: %s", file_path)
                 return None
             
             if file_path_obj.suffix.lower() != '.xml':
-                logging.error(f"File is not an XML file: {file_path}")
+                logger.error("File is not an XML file: %s", file_path)
                 return None
             
-            logging.info(f"Parsing XML file: {file_path}")
-            
-            with open(file_path, 'rb') as file:
-                data = xmltodict.parse(file)
-                logging.info(f"Successfully parsed XML file: {file_path}")
-                return data
-                
+            logger.info("Parsing XML file: %s", file_path)
+
+            # Memory-map the file so the parser reads through page-cache
+            # faults with OS readahead instead of buffered read() calls
+            with open(file_path, 'rb') as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        root = ET.parse(mm).getroot()
+                except ValueError:
+                    # Zero-length files cannot be mapped; parse directly
+                    f.seek(0)
+                    root = ET.parse(f).getroot()
+            data = {root.tag: _elem_to_dict(root)}
+            logger.info("Successfully parsed XML file: %s", file_path)
+            return data
+
         except Exception as e:
-            logging.error(f"Error parsing XML file {file_path}: {e}")
+            logger.error("Error parsing XML file %s: %s", file_path, e)
             return None
-    
+
+    def iter_inspections(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream inspection dictionaries from an XML file one at a time.
+
+        Unlike parse_xml_file, which materializes the whole document as
+        nested dicts, this drives the C-implemented incremental parser
+        and converts each <Inspection> element as its end tag arrives,
+        clearing finished elements off the tree. Peak memory stays at
+        one inspection regardless of file size, and no intermediate list
+        of raw dicts is ever built.
+
+        Args:
+            file_path: Path to XML file.
+
+        Yields:
+            Inspection dictionaries in document order.
+
+        Raises:
+            ET.ParseError: If the document is malformed. Anything
+                yielded before the error is a partial stream and the
+                file should be treated as failed, not processed.
+        """
+        file_path_obj = Path(file_path)
+
+        if not file_path_obj.exists():
+            logger.error("XML file not found: %s", file_path)
+            return
+
+        if file_path_obj.suffix.lower() != '.xml':
+            logger.error("File is not an XML file: %s", file_path)
+            return
+
+        logger.info("Streaming inspections from XML file: %s", file_path)
+
+        count = 0
+        root = None
+        try:
+            for event, elem in ET.iterparse(file_path, events=('start', 'end')):
+                if event == 'start':
+                    if root is None:
+                        root = elem
+                    continue
+                if elem.tag != 'Inspection':
+                    continue
+                yield _normalize_lists(_elem_to_dict(elem))
+                count += 1
+                # Free the finished inspection: clear the element and
+                # detach it from the root so the tree never accumulates
+                elem.clear()
+                if root is not None:
+                    root.clear()
+        except ET.ParseError as e:
+            # Re-raise after logging: swallowing a mid-file error would
+            # hand the caller a silently truncated stream, and the ETL
+            # would mark a corrupt file as processed. Propagating lets
+            # process_single_file route it to the error directory.
+            logger.error("Error parsing XML file %s after %s inspections: %s",
+                         file_path, count, e)
+            raise
+
+        logger.info("Streamed %s inspections from %s", count, file_path)
+
+    @classmethod
+    def parse_and_extract_many(cls, paths: Iterable[str],
+                               workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream inspections from many XML files, parsing in parallel.
+
+        Parsing is CPU-bound and independent per file, so a directory of
+        files fans out across a process pool (one interpreter per core,
+        no GIL contention) while results are yielded on the main process
+        in input order. Falls back to serial parsing when a pool cannot
+        be started.
+
+        Args:
+            paths: XML file paths to parse.
+            workers: Process count. Defaults to one per file, capped at
+                the CPU count.
+
+        Yields:
+            Inspection dictionaries from all files, in file order.
+        """
+        paths = list(paths)
+        if not paths:
+            return
+
+        if workers is None:
+            workers = min(len(paths), os.cpu_count() or 1)
+
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    for inspections in executor.map(_parse_one, paths, chunksize=4):
+                        yield from inspections
+                return
+            except (OSError, ValueError) as e:
+                logger.warning("Process pool unavailable (%s); parsing serially", e)
+
+        for file_path in paths:
+            yield from _parse_one(file_path)
+
     def extract_inspections(self, xml_data: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
         """
         Extract inspections data from parsed XML.
@@ -59,13 +234,13 @@ class XMLProcessor:
         """
         try:
             if 'Inspections' not in xml_data:
-                logging.error("No 'Inspections' root element found in XML data")
+                logger.error("No 'Inspections' root element found in XML data")
                 return None
             
             inspections_data = xml_data['Inspections']
             
             if 'Inspection' not in inspections_data:
-                logging.error("No 'Inspection' elements found in XML data")
+                logger.error("No 'Inspection' elements found in XML data")
                 return None
             
             inspections = inspections_data['Inspection']
@@ -73,12 +248,18 @@ class XMLProcessor:
             # Handle single inspection case (convert to list)
             if not isinstance(inspections, list):
                 inspections = [inspections]
-            
-            logging.info(f"Extracted {len(inspections)} inspections from XML data")
+
+            # Normalize repeated-tag sections once here so downstream
+            # loops never branch on dict-vs-list shapes
+            for inspection in inspections:
+                if isinstance(inspection, dict):
+                    _normalize_lists(inspection)
+
+            logger.info("Extracted %s inspections from XML data", len(inspections))
             return inspections
             
         except Exception as e:
-            logging.error(f"Error extracting inspections from XML data: {e}")
+            logger.error("Error extracting inspections from XML data: %s", e)
             return None
     
     def validate_inspection_structure(self, inspection: Dict[str, Any]) -> bool:
@@ -91,37 +272,47 @@ class XMLProcessor:
         Returns:
             Boolean indicating if structure is valid.
         """
-        required_sections = ['InspMain', 'Drivers', 'Vehicles']
-        
-        for section in required_sections:
-            if section not in inspection:
-                logging.warning(f"Missing required section '{section}' in inspection")
-                return False
-        
+        # Each section is fetched once and rechecked through the local
+        # binding; the old `in` + subscript pattern hashed every key twice
+        insp_main = inspection.get('InspMain')
+        if insp_main is None:
+            logger.warning("Missing required section 'InspMain' in inspection")
+            return False
+
+        drivers = inspection.get('Drivers')
+        if drivers is None:
+            logger.warning("Missing required section 'Drivers' in inspection")
+            return False
+
+        vehicles = inspection.get('Vehicles')
+        if vehicles is None:
+            logger.warning("Missing required section 'Vehicles' in inspection")
+            return False
+
         # Check InspMain structure
-        if 'inspectionId' not in inspection['InspMain']:
-            logging.warning("Missing 'inspectionId' in InspMain section")
+        if insp_main.get('inspectionId') is None:
+            logger.warning("Missing 'inspectionId' in InspMain section")
             return False
-        
-        if 'InspectionPostDate' not in inspection['InspMain']:
-            logging.warning("Missing 'InspectionPostDate' in InspMain section")
+
+        if insp_main.get('InspectionPostDate') is None:
+            logger.warning("Missing 'InspectionPostDate' in InspMain section")
             return False
-        
+
         # Check Drivers structure
-        if 'Driver' not in inspection['Drivers']:
-            logging.warning("Missing 'Driver' in Drivers section")
+        driver = drivers.get('Driver')
+        if driver is None:
+            logger.warning("Missing 'Driver' in Drivers section")
             return False
-        
-        driver = inspection['Drivers']['Driver']
-        if 'DriverLastName' not in driver or 'DriverLicenseID' not in driver:
-            logging.warning("Missing driver information (DriverLastName or DriverLicenseID)")
+
+        if driver.get('DriverLastName') is None or driver.get('DriverLicenseID') is None:
+            logger.warning("Missing driver information (DriverLastName or DriverLicenseID)")
             return False
-        
+
         # Check Vehicles structure
-        if 'Vehicle' not in inspection['Vehicles']:
-            logging.warning("Missing 'Vehicle' in Vehicles section")
+        if vehicles.get('Vehicle') is None:
+            logger.warning("Missing 'Vehicle' in Vehicles section")
             return False
-        
+
         return True
     
     def get_inspection_summary(self, xml_data: Dict[str, Any]) -> Dict[str, int]:
@@ -152,15 +343,30 @@ class XMLProcessor:
                 if self.validate_inspection_structure(inspection):
                     summary['valid_inspections'] += 1
                     
-                    # Check for violations
-                    if 'Violations' in inspection and inspection['Violations']:
+                    # Check for violations (single lookup)
+                    if inspection.get('Violations'):
                         summary['inspections_with_violations'] += 1
                 else:
                     summary['invalid_inspections'] += 1
             
-            logging.info(f"XML Summary: {summary}")
+            logger.info("XML Summary: %s", summary)
             return summary
             
         except Exception as e:
-            logging.error(f"Error generating XML summary: {e}")
-            return summary 
\ No newline at end of file
+            logger.error("Error generating XML summary: %s", e)
+            return summary 
+
+def _parse_one(file_path: str) -> List[Dict[str, Any]]:
+    """
+    Parse a single XML file to a list of inspection dictionaries.
+
+    Module-level so it is picklable for the process pool used by
+    parse_and_extract_many.
+
+    Args:
+        file_path: Path to XML file.
+
+    Returns:
+        List of inspection dictionaries (empty on parse failure).
+    """
+    return list(XMLProcessor().iter_inspections(file_path))
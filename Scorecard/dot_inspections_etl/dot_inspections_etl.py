@@ -12,6 +12,7 @@ Usage:
     python dot_inspections_etl.py --debug            # Debug mode
 """
 
+import datetime
 import logging
 import sys
 import os
@@ -50,6 +51,8 @@ logging.basicConfig(
     ]
 )
 
+logger = logging.getLogger(__name__)
+
 
 class DOTInspectionsETL:
     """Main ETL processor for DOT inspections."""
@@ -65,7 +68,9 @@ class DOTInspectionsETL:
         self.xml_processor = XMLProcessor()
         self.inspection_processor = InspectionProcessor()
         self.file_manager = FileManager(self.config)
-        
+        # One timestamp per run; every moved file shares this suffix
+        self.run_timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+
     def process_single_file(self, file_path: str) -> Dict[str, int]:
         """
         Process a single XML file.
@@ -88,76 +93,83 @@ class DOTInspectionsETL:
         try:
             # Validate file
             if not self.file_manager.validate_file_path(file_path):
-                logging.error(f"Invalid file path: {file_path}")
+                logger.error("Invalid file path: %s", file_path)
                 results['errors'] = 1
                 return results
             
             # Get file info
             file_info = self.file_manager.get_file_info(file_path)
-            logging.info(f"Processing file: {file_info['filename']} ({file_info['size_mb']} MB)")
+            logger.info("Processing file: %s (%s MB)", file_info['filename'], file_info['size_mb'])
             
-            # Parse XML
-            xml_data = self.xml_processor.parse_xml_file(file_path)
-            if not xml_data:
-                error_msg = f"Failed to parse XML file: {file_path}"
-                logging.error(error_msg)
-                self.file_manager.move_error_file(file_path, error_msg)
-                results['errors'] = 1
-                return results
-            
-            # Extract inspections
-            inspections = self.xml_processor.extract_inspections(xml_data)
-            if not inspections:
+            # Stream inspections straight from the parser: each record is
+            # extracted as its XML element closes, so the whole file is
+            # never held in memory as a dict tree
+            seen = 0
+
+            def _counted_inspections():
+                nonlocal seen
+                for inspection in self.xml_processor.iter_inspections(file_path):
+                    seen += 1
+                    yield inspection
+
+            processed_inspections = self.inspection_processor.process_inspections_batch(
+                _counted_inspections()
+            )
+            results['total_inspections'] = seen
+
+            if seen == 0:
                 error_msg = f"No inspections found in XML file: {file_path}"
-                logging.error(error_msg)
-                self.file_manager.move_error_file(file_path, error_msg)
+                logger.error(error_msg)
+                self.file_manager.move_error_file(file_path, error_msg, timestamp=self.run_timestamp)
                 results['errors'] = 1
                 return results
-            
-            results['total_inspections'] = len(inspections)
-            logging.info(f"Found {len(inspections)} inspections in XML file")
-            
+
+            logger.info("Found %s inspections in XML file", seen)
+
             # Process with database
             with DOTDatabaseManager(self.config) as db_manager:
                 if not db_manager.connection:
                     error_msg = "Failed to connect to database"
-                    logging.error(error_msg)
+                    logger.error(error_msg)
                     results['errors'] = 1
                     return results
-                
-                # Get existing inspections
-                existing_inspections = db_manager.get_existing_inspections()
-                
-                # Process inspections
-                processed_inspections = self.inspection_processor.process_inspections_batch(inspections)
+
                 results['processed_inspections'] = len(processed_inspections)
-                
+
+                # Check only this batch's IDs against the table instead of
+                # pulling every existing inspection ID over the wire
+                candidate_ids = [i['inspection_id'] for i in processed_inspections]
+                existing_inspections = db_manager.existing_inspection_ids(candidate_ids)
+
+                # Resolve every driver ID for the batch with one query
+                # instead of a round trip per inspection
+                licenses = [i['license_number'] for i in processed_inspections]
+                driver_map = db_manager.load_driver_map(licenses)
+
                 # Insert into database
                 for inspection_data in processed_inspections:
                     inspection_id = inspection_data['inspection_id']
                     
                     # Skip if already exists
                     if inspection_id in existing_inspections:
-                        logging.debug(f"Skipping existing inspection: {inspection_id}")
+                        logger.debug("Skipping existing inspection: %s", inspection_id)
                         results['skipped_existing'] += 1
                         continue
                     
-                    # Get driver ID
-                    driver_id = db_manager.get_driver_id(inspection_data['license_number'])
+                    # Get driver ID from the preloaded map
+                    driver_id = driver_map.get(inspection_data['license_number'])
                     if not driver_id:
-                        logging.warning(f"Driver not found for license: {inspection_data['license_number']}")
+                        logger.warning("Driver not found for license: %s", inspection_data['license_number'])
                         results['driver_not_found'] += 1
                         continue
                     
                     # Add driver_id to inspection data
                     inspection_data['driver_id'] = driver_id
-                    
-                    # Validate before insertion
-                    if not self.inspection_processor.validate_processed_inspection(inspection_data):
-                        logging.warning(f"Invalid inspection data for ID: {inspection_id}")
-                        results['errors'] += 1
-                        continue
-                    
+
+                    # No re-validation here: the batch processor already
+                    # guarantees a positive integer ID, a well-formed post
+                    # date and non-empty driver fields for every record
+
                     # Insert into database
                     if db_manager.insert_inspection(inspection_data):
                         results['inserted_successfully'] += 1
@@ -171,16 +183,16 @@ class DOTInspectionsETL:
             
             # Move processed file
             if results['inserted_successfully'] > 0:
-                self.file_manager.move_processed_file(file_path)
+                self.file_manager.move_processed_file(file_path, timestamp=self.run_timestamp)
             elif results['errors'] > 0:
-                self.file_manager.move_error_file(file_path, f"Processing completed with {results['errors']} errors")
+                self.file_manager.move_error_file(file_path, f"Processing completed with {results['errors']} errors", timestamp=self.run_timestamp)
             
             return results
             
         except Exception as e:
             error_msg = f"Unexpected error processing file {file_path}: {str(e)}"
-            logging.error(error_msg)
-            self.file_manager.move_error_file(file_path, error_msg)
+            logger.error(error_msg)
+            self.file_manager.move_error_file(file_path, error_msg, timestamp=self.run_timestamp)
             results['errors'] = 1
             return results
     
@@ -207,14 +219,14 @@ class DOTInspectionsETL:
             xml_files = self.file_manager.find_xml_files(directory)
             
             if not xml_files:
-                logging.warning(f"No XML files found in directory: {directory}")
+                logger.warning("No XML files found in directory: %s", directory)
                 return overall_results
             
-            logging.info(f"Found {len(xml_files)} XML files to process")
+            logger.info("Found %s XML files to process", len(xml_files))
             
             # Process each file
             for i, file_path in enumerate(xml_files, 1):
-                logging.info(f"\n--- Processing file {i}/{len(xml_files)}: {Path(file_path).name} ---")
+                logger.info("\n--- Processing file %s/%s: %s ---", i, len(xml_files), Path(file_path).name)
                 
                 results = self.process_single_file(file_path)
                 
@@ -229,20 +241,20 @@ class DOTInspectionsETL:
                 overall_results['total_errors'] += results['errors']
                 
                 # Log file results
-                logging.info(f"File {i} results: {results}")
+                logger.info("File %s results: %s", i, results)
             
             # Log overall results
-            logging.info(f"\n=== Overall Processing Results ===")
-            logging.info(f"Files processed successfully: {overall_results['files_processed']}")
-            logging.info(f"Files failed: {overall_results['files_failed']}")
-            logging.info(f"Total inspections found: {overall_results['total_inspections']}")
-            logging.info(f"Total inspections inserted: {overall_results['total_inserted']}")
-            logging.info(f"Total errors: {overall_results['total_errors']}")
+            logger.info("\n=== Overall Processing Results ===")
+            logger.info("Files processed successfully: %s", overall_results['files_processed'])
+            logger.info("Files failed: %s", overall_results['files_failed'])
+            logger.info("Total inspections found: %s", overall_results['total_inspections'])
+            logger.info("Total inspections inserted: %s", overall_results['total_inserted'])
+            logger.info("Total errors: %s", overall_results['total_errors'])
             
             return overall_results
             
         except Exception as e:
-            logging.error(f"Error processing directory {directory}: {e}")
+            logger.error("Error processing directory %s: %s", directory, e)
             overall_results['files_failed'] = 1
             overall_results['total_errors'] = 1
             return overall_results
@@ -347,45 +359,45 @@ def interactive_mode() -> None:
 def debug_mode() -> None:
     """Run in debug mode for testing components."""
     logging.getLogger().setLevel(logging.DEBUG)
-    logging.info("Running in DEBUG mode")
+    logger.info("Running in DEBUG mode")
     
     try:
         etl = DOTInspectionsETL()
         
         # Test database connection
-        logging.debug("Testing database connection...")
+        logger.debug("Testing database connection...")
         with DOTDatabaseManager(etl.config) as db_manager:
             if db_manager.connection:
-                logging.debug("Database connection successful")
+                logger.debug("Database connection successful")
                 
                 # Test getting existing inspections
                 existing = db_manager.get_existing_inspections()
-                logging.debug(f"Found {len(existing)} existing inspections")
+                logger.debug("Found %s existing inspections", len(existing))
             else:
-                logging.error("Database connection failed")
+                logger.error("Database connection failed")
                 return
         
         # Test file manager
-        logging.debug("Testing file manager...")
+        logger.debug("Testing file manager...")
         xml_files = etl.file_manager.find_xml_files()
-        logging.debug(f"Found {len(xml_files)} XML files in default directory")
+        logger.debug("Found %s XML files in default directory", len(xml_files))
         
         # Test XML processor with first file if available
         if xml_files:
             first_file = xml_files[0]
-            logging.debug(f"Testing XML parsing with: {Path(first_file).name}")
+            logger.debug("Testing XML parsing with: %s", Path(first_file).name)
             
             xml_data = etl.xml_processor.parse_xml_file(first_file)
             if xml_data:
                 summary = etl.xml_processor.get_inspection_summary(xml_data)
-                logging.debug(f"XML file summary: {summary}")
+                logger.debug("XML file summary: %s", summary)
             else:
-                logging.error("Failed to parse XML file")
+                logger.error("Failed to parse XML file")
         
-        logging.info("Debug tests completed successfully")
+        logger.info("Debug tests completed successfully")
         
     except Exception as e:
-        logging.error(f"Debug mode error: {e}")
+        logger.error("Debug mode error: %s", e)
 
 
 def main() -> int: